@@ -1,4 +1,5 @@
 from django.contrib import admin
+from django.utils import timezone
 from . import models
 
 
@@ -12,22 +13,25 @@ class MoodCheckInAdmin(admin.ModelAdmin):
 
 @admin.register(models.HealthFacility)
 class HealthFacilityAdmin(admin.ModelAdmin):
-	list_display = ("name", "facility_type", "upazila", "union", "contact")
+	list_display = ("name", "facility_type", "upazila", "union", "contact", "latitude", "longitude")
 	list_filter = ("facility_type", "upazila")
 	search_fields = ("name", "address")
 
 
 @admin.register(models.AnonymousHelpRequest)
 class AnonymousHelpRequestAdmin(admin.ModelAdmin):
-	list_display = ("id", "help_type", "created_at", "is_resolved")
+	list_display = ("id", "help_type", "union_area", "created_at", "is_resolved", "resolved_at")
 	list_filter = ("help_type", "is_resolved")
 	search_fields = ("description", "contact_preference")
-	readonly_fields = ("created_at",)
+	readonly_fields = ("created_at", "resolved_at")
 
 	actions = ["mark_resolved"]
 
 	def mark_resolved(self, request, queryset):
-		queryset.update(is_resolved=True)
+		# Saved one by one so the rollups see each resolution (see main.signals)
+		for help_request in queryset.filter(is_resolved=False):
+			help_request.is_resolved = True
+			help_request.save(update_fields=["is_resolved", "resolved_at"])
 
 	mark_resolved.short_description = "Mark selected requests as resolved"
 
@@ -72,9 +76,101 @@ class HealthWorkerAdmin(admin.ModelAdmin):
 	list_filter = ("is_verified",)
 
 
-@admin.register(models.OpenRouterChat)
-class OpenRouterChatAdmin(admin.ModelAdmin):
-	list_display = ("id", "created_at")
-	readonly_fields = ("messages", "created_at")
-	search_fields = ("messages",)
+class ChatMessageInline(admin.TabularInline):
+	model = models.ChatMessage
+	fields = ("role", "content", "sentiment", "created_at")
+	readonly_fields = ("role", "content", "sentiment", "created_at")
+	extra = 0
 
+
+@admin.register(models.Conversation)
+class ConversationAdmin(admin.ModelAdmin):
+	list_display = ("id", "channel", "created_at")
+	list_filter = ("channel",)
+	inlines = [ChatMessageInline]
+
+
+@admin.register(models.ChatMessage)
+class ChatMessageAdmin(admin.ModelAdmin):
+	list_display = ("id", "conversation", "role", "sentiment", "created_at")
+	list_filter = ("role", "sentiment")
+	search_fields = ("content",)
+	readonly_fields = ("conversation", "role", "content", "created_at")
+
+
+
+@admin.register(models.HealthTip)
+class HealthTipAdmin(admin.ModelAdmin):
+	list_display = ("title", "language", "season", "created_at")
+	list_filter = ("language", "season")
+	search_fields = ("title", "content")
+
+
+@admin.register(models.SymptomGuideEntry)
+class SymptomGuideEntryAdmin(admin.ModelAdmin):
+	list_display = ("name", "category", "warning_level", "language")
+	list_filter = ("category", "warning_level", "language")
+	search_fields = ("name", "description")
+
+
+@admin.register(models.Hospital)
+class HospitalAdmin(admin.ModelAdmin):
+	list_display = ("name", "phone", "latitude", "longitude")
+	search_fields = ("name", "address")
+
+
+class AreaAliasInline(admin.TabularInline):
+	model = models.AreaAlias
+	extra = 1
+	fields = ("alias",)
+
+
+@admin.register(models.Division)
+class DivisionAdmin(admin.ModelAdmin):
+	list_display = ("name", "name_bn")
+	search_fields = ("name", "name_bn")
+
+
+@admin.register(models.District)
+class DistrictAdmin(admin.ModelAdmin):
+	list_display = ("name", "name_bn", "division")
+	list_filter = ("division",)
+	search_fields = ("name", "name_bn")
+
+
+@admin.register(models.Upazila)
+class UpazilaAdmin(admin.ModelAdmin):
+	list_display = ("name", "name_bn", "district")
+	list_filter = ("district__division",)
+	search_fields = ("name", "name_bn", "aliases__alias")
+	inlines = [AreaAliasInline]
+
+
+@admin.register(models.Union)
+class UnionAdmin(admin.ModelAdmin):
+	list_display = ("name", "name_bn", "upazila")
+	search_fields = ("name", "name_bn", "aliases__alias")
+	autocomplete_fields = ("upazila",)
+	inlines = [AreaAliasInline]
+
+
+@admin.register(models.OutboxEmail)
+class OutboxEmailAdmin(admin.ModelAdmin):
+	list_display = ("id", "subject", "priority", "status", "attempts", "next_attempt_at", "sent_at")
+	list_filter = ("status", "priority")
+	readonly_fields = ("created_at", "sent_at", "claimed_at", "last_error")
+
+	actions = ["retry_now"]
+
+	def retry_now(self, request, queryset):
+		queryset.exclude(status="sent").update(status="pending", next_attempt_at=timezone.now(), attempts=0)
+
+	retry_now.short_description = "Retry selected emails now"
+
+
+@admin.register(models.ChatJob)
+class ChatJobAdmin(admin.ModelAdmin):
+	list_display = ("id", "conversation", "status", "attempts", "created_at", "finished_at")
+	list_filter = ("status",)
+	readonly_fields = ("idempotency_key", "created_at", "finished_at", "claimed_at", "last_error", "user_message", "reply")
+	raw_id_fields = ("conversation",)
@@ -0,0 +1,241 @@
+"""Response cache in front of the LLM calls.
+
+Canned intents (health tips, help, hospital lookups) send the same prompts
+for every user, so answers are cached on the normalized prompt, language,
+context and model. Lookups go through two tiers:
+
+1. a small in-process LRU with per-entry expiry, answering repeat prompts
+   without any I/O, and
+2. the shared Django cache named by ``AI_CACHE_ALIAS`` so every worker
+   process reuses answers produced by the others.
+
+TTLs are per context (``AI_CACHE_TTLS``) and the LRU is bounded by
+``AI_CACHE_LOCAL_MAX_ENTRIES``. Stored keys carry a generation number (a
+named version, see main/versions.py); :meth:`AIResponseCache.clear` bumps
+it, so old answers stop matching in every process and expire on their own
+without touching anything else in the shared cache. Each process rechecks
+the generation every ``SNAPSHOT_RECHECK_SECONDS``.
+
+Hit/miss counters are tallied in process and added to the shared cache
+every ``AI_CACHE_STATS_FLUSH_SECONDS``, so a local hit costs no I/O;
+``python manage.py ai_cache`` prints them.
+"""
+
+import hashlib
+import re
+import threading
+import time
+from collections import Counter, OrderedDict
+
+from django.conf import settings
+from django.core.cache import caches
+
+from .versions import aget_version, bump_version, get_version
+
+KEY_PREFIX = "ai-response"
+GENERATION = "ai-response"
+STATS_KEYS = ("local_hits", "shared_hits", "misses")
+
+DEFAULT_TTLS = {
+    "health": 6 * 60 * 60,
+    "general": 24 * 60 * 60,
+    "chat": 60 * 60,
+    "voice": 60 * 60,
+}
+
+_whitespace = re.compile(r"\s+")
+# Trailing punctuation (including the Bangla dari) does not change the answer
+_trailing_punctuation = re.compile(r"[\s?!.,;:।]+$")
+
+
+def normalize_prompt(prompt):
+    """Collapse case, whitespace and trailing punctuation so trivial variants share a key"""
+    prompt = _whitespace.sub(" ", (prompt or "").strip().casefold())
+    return _trailing_punctuation.sub("", prompt)
+
+
+def make_key(prompt, language, context, model=""):
+    raw = "\x1f".join((normalize_prompt(prompt), language or "", context or "", model or ""))
+    return f"{KEY_PREFIX}:{hashlib.sha256(raw.encode('utf-8')).hexdigest()}"
+
+
+class LocalLRU:
+    """Thread-safe, size-bounded LRU whose entries expire individually"""
+
+    def __init__(self, max_entries):
+        self.max_entries = max_entries
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            value, expires_at = item
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl):
+        with self._lock:
+            self._data[key] = (value, time.monotonic() + ttl)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+
+class AIResponseCache:
+    def __init__(self):
+        self.local = LocalLRU(getattr(settings, "AI_CACHE_LOCAL_MAX_ENTRIES", 512))
+        self._lock = threading.Lock()
+        self._counts = Counter()
+        self._flushed_at = time.monotonic()
+        self._generation = None
+        self._generation_checked_at = 0.0
+
+    @property
+    def enabled(self):
+        return getattr(settings, "AI_CACHE_ENABLED", True)
+
+    @property
+    def shared(self):
+        return caches[getattr(settings, "AI_CACHE_ALIAS", "default")]
+
+    def ttl_for(self, context):
+        ttls = {**DEFAULT_TTLS, **getattr(settings, "AI_CACHE_TTLS", {})}
+        return ttls.get(context, ttls["health"])
+
+    def _generation_due(self):
+        recheck = getattr(settings, "SNAPSHOT_RECHECK_SECONDS", 30)
+        return self._generation is None or time.monotonic() - self._generation_checked_at >= recheck
+
+    def _set_generation(self, generation):
+        self._generation, self._generation_checked_at = generation, time.monotonic()
+
+    def _key(self, prompt, language, context, model):
+        if self._generation_due():
+            self._set_generation(get_version(GENERATION))
+        return f"{make_key(prompt, language, context, model)}:g{self._generation}"
+
+    async def _akey(self, prompt, language, context, model):
+        if self._generation_due():
+            self._set_generation(await aget_version(GENERATION))
+        return f"{make_key(prompt, language, context, model)}:g{self._generation}"
+
+    def get(self, prompt, language, context, model=""):
+        if not self.enabled:
+            return None
+        key = self._key(prompt, language, context, model)
+        value = self.local.get(key)
+        if value is not None:
+            self._count("local_hits")
+            return value
+        value = self.shared.get(key)
+        if value is not None:
+            self.local.set(key, value, self.ttl_for(context))
+            self._count("shared_hits")
+            return value
+        self._count("misses")
+        return None
+
+    def set(self, prompt, language, context, value, model=""):
+        if not self.enabled or not value:
+            return
+        key = self._key(prompt, language, context, model)
+        ttl = self.ttl_for(context)
+        self.local.set(key, value, ttl)
+        self.shared.set(key, value, ttl)
+
+    async def aget(self, prompt, language, context, model=""):
+        if not self.enabled:
+            return None
+        key = await self._akey(prompt, language, context, model)
+        value = self.local.get(key)
+        if value is not None:
+            await self._acount("local_hits")
+            return value
+        value = await self.shared.aget(key)
+        if value is not None:
+            self.local.set(key, value, self.ttl_for(context))
+            await self._acount("shared_hits")
+            return value
+        await self._acount("misses")
+        return None
+
+    async def aset(self, prompt, language, context, value, model=""):
+        if not self.enabled or not value:
+            return
+        key = await self._akey(prompt, language, context, model)
+        ttl = self.ttl_for(context)
+        self.local.set(key, value, ttl)
+        await self.shared.aset(key, value, ttl)
+
+    def _tally(self, name):
+        """Count in process; True when the tallies are due to be added to the shared cache"""
+        with self._lock:
+            self._counts[name] += 1
+            return time.monotonic() - self._flushed_at >= getattr(settings, "AI_CACHE_STATS_FLUSH_SECONDS", 30)
+
+    def _take_counts(self):
+        with self._lock:
+            counts, self._counts = self._counts, Counter()
+            self._flushed_at = time.monotonic()
+        return counts
+
+    def _count(self, name):
+        if self._tally(name):
+            self.flush_stats()
+
+    async def _acount(self, name):
+        if self._tally(name):
+            await self.aflush_stats()
+
+    def flush_stats(self):
+        for name, count in self._take_counts().items():
+            key = f"{KEY_PREFIX}:stats:{name}"
+            try:
+                self.shared.add(key, 0, timeout=None)
+                self.shared.incr(key, count)
+            except ValueError:
+                # Evicted between add() and incr(); losing one batch of counts is fine
+                pass
+
+    async def aflush_stats(self):
+        for name, count in self._take_counts().items():
+            key = f"{KEY_PREFIX}:stats:{name}"
+            try:
+                await self.shared.aadd(key, 0, timeout=None)
+                await self.shared.aincr(key, count)
+            except ValueError:
+                pass
+
+    def stats(self):
+        self.flush_stats()
+        values = self.shared.get_many([f"{KEY_PREFIX}:stats:{name}" for name in STATS_KEYS])
+        stats = {name: values.get(f"{KEY_PREFIX}:stats:{name}", 0) for name in STATS_KEYS}
+        lookups = sum(stats.values())
+        stats["hit_rate"] = (stats["local_hits"] + stats["shared_hits"]) / lookups if lookups else 0.0
+        stats["local_entries"] = len(self.local)
+        return stats
+
+    def clear(self):
+        """Retire every cached answer, leaving the rest of the shared cache alone"""
+        self._set_generation(bump_version(GENERATION))
+        self.local.clear()
+
+    def reset_stats(self):
+        self._take_counts()
+        self.shared.delete_many([f"{KEY_PREFIX}:stats:{name}" for name in STATS_KEYS])
+
+
+response_cache = AIResponseCache()
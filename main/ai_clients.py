@@ -0,0 +1,139 @@
+"""Process-wide, pooled clients for the AI providers.
+
+Building ``openai.OpenAI`` or ``genai.Client`` per request means a fresh
+connection pool and TLS handshake for every call. The helpers here keep one
+client per process (and, for async clients, one per event loop) with HTTP
+keep-alive enabled, so consecutive calls reuse warm connections.
+
+Clients are dropped after ``fork()`` so pre-forking servers never share
+sockets between the parent and its workers.
+
+Tuning lives in settings:
+
+* ``AI_HTTP_POOL_SIZE`` – max open connections per client
+* ``AI_HTTP_KEEPALIVE`` – max idle keep-alive connections per client
+* ``AI_HTTP_TIMEOUT`` – overall request timeout in seconds
+* ``AI_HTTP_CONNECT_TIMEOUT`` – connect timeout in seconds
+* ``AI_HTTP_MAX_RETRIES`` – retries performed by the OpenAI client
+"""
+
+import asyncio
+import os
+import threading
+import weakref
+
+import httpx
+from django.conf import settings
+
+_lock = threading.Lock()
+_sync_clients = {}
+_async_clients = weakref.WeakKeyDictionary()
+
+
+def _reset_after_fork():
+    global _lock, _async_clients
+    _lock = threading.Lock()
+    _sync_clients.clear()
+    _async_clients = weakref.WeakKeyDictionary()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def _limits():
+    pool_size = getattr(settings, "AI_HTTP_POOL_SIZE", 20)
+    return httpx.Limits(
+        max_connections=pool_size,
+        max_keepalive_connections=getattr(settings, "AI_HTTP_KEEPALIVE", pool_size),
+        keepalive_expiry=60,
+    )
+
+
+def _openai_kwargs():
+    import openai
+
+    return {
+        "api_key": settings.OPENAI_API_KEY,
+        "max_retries": getattr(settings, "AI_HTTP_MAX_RETRIES", 1),
+        "timeout": openai.Timeout(
+            getattr(settings, "AI_HTTP_TIMEOUT", 30.0),
+            connect=getattr(settings, "AI_HTTP_CONNECT_TIMEOUT", 5.0),
+        ),
+    }
+
+
+def _build_openai():
+    import openai
+
+    return openai.OpenAI(
+        http_client=openai.DefaultHttpxClient(limits=_limits()),
+        **_openai_kwargs(),
+    )
+
+
+def _build_async_openai():
+    import openai
+
+    return openai.AsyncOpenAI(
+        http_client=openai.DefaultAsyncHttpxClient(limits=_limits()),
+        **_openai_kwargs(),
+    )
+
+
+def _build_genai():
+    from google import genai  # type: ignore
+    from google.genai import types  # type: ignore
+
+    client_args = {"limits": _limits()}
+    return genai.Client(
+        api_key=settings.OPENAI_API_KEY,
+        http_options=types.HttpOptions(
+            # genai expects milliseconds
+            timeout=int(getattr(settings, "AI_HTTP_TIMEOUT", 30.0) * 1000),
+            client_args=client_args,
+            async_client_args=client_args,
+        ),
+    )
+
+
+def _get_sync(name, factory):
+    client = _sync_clients.get(name)
+    if client is None:
+        with _lock:
+            client = _sync_clients.get(name)
+            if client is None:
+                client = _sync_clients[name] = factory()
+    return client
+
+
+def _get_async(name, factory):
+    # httpx async pools are bound to the loop they were first used on, so
+    # keep one client per running loop (one per process under uvicorn).
+    loop = asyncio.get_running_loop()
+    with _lock:
+        clients = _async_clients.setdefault(loop, {})
+        client = clients.get(name)
+        if client is None:
+            client = clients[name] = factory()
+    return client
+
+
+def get_openai_client():
+    """Shared ``openai.OpenAI`` client for this process."""
+    return _get_sync("openai", _build_openai)
+
+
+def get_async_openai_client():
+    """Shared ``openai.AsyncOpenAI`` client for the running event loop."""
+    return _get_async("openai", _build_async_openai)
+
+
+def get_genai_client():
+    """Shared ``genai.Client`` for sync calls in this process."""
+    return _get_sync("genai", _build_genai)
+
+
+def get_async_genai_client():
+    """Shared ``genai.Client`` for ``client.aio`` calls on the running event loop."""
+    return _get_async("genai", _build_genai)
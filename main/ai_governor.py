@@ -0,0 +1,242 @@
+"""Concurrency cap, deadlines and circuit breakers for every outbound AI call.
+
+Each provider ("openai", "genai") gets a :class:`Breaker`. Calls go
+through :func:`call` (sync) or :func:`acall` (async), which:
+
+* fail at once with :class:`AIUnavailable` while the provider's breaker
+  is open, so callers serve their canned fallback without waiting;
+* wait at most ``AI_QUEUE_TIMEOUT`` seconds for one of
+  ``AI_MAX_IN_FLIGHT`` slots, and shed the call if none frees up;
+* give the call ``AI_CALL_DEADLINE`` seconds, unless the caller passes its
+  own deadline. A streamed call (:func:`astream`) gets that long for each
+  chunk instead, so a long answer that keeps coming is not cut off.
+
+After ``AI_BREAKER_FAILURES`` consecutive failures or timeouts the breaker
+opens for ``AI_BREAKER_COOLDOWN`` seconds. Then one trial call is let
+through (half-open): success closes the breaker, failure reopens it.
+
+State is per process, like the pooled clients in ``main.ai_clients``.
+:func:`metrics` reports it, and ``/api/ai/metrics/`` serves it as JSON.
+"""
+
+import asyncio
+import os
+import threading
+import time
+import weakref
+from collections import Counter
+
+from django.conf import settings
+
+
+class AIUnavailable(Exception):
+    """The call was not made: breaker open or no free slot"""
+
+
+def _setting(name, default):
+    return getattr(settings, f"AI_{name}", default)
+
+
+class Breaker:
+    def __init__(self, name):
+        self.name = name
+        self._lock = threading.Lock()
+        self.state = "closed"
+        self.consecutive_failures = 0
+        self.opened_at = None
+        self.in_flight = 0
+        self._trial_running = False
+        self.counters = Counter()
+
+    def allow(self):
+        """Whether a call may start now; the caller must then report exactly one outcome"""
+        with self._lock:
+            if self.state == "open":
+                if time.monotonic() - self.opened_at < _setting("BREAKER_COOLDOWN", 30.0):
+                    self.counters["rejected"] += 1
+                    return False
+                self.state = "half_open"
+            if self.state == "half_open":
+                if self._trial_running:
+                    self.counters["rejected"] += 1
+                    return False
+                self._trial_running = True
+            self.in_flight += 1
+            self.counters["calls"] += 1
+            return True
+
+    def record_success(self):
+        with self._lock:
+            self.in_flight -= 1
+            self.counters["successes"] += 1
+            self.consecutive_failures = 0
+            self._trial_running = False
+            self.state = "closed"
+
+    def record_failure(self, kind="failures"):
+        with self._lock:
+            self.in_flight -= 1
+            self.counters[kind] += 1
+            self.consecutive_failures += 1
+            if self.state == "half_open" or self.consecutive_failures >= _setting("BREAKER_FAILURES", 5):
+                if self.state != "open":
+                    self.counters["trips"] += 1
+                self.state = "open"
+                self.opened_at = time.monotonic()
+            self._trial_running = False
+
+    def record_unfinished(self, kind):
+        """The call neither succeeded nor failed upstream: it found no free slot, or its caller gave up"""
+        with self._lock:
+            self.in_flight -= 1
+            self.counters[kind] += 1
+            self._trial_running = False
+
+    def snapshot(self):
+        with self._lock:
+            open_for = time.monotonic() - self.opened_at if self.state == "open" else None
+            return {
+                "state": self.state,
+                "consecutive_failures": self.consecutive_failures,
+                "in_flight": self.in_flight,
+                "open_for_seconds": round(open_for, 1) if open_for is not None else None,
+                **self.counters,
+            }
+
+
+_lock = threading.Lock()
+_breakers = {}
+_sync_slots = None
+_async_slots = weakref.WeakKeyDictionary()
+
+
+def _reset_after_fork():
+    global _lock, _sync_slots, _async_slots
+    _lock = threading.Lock()
+    _breakers.clear()
+    _sync_slots = None
+    _async_slots = weakref.WeakKeyDictionary()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def breaker(name):
+    with _lock:
+        if name not in _breakers:
+            _breakers[name] = Breaker(name)
+        return _breakers[name]
+
+
+def _sync_semaphore():
+    global _sync_slots
+    with _lock:
+        if _sync_slots is None:
+            _sync_slots = threading.BoundedSemaphore(_setting("MAX_IN_FLIGHT", 8))
+        return _sync_slots
+
+
+def _async_semaphore():
+    # asyncio primitives belong to one loop, so keep a semaphore per running loop
+    loop = asyncio.get_running_loop()
+    with _lock:
+        if loop not in _async_slots:
+            _async_slots[loop] = asyncio.Semaphore(_setting("MAX_IN_FLIGHT", 8))
+        return _async_slots[loop]
+
+
+def _is_timeout(error):
+    return isinstance(error, (TimeoutError, asyncio.TimeoutError)) or "Timeout" in type(error).__name__
+
+
+def call(provider, fn, deadline=None):
+    """Run ``fn(timeout)`` under ``provider``'s breaker; ``fn`` must pass the timeout on to its client"""
+    state = breaker(provider)
+    if not state.allow():
+        raise AIUnavailable(f"{provider} circuit open")
+    slots = _sync_semaphore()
+    if not slots.acquire(timeout=_setting("QUEUE_TIMEOUT", 2.0)):
+        state.record_unfinished("shed")
+        raise AIUnavailable(f"{provider} at max in-flight calls")
+    try:
+        result = fn(deadline or _setting("CALL_DEADLINE", 15.0))
+    except Exception as error:
+        state.record_failure("timeouts" if _is_timeout(error) else "failures")
+        raise
+    finally:
+        slots.release()
+    state.record_success()
+    return result
+
+
+async def acall(provider, coro_fn, deadline=None):
+    """Await ``coro_fn()`` under ``provider``'s breaker, cancelling it at the deadline"""
+    state = breaker(provider)
+    if not state.allow():
+        raise AIUnavailable(f"{provider} circuit open")
+    slots = _async_semaphore()
+    try:
+        await asyncio.wait_for(slots.acquire(), _setting("QUEUE_TIMEOUT", 2.0))
+    except asyncio.TimeoutError:
+        state.record_unfinished("shed")
+        raise AIUnavailable(f"{provider} at max in-flight calls") from None
+    try:
+        result = await asyncio.wait_for(coro_fn(), deadline or _setting("CALL_DEADLINE", 15.0))
+    except Exception as error:
+        state.record_failure("timeouts" if _is_timeout(error) else "failures")
+        raise
+    finally:
+        slots.release()
+    state.record_success()
+    return result
+
+
+async def astream(provider, open_fn, deadline=None):
+    """Yield the chunks of the stream ``await open_fn()`` returns, under ``provider``'s breaker"""
+    state = breaker(provider)
+    if not state.allow():
+        raise AIUnavailable(f"{provider} circuit open")
+    slots = _async_semaphore()
+    try:
+        await asyncio.wait_for(slots.acquire(), _setting("QUEUE_TIMEOUT", 2.0))
+    except asyncio.TimeoutError:
+        state.record_unfinished("shed")
+        raise AIUnavailable(f"{provider} at max in-flight calls") from None
+    deadline = deadline or _setting("CALL_DEADLINE", 15.0)
+    stream = None
+    outcome = "abandoned"
+    try:
+        stream = await asyncio.wait_for(open_fn(), deadline)
+        chunks = aiter(stream)
+        while True:
+            try:
+                chunk = await asyncio.wait_for(anext(chunks), deadline)
+            except StopAsyncIteration:
+                break
+            yield chunk
+        outcome = "successes"
+    except Exception as error:
+        outcome = "timeouts" if _is_timeout(error) else "failures"
+        raise
+    finally:
+        # Anything else (GeneratorExit, CancelledError) means our caller stopped reading, not a provider fault
+        slots.release()
+        if outcome == "successes":
+            state.record_success()
+        elif outcome == "abandoned":
+            state.record_unfinished(outcome)
+        else:
+            state.record_failure(outcome)
+        close = getattr(stream, "aclose", None) or getattr(stream, "close", None)
+        if close is not None and outcome != "successes":
+            try:
+                await close()
+            except Exception:
+                pass
+
+
+def metrics():
+    with _lock:
+        breakers = list(_breakers.values())
+    return {"pid": os.getpid(), "providers": {state.name: state.snapshot() for state in breakers}}
@@ -1,36 +1,125 @@
-import openai
 import os
 from django.conf import settings
 import requests
 import json
+from . import ai_governor
+from .ai_clients import get_async_openai_client, get_openai_client
+from .ai_cache import make_key, response_cache
+from .single_flight import llm_flights
+
+CHAT_MODEL = "gpt-3.5-turbo"
+SENTIMENT_MODEL = "gpt-3.5-turbo"
+
+# Per-call deadlines (seconds) that differ from AI_CALL_DEADLINE; see ai_governor
+SENTIMENT_DEADLINE = 8
+BATCH_DEADLINE = 60
 
 class AIService:
     def __init__(self):
         self.api_key = settings.OPENAI_API_KEY
-        self.client = openai.OpenAI(api_key=self.api_key)
     
-    def get_ai_response(self, user_message, language='bn', context='health'):
+    @property
+    def client(self):
+        # Shared, connection-pooled client (see ai_clients)
+        return get_openai_client()
+    
+    @property
+    def async_client(self):
+        return get_async_openai_client()
+    
+    def get_ai_response(self, user_message, language='bn', context='health', use_cache=True):
         """Get AI response based on user message and language"""
+        cached = response_cache.get(user_message, language, context, CHAT_MODEL) if use_cache else None
+        if cached:
+            return cached
+        
         try:
-            # System prompt based on language and context
-            system_prompt = self._get_system_prompt(language, context)
-            
-            response = self.client.chat.completions.create(
-                model="gpt-3.5-turbo",
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_message}
-                ],
-                max_tokens=500,
-                temperature=0.7
+            # Identical prompts already in flight share that call (see single_flight)
+            return llm_flights.do(
+                make_key(user_message, language, context, CHAT_MODEL),
+                lambda: self._fetch_reply(user_message, language, context),
             )
             
-            return response.choices[0].message.content.strip()
+        except Exception as e:
+            print(f"AI Service Error: {e}")
+            return self._get_fallback_response(language)
+    
+    async def aget_ai_response(self, user_message, language='bn', context='health'):
+        """Async variant of get_ai_response for use from async views"""
+        cached = await response_cache.aget(user_message, language, context, CHAT_MODEL)
+        if cached:
+            return cached
+        
+        try:
+            return await llm_flights.ado(
+                make_key(user_message, language, context, CHAT_MODEL),
+                lambda: self._afetch_reply(user_message, language, context),
+            )
             
         except Exception as e:
             print(f"AI Service Error: {e}")
             return self._get_fallback_response(language)
     
+    async def astream_ai_response(self, user_message, language='bn', context='health'):
+        """Yield the reply in pieces as the model produces it; yields the fallback text if the call fails"""
+        cached = await response_cache.aget(user_message, language, context, CHAT_MODEL)
+        if cached:
+            yield cached
+            return
+        
+        async def open_stream():
+            return await self.async_client.chat.completions.create(
+                stream=True, **self._chat_request(user_message, language, context)
+            )
+        
+        parts = []
+        try:
+            async for chunk in ai_governor.astream("openai", open_stream):
+                delta = chunk.choices[0].delta.content if chunk.choices else None
+                if delta:
+                    parts.append(delta)
+                    yield delta
+        except Exception as e:
+            print(f"AI Service Error: {e}")
+            if not parts:
+                yield self._get_fallback_response(language)
+            return
+        
+        await response_cache.aset(user_message, language, context, "".join(parts).strip(), CHAT_MODEL)
+    
+    def _fetch_reply(self, user_message, language, context):
+        response = ai_governor.call("openai", lambda timeout: self.client.with_options(timeout=timeout).chat.completions.create(
+            **self._chat_request(user_message, language, context)
+        ))
+        
+        reply = response.choices[0].message.content.strip()
+        response_cache.set(user_message, language, context, reply, CHAT_MODEL)
+        return reply
+    
+    async def _afetch_reply(self, user_message, language, context):
+        response = await ai_governor.acall("openai", lambda: self.async_client.chat.completions.create(
+            **self._chat_request(user_message, language, context)
+        ))
+        
+        reply = response.choices[0].message.content.strip()
+        await response_cache.aset(user_message, language, context, reply, CHAT_MODEL)
+        return reply
+    
+    def _chat_request(self, user_message, language, context):
+        """Build the chat completion arguments shared by the sync and async paths"""
+        # System prompt based on language and context
+        system_prompt = self._get_system_prompt(language, context)
+        
+        return {
+            "model": CHAT_MODEL,
+            "messages": [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_message}
+            ],
+            "max_tokens": 500,
+            "temperature": 0.7,
+        }
+    
     def _get_system_prompt(self, language, context):
         """Get appropriate system prompt based on language and context"""
         
@@ -84,20 +173,28 @@ class AIService:
     def analyze_sentiment(self, text, language='bn'):
         """Analyze user sentiment for mood check"""
         try:
-            prompt = f"""
-            Analyze the sentiment of this {language} text and respond with ONLY one word: 
-            "positive", "negative", or "neutral".
+            response = llm_flights.do(
+                make_key(text, language, "sentiment", SENTIMENT_MODEL),
+                lambda: ai_governor.call("openai", lambda timeout: self.client.with_options(timeout=timeout).chat.completions.create(
+                    **self._sentiment_request(text, language)
+                ), deadline=SENTIMENT_DEADLINE),
+            )
             
-            Text: "{text}"
-            """
+            sentiment = response.choices[0].message.content.strip().lower()
+            return sentiment
             
-            response = self.client.chat.completions.create(
-                model="gpt-3.5-turbo",
-                messages=[
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=10,
-                temperature=0.3
+        except Exception as e:
+            print(f"Sentiment analysis error: {e}")
+            return "neutral"
+    
+    async def aanalyze_sentiment(self, text, language='bn'):
+        """Async variant of analyze_sentiment for use from async views"""
+        try:
+            response = await llm_flights.ado(
+                make_key(text, language, "sentiment", SENTIMENT_MODEL),
+                lambda: ai_governor.acall("openai", lambda: self.async_client.chat.completions.create(
+                    **self._sentiment_request(text, language)
+                ), deadline=SENTIMENT_DEADLINE),
             )
             
             sentiment = response.choices[0].message.content.strip().lower()
@@ -106,6 +203,59 @@ class AIService:
         except Exception as e:
             print(f"Sentiment analysis error: {e}")
             return "neutral"
+    
+    def analyze_sentiment_batch(self, texts, language='mixed'):
+        """Label many texts with one request; returns one label per text, or None on failure"""
+        try:
+            # One request labels a whole batch, so it gets longer than a chat turn
+            response = ai_governor.call("openai", lambda timeout: self.client.with_options(timeout=timeout).chat.completions.create(
+                **self._sentiment_batch_request(texts, language)
+            ), deadline=BATCH_DEADLINE)
+            
+            content = response.choices[0].message.content.strip()
+            labels = json.loads(content[content.find('['):content.rfind(']') + 1])
+            if len(labels) != len(texts):
+                raise ValueError(f"expected {len(texts)} labels, got {len(labels)}")
+            return [str(label).strip().lower() for label in labels]
+            
+        except Exception as e:
+            print(f"Batch sentiment analysis error: {e}")
+            return None
+    
+    def _sentiment_batch_request(self, texts, language):
+        numbered = "\n".join(f"{i}. {text[:500]}" for i, text in enumerate(texts, 1))
+        prompt = f"""
+            Analyze the sentiment of each numbered {language} text below. Respond with ONLY a JSON
+            array holding one word per text, in order: "positive", "negative", or "neutral".
+            
+            {numbered}
+            """
+        
+        return {
+            "model": SENTIMENT_MODEL,
+            "messages": [
+                {"role": "user", "content": prompt}
+            ],
+            "max_tokens": 8 * len(texts) + 20,
+            "temperature": 0.3,
+        }
+    
+    def _sentiment_request(self, text, language):
+        prompt = f"""
+            Analyze the sentiment of this {language} text and respond with ONLY one word: 
+            "positive", "negative", or "neutral".
+            
+            Text: "{text}"
+            """
+        
+        return {
+            "model": SENTIMENT_MODEL,
+            "messages": [
+                {"role": "user", "content": prompt}
+            ],
+            "max_tokens": 10,
+            "temperature": 0.3,
+        }
 
 class HealthAPIService:
     def __init__(self):
@@ -122,15 +272,14 @@ class HealthAPIService:
             Keep response under 100 words.
             """
             
-            client = openai.OpenAI(api_key=self.api_key)
-            response = client.chat.completions.create(
+            response = ai_governor.call("openai", lambda timeout: get_openai_client().with_options(timeout=timeout).chat.completions.create(
                 model="gpt-3.5-turbo",
                 messages=[
                     {"role": "user", "content": prompt}
                 ],
                 max_tokens=200,
                 temperature=0.7
-            )
+            ))
             
             return response.choices[0].message.content.strip()
             
@@ -4,3 +4,10 @@ from django.apps import AppConfig
 class MainConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'main'
+
+    def ready(self):
+        from django.db.models.signals import post_migrate
+
+        from . import intents, signals  # noqa: F401 - intents compiles its match tables on import
+
+        post_migrate.connect(signals.create_search_index, sender=self)
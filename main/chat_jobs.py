@@ -0,0 +1,133 @@
+"""Deferred answers for the mood tracker chat.
+
+On a flaky link a POST that waits for the model often dies mid-flight,
+and the user's resubmit pays for a second model call. In job mode
+(``mode=job``) ``send_message`` stores a :class:`~main.models.ChatJob`
+under the client's idempotency key and returns its id at once. The
+client then long-polls ``/mood-tracker/jobs/<id>/?wait=...`` for the answer.
+
+A resubmit with the same key finds the existing job, so it never queues
+a second model call. Keys are scoped to the browser's conversation, and
+a job is only shown to that conversation's session. Jobs are answered by a background thread started
+when the job is committed. ``manage.py process_chat_jobs --loop`` picks
+up anything that thread did not finish.
+
+Workers claim a job by flipping it from ``pending`` to ``running`` in a
+conditional UPDATE, so only one of them asks the model. A claim older
+than ``CHAT_JOB_CLAIM_TIMEOUT`` (a worker that died) can be taken over.
+After ``CHAT_JOB_MAX_ATTEMPTS`` claims, a job is marked ``failed``.
+"""
+
+import logging
+import threading
+from datetime import timedelta
+
+from asgiref.sync import async_to_sync
+from django.conf import settings
+from django.db import connections, transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from .fragments import chat_version_name
+from .models import ChatJob, ChatMessage
+from .versions import bump_version
+
+logger = logging.getLogger(__name__)
+
+
+def _setting(name, default):
+    return getattr(settings, f"CHAT_JOB_{name}", default)
+
+
+def enqueue(key, conversation_id, message):
+    """The conversation's job for ``key``, created if this is the first submission; returns (job, created)"""
+    job, created = ChatJob.objects.get_or_create(
+        conversation_id=conversation_id, idempotency_key=key, defaults={"message": message}
+    )
+    if created and _setting("RUN_IN_BACKGROUND", True):
+        transaction.on_commit(
+            lambda: threading.Thread(target=_run_in_background, args=(job.id,), daemon=True).start()
+        )
+    return job, created
+
+
+def _run_in_background(job_id):
+    try:
+        process_due(ChatJob.objects.filter(id=job_id))
+    except Exception:
+        logger.exception("Background run of chat job %s failed; process_chat_jobs will retry", job_id)
+    finally:
+        connections.close_all()
+
+
+def _claimable(now):
+    stale = now - timedelta(seconds=_setting("CLAIM_TIMEOUT", 5 * 60))
+    return Q(status="pending") | Q(status="running", claimed_at__lt=stale)
+
+
+def _claim(queryset, now, limit):
+    candidates = queryset.filter(_claimable(now)).order_by("created_at").values_list("id", flat=True)
+    claimed = []
+    for job_id in candidates[:limit]:
+        if ChatJob.objects.filter(_claimable(now), id=job_id).update(
+            status="running", claimed_at=now, attempts=F("attempts") + 1
+        ):
+            claimed.append(job_id)
+    return list(ChatJob.objects.filter(id__in=claimed).order_by("created_at"))
+
+
+def _answer(job):
+    from .views import chat_fallback, model_chat_reply
+
+    # A model failure raises, so the job is retried rather than answered with the fallback for good
+    reply = async_to_sync(model_chat_reply)(job.message) or chat_fallback(job.message)
+    with transaction.atomic():
+        # Only the worker still holding the claim may finish the job
+        held = ChatJob.objects.filter(id=job.id, status="running", claimed_at=job.claimed_at)
+        if not held.select_for_update().exists():
+            return False
+        user_entry, ai_entry = ChatMessage.objects.bulk_create([
+            ChatMessage(conversation_id=job.conversation_id, role="user", content=job.message),
+            ChatMessage(conversation_id=job.conversation_id, role="assistant", content=reply),
+        ])
+        held.update(
+            status="done", user_message=user_entry, reply=ai_entry, finished_at=timezone.now(), last_error=""
+        )
+    # bulk_create sends no signals, so retire the cached chat fragment here
+    bump_version(chat_version_name(job.conversation_id))
+    return True
+
+
+def _give_back(job, error):
+    failed = job.attempts >= _setting("MAX_ATTEMPTS", 3)
+    ChatJob.objects.filter(id=job.id, status="running", claimed_at=job.claimed_at).update(
+        status="failed" if failed else "pending",
+        claimed_at=None,
+        last_error=repr(error)[:1000],
+        finished_at=timezone.now() if failed else None,
+    )
+    logger.warning("Chat job %s attempt %d failed: %r", job.id, job.attempts, error)
+
+
+def process_due(queryset=None, batch_size=10):
+    """Answer claimable jobs; returns (done, failed)"""
+    queryset = ChatJob.objects.all() if queryset is None else queryset
+    done = failed = 0
+    for job in _claim(queryset, timezone.now(), batch_size):
+        try:
+            if _answer(job):
+                done += 1
+        except Exception as error:
+            _give_back(job, error)
+            failed += 1
+    return done, failed
+
+
+def payload(job):
+    """What the client sees of a job: its status, then the answer once it is done"""
+    data = {"job_id": str(job.id), "status": job.status}
+    if job.status == "done":
+        data["response"] = job.reply.content if job.reply else ""
+        data["user_message_id"] = job.user_message_id
+        data["message_id"] = job.reply_id
+    return data
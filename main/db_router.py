@@ -0,0 +1,131 @@
+"""Read/write routing between the primary database and its read replicas.
+
+Writes always go to ``default``. Reads made while serving a request go to
+a replica from ``DATABASE_REPLICAS``, unless this browser wrote something
+in the last ``REPLICA_STICKY_SECONDS``. A write pins the rest of its
+request to the primary, and :class:`PrimaryPinMiddleware` sets a cookie
+that keeps the browser's next requests there until replicas have caught
+up. That way nobody misses their own check-in on the next page.
+
+Reads outside a request (management commands, the write buffer thread)
+stay on the primary; they often read then write, and must not act on
+stale rows.
+
+Replica lag is measured with :class:`~main.models.ReplicationHeartbeat`
+(see ``manage.py replica_lag``).
+"""
+
+import random
+import time
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+
+PRIMARY = "default"
+PIN_COOKIE = "db_primary_until"
+
+# Per-request routing state; None outside a request
+_request_state = ContextVar("db_routing_state", default=None)
+
+
+class _RoutingState:
+    def __init__(self, pinned):
+        self.pinned = pinned
+        self.wrote = False
+
+
+def replicas():
+    return [alias for alias in getattr(settings, "DATABASE_REPLICAS", []) if alias in settings.DATABASES]
+
+
+class ReplicaRouter:
+    def db_for_read(self, model, **hints):
+        instance = hints.get("instance")
+        if instance is not None and instance._state.db:
+            # Follow related lookups to wherever the instance came from
+            return instance._state.db
+        state = _request_state.get()
+        available = replicas()
+        if state is None or state.pinned or not available:
+            return PRIMARY
+        return random.choice(available)
+
+    def db_for_write(self, model, **hints):
+        state = _request_state.get()
+        if state is not None:
+            state.pinned = state.wrote = True
+        return PRIMARY
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Replicas hold the same rows as the primary
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # Replicas receive the schema through replication
+        return db == PRIMARY
+
+
+class PrimaryPinMiddleware:
+    """Route a request's reads to replicas unless this browser wrote recently"""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def _start(self, request):
+        try:
+            pinned = float(request.COOKIES.get(PIN_COOKIE, 0)) > time.time()
+        except ValueError:
+            pinned = False
+        # Anything but a GET probably writes; keep its reads consistent with its own writes
+        return _RoutingState(pinned or request.method not in ("GET", "HEAD", "OPTIONS"))
+
+    def _finish(self, response, state):
+        if state.wrote:
+            sticky = getattr(settings, "REPLICA_STICKY_SECONDS", 5)
+            response.set_cookie(PIN_COOKIE, str(time.time() + sticky), max_age=sticky, httponly=True, samesite="Lax")
+        return response
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        state = self._start(request)
+        token = _request_state.set(state)
+        try:
+            response = self.get_response(request)
+        finally:
+            _request_state.reset(token)
+        return self._finish(response, state)
+
+    async def __acall__(self, request):
+        state = self._start(request)
+        token = _request_state.set(state)
+        try:
+            response = await self.get_response(request)
+        finally:
+            _request_state.reset(token)
+        return self._finish(response, state)
+
+
+def write_heartbeat():
+    """Stamp the primary's heartbeat with the current time and return it"""
+    from django.utils import timezone
+
+    from .models import ReplicationHeartbeat
+
+    now = timezone.now()
+    ReplicationHeartbeat.objects.using(PRIMARY).update_or_create(id=1, defaults={"beat_at": now})
+    return now
+
+
+def replica_heartbeat(alias):
+    """The newest heartbeat a replica has received, or None"""
+    from .models import ReplicationHeartbeat
+
+    return ReplicationHeartbeat.objects.using(alias).filter(id=1).values_list("beat_at", flat=True).first()
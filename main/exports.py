@@ -0,0 +1,133 @@
+"""Streaming CSV/NDJSON exports of the anonymized source tables.
+
+Each export is a ``values_list`` over a date range, read with
+``.iterator()`` in fixed-size chunks and written out as it is read, so a
+district-wide export of millions of rows runs in constant memory and the
+first bytes leave before the last row is fetched. Under ASGI the chunks
+are handed over through :func:`aiter_chunks`; Django would collect a sync
+iterator into a list there before sending anything. Rows are ordered by the
+indexed date column (then id), which SQLite and Postgres can walk
+straight off the index without a sort.
+
+Only columns that cannot identify a person are exported: no notes,
+descriptions, contact details, chat text or child names.
+"""
+
+import csv
+import zlib
+from collections import namedtuple
+from datetime import datetime, time, timedelta
+
+from asgiref.sync import sync_to_async
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils import timezone
+
+from .models import AnonymousHelpRequest, ChatMessage, MoodCheckIn, VaccinationRecord
+
+CHUNK_SIZE = 2000
+
+# date_field is a DateTimeField or DateField; area_field is the Union foreign key, if the model has one
+Export = namedtuple("Export", ["model", "date_field", "columns", "area_field"])
+
+EXPORTS = {
+    "mood": Export(MoodCheckIn, "created_at", ["id", "created_at", "mood", "sentiment", "union_area_id"],
+                   "union_area"),
+    "help": Export(
+        AnonymousHelpRequest, "created_at",
+        ["id", "created_at", "help_type", "union_area_id", "is_resolved", "resolved_at"], "union_area",
+    ),
+    "vaccination": Export(
+        VaccinationRecord, "scheduled_date",
+        ["id", "child_id", "vaccine_type", "scheduled_date", "administered_date", "is_completed"], None,
+    ),
+    "chat": Export(
+        ChatMessage, "created_at", ["id", "conversation_id", "conversation__channel", "role", "sentiment", "created_at"],
+        None,
+    ),
+}
+
+FORMATS = {"csv": "text/csv; charset=utf-8", "ndjson": "application/x-ndjson"}
+
+# Query parameter -> lookup below the model's Union foreign key
+AREA_FILTERS = {"union": "", "upazila": "__upazila", "district": "__upazila__district"}
+
+
+def _day_start(day):
+    return timezone.make_aware(datetime.combine(day, time.min))
+
+
+def export_rows(name, start=None, end=None, areas=None):
+    """values_list rows for one export, oldest first; end is inclusive, areas maps AREA_FILTERS keys to ids"""
+    export = EXPORTS[name]
+    rows = export.model.objects.all()
+    # Choose the database now: the response streams after the request's routing state is gone (see db_router)
+    rows = rows.using(rows.db)
+    # Whole-day bounds on the raw column rather than a __date lookup, which could not use the index
+    is_datetime = export.model._meta.get_field(export.date_field).get_internal_type() == "DateTimeField"
+    if start:
+        rows = rows.filter(**{f"{export.date_field}__gte": _day_start(start) if is_datetime else start})
+    if end:
+        end = end + timedelta(days=1)
+        rows = rows.filter(**{f"{export.date_field}__lt": _day_start(end) if is_datetime else end})
+    if export.area_field:
+        for key, area_id in (areas or {}).items():
+            rows = rows.filter(**{f"{export.area_field}{AREA_FILTERS[key]}_id": area_id})
+    return rows.order_by(export.date_field, "id").values_list(*export.columns).iterator(chunk_size=CHUNK_SIZE)
+
+
+class _Echo:
+    """File-like object whose write() hands the line back, for csv.writer"""
+
+    def write(self, value):
+        return value
+
+
+def _csv_lines(columns, rows):
+    writer = csv.writer(_Echo())
+    yield "\ufeff"  # Excel needs the BOM to read Bangla labels as UTF-8
+    yield writer.writerow(columns)
+    for row in rows:
+        yield writer.writerow(row)
+
+
+def _ndjson_lines(columns, rows):
+    encoder = DjangoJSONEncoder(ensure_ascii=False)
+    for row in rows:
+        yield encoder.encode(dict(zip(columns, row))) + "\n"
+
+
+def _batched(lines, size=CHUNK_SIZE):
+    """Join lines into larger strings so the server writes a few big chunks instead of one per row"""
+    batch = []
+    for line in lines:
+        batch.append(line)
+        if len(batch) >= size:
+            yield "".join(batch).encode()
+            batch = []
+    if batch:
+        yield "".join(batch).encode()
+
+
+def _gzipped(chunks):
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)  # wbits 31 writes a gzip header and trailer
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def stream(name, fmt, rows, gzip=False):
+    """Encoded byte chunks of an export in ``fmt`` ("csv" or "ndjson"), optionally gzip-compressed"""
+    columns = [column.replace("__", "_") for column in EXPORTS[name].columns]
+    lines = _csv_lines(columns, rows) if fmt == "csv" else _ndjson_lines(columns, rows)
+    chunks = _batched(lines)
+    return _gzipped(chunks) if gzip else chunks
+
+
+async def aiter_chunks(chunks):
+    """``chunks`` as an async iterator, each one built in the request's sync thread (which holds the cursor)"""
+    chunks = iter(chunks)
+    done = object()
+    while (chunk := await sync_to_async(next, thread_sensitive=True)(chunks, done)) is not done:
+        yield chunk
@@ -0,0 +1,15 @@
+"""Version names for cached template fragments.
+
+Pages cache fragments with ``{% cache %}`` keyed on one of these versions
+(see ``main.versions``). Signals in ``main.signals`` bump a version when
+its rows change, so a fragment is rebuilt on the first view after a write
+and served from cache, without touching the database, until the next one.
+"""
+
+FRAGMENT_TIMEOUT = 60 * 60
+
+MOODS_VERSION = "fragment:mood-checkins"
+
+
+def chat_version_name(conversation_id):
+    return f"fragment:chat-messages:{conversation_id}"
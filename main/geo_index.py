@@ -0,0 +1,158 @@
+"""In-memory k-nearest index over facility coordinates.
+
+Every ``Hospital`` and ``HealthFacility`` row with coordinates is bucketed
+into a fixed lat/lon grid (``GEO_INDEX_CELL_DEGREES`` per cell, roughly
+5 km at the default), one grid per facility type. A query walks rings of
+cells outward from the caller's cell and stops as soon as no unvisited
+ring can hold anything closer than the current k-th result, so only a
+handful of cells are touched even with tens of thousands of facilities.
+
+Rows from ``Hospital`` are indexed with type ``"hospital"``. The index is
+rebuilt per process when either table changes (see ``main.signals``).
+"""
+
+import heapq
+import math
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+
+from .versions import VersionedSnapshot
+
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEGREE = 111.32
+
+
+def haversine_km(lat1, lon1, lat2, lon2):
+    lat1, lon1, lat2, lon2 = map(math.radians, (lat1, lon1, lat2, lon2))
+    a = (
+        math.sin((lat2 - lat1) / 2) ** 2
+        + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a))
+
+
+class FacilityIndex(VersionedSnapshot):
+    version_name = "facility-geo-index"
+    recheck_setting = "GEO_INDEX_RECHECK_SECONDS"
+
+    def __init__(self):
+        super().__init__()
+        self.cell = getattr(settings, "GEO_INDEX_CELL_DEGREES", 0.05)
+        self._grids = {}
+        self._bounds = None
+
+    def _cell_of(self, lat, lon):
+        return (math.floor(lat / self.cell), math.floor(lon / self.cell))
+
+    def load(self):
+        from .models import HealthFacility, Hospital
+
+        grids = {}
+        cells = set()
+
+        def add(entry):
+            key = self._cell_of(entry["latitude"], entry["longitude"])
+            grids.setdefault(entry["type"], {}).setdefault(key, []).append(entry)
+            cells.add(key)
+
+        facilities = HealthFacility.objects.filter(latitude__isnull=False, longitude__isnull=False)
+        for row in facilities.values(
+            "id", "name", "facility_type", "address", "contact", "hours", "latitude", "longitude"
+        ).iterator():
+            row["type"] = row.pop("facility_type")
+            row["source"] = "facility"
+            add(row)
+
+        hospitals = Hospital.objects.filter(latitude__isnull=False, longitude__isnull=False)
+        for row in hospitals.values("id", "name", "address", "phone", "latitude", "longitude").iterator():
+            row["contact"] = row.pop("phone")
+            row["type"] = "hospital"
+            row["source"] = "hospital"
+            add(row)
+
+        # Cell bounding box, so a query knows the last ring that can hold a point
+        bounds = None
+        if cells:
+            rows = [c[0] for c in cells]
+            cols = [c[1] for c in cells]
+            bounds = (min(rows), max(rows), min(cols), max(cols))
+        self._grids, self._bounds = grids, bounds
+
+    def _ring(self, center, radius):
+        """Cells at Chebyshev distance ``radius`` from ``center``, clipped to the indexed area"""
+        cy, cx = center
+        min_row, max_row, min_col, max_col = self._bounds
+        cols = range(max(cx - radius, min_col), min(cx + radius, max_col) + 1)
+        for row in {cy - radius, cy + radius}:
+            if min_row <= row <= max_row:
+                for col in cols:
+                    yield (row, col)
+        rows = range(max(cy - radius + 1, min_row), min(cy + radius - 1, max_row) + 1)
+        for col in {cx - radius, cx + radius}:
+            if min_col <= col <= max_col:
+                for row in rows:
+                    yield (row, col)
+
+    def _ring_min_km(self, lat, radius):
+        """Lower bound on the distance from the query to any cell in ring ``radius``"""
+        if radius <= 0:
+            return 0.0
+        # A degree of longitude is shortest at the highest latitude a point can sit at
+        min_row, max_row = self._bounds[0], self._bounds[1]
+        widest_lat = min(89.0, max(abs(lat), abs(min_row * self.cell), abs((max_row + 1) * self.cell)))
+        return (radius - 1) * self.cell * KM_PER_DEGREE * math.cos(math.radians(widest_lat))
+
+    def nearest(self, lat, lon, k=5, types=None, radius_km=None):
+        """Return up to ``k`` facilities nearest to (lat, lon), closest first.
+
+        ``types`` limits the search to those facility types; ``radius_km``
+        drops anything further away.
+        """
+        self.ensure_fresh()
+        return self._search(lat, lon, k, types, radius_km)
+
+    async def anearest(self, lat, lon, k=5, types=None, radius_km=None):
+        if not self.is_fresh():
+            await sync_to_async(self.refresh)()
+        return self._search(lat, lon, k, types, radius_km)
+
+    def _search(self, lat, lon, k, types, radius_km):
+        grids = [grid for name, grid in self._grids.items() if not types or name in types]
+        if not grids or k <= 0:
+            return []
+
+        center = self._cell_of(lat, lon)
+        min_row, max_row, min_col, max_col = self._bounds
+        last_ring = max(
+            abs(center[0] - min_row), abs(center[0] - max_row),
+            abs(center[1] - min_col), abs(center[1] - max_col),
+        )
+        # Rings that do not reach the indexed area are empty
+        first_ring = max(0, min_row - center[0], center[0] - max_row, min_col - center[1], center[1] - max_col)
+        heap = []  # max-heap on distance via negation: (-distance, tiebreak, entry)
+        for radius in range(first_ring, last_ring + 1):
+            ring_min = self._ring_min_km(lat, radius)
+            if radius_km is not None and ring_min > radius_km:
+                break
+            if len(heap) == k and ring_min > -heap[0][0]:
+                break
+            for key in self._ring(center, radius):
+                for grid in grids:
+                    for entry in grid.get(key, ()):
+                        distance = haversine_km(lat, lon, entry["latitude"], entry["longitude"])
+                        if radius_km is not None and distance > radius_km:
+                            continue
+                        item = (-distance, id(entry), entry)
+                        if len(heap) < k:
+                            heapq.heappush(heap, item)
+                        elif distance < -heap[0][0]:
+                            heapq.heapreplace(heap, item)
+
+        results = []
+        for neg_distance, _, entry in sorted(heap, key=lambda item: -item[0]):
+            results.append({**entry, "distance_km": round(-neg_distance, 2)})
+        return results
+
+
+facility_index = FacilityIndex()
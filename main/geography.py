@@ -0,0 +1,91 @@
+"""Lookups from free-text area names onto the Upazila/Union reference tables.
+
+Names arrive in Bangla script, Latin transliterations and assorted
+spellings ("চরফ্যাশন", "Char Fasson", "charfashion upazila"). Every
+spelling is reduced with :func:`normalize_area_name` and looked up in
+``AreaAlias``, so resolving a name is one indexed equality query.
+Canonical ``name``/``name_bn`` spellings get aliases automatically when an
+Upazila or Union is saved (see ``main.signals``).
+"""
+
+import re
+import unicodedata
+
+from .models import AreaAlias
+
+# Administrative suffixes people add or leave out (kept in NFC, like the input)
+_SUFFIXES = ["upazila", "upazilla", "upozila", "thana", "union", "parishad", "উপজেলা", "থানা", "ইউনিয়ন", "পরিষদ"]
+_suffixes = re.compile(
+    r"\s*(%s)\s*$" % "|".join(re.escape(unicodedata.normalize("NFC", word)) for word in _SUFFIXES)
+)
+
+
+def normalize_area_name(name):
+    """Reduce a spelling of an area name to its alias key.
+
+    Applies NFC (so precomposed and decomposed Bangla nukta letters match),
+    then drops case, a trailing administrative word like "upazila" or
+    "ইউনিয়ন", and every space, punctuation mark and zero-width joiner.
+    Bangla vowel signs are kept, so distinct names stay distinct.
+    """
+    name = unicodedata.normalize("NFC", name or "").casefold().strip()
+    name = _suffixes.sub("", name)
+    return "".join(ch for ch in name if unicodedata.category(ch)[0] not in "PZSC")
+
+
+def resolve_area(name):
+    """Return ("upazila", id) or ("union", id) for a spelling, or None.
+
+    Upazilas win when a spelling names both (e.g. a union named after its
+    upazila), since the broader filter is the safer guess.
+    """
+    alias = normalize_area_name(name)
+    if not alias:
+        return None
+    matches = AreaAlias.objects.filter(alias=alias).values_list("upazila_id", "union_id")
+    union_match = None
+    for upazila_id, union_id in matches:
+        if upazila_id:
+            return ("upazila", upazila_id)
+        union_match = union_match or union_id
+    return ("union", union_match) if union_match else None
+
+
+def resolve_upazila_id(name):
+    alias = normalize_area_name(name)
+    if not alias:
+        return None
+    return (
+        AreaAlias.objects.filter(alias=alias, upazila__isnull=False)
+        .values_list("upazila_id", flat=True)
+        .first()
+    )
+
+
+def resolve_union_id(name, upazila_id=None):
+    """Resolve a union spelling, scoped to ``upazila_id`` when known (union names repeat across upazilas)"""
+    alias = normalize_area_name(name)
+    if not alias:
+        return None
+    aliases = AreaAlias.objects.filter(alias=alias, union__isnull=False)
+    if upazila_id:
+        aliases = aliases.filter(union__upazila_id=upazila_id)
+    return aliases.values_list("union_id", flat=True).first()
+
+
+def link_area(instance):
+    """Fill ``upazila_area``/``union_area`` on a facility, event or worker from its text fields"""
+    if instance.upazila_area_id is None and instance.upazila:
+        instance.upazila_area_id = resolve_upazila_id(instance.upazila)
+    if instance.union_area_id is None and instance.union:
+        instance.union_area_id = resolve_union_id(instance.union, instance.upazila_area_id)
+        if instance.union_area_id and instance.upazila_area_id is None:
+            instance.upazila_area_id = instance.union_area.upazila_id
+
+
+def sync_canonical_aliases(area):
+    """Make sure an Upazila's or Union's own names resolve to it"""
+    field = "upazila" if area._meta.model_name == "upazila" else "union"
+    for spelling in {normalize_area_name(area.name), normalize_area_name(area.name_bn)}:
+        if spelling:
+            AreaAlias.objects.get_or_create(alias=spelling, **{field: area})
@@ -0,0 +1,202 @@
+"""Voice-command intent matching, compiled once at startup.
+
+Every known phrase (Bangla, English and Banglish) is normalized and
+compiled into an exact-match table, a symmetric-delete table (each phrase
+with up to ``max_edits`` characters removed) and a character trie. A
+command is matched in three passes, cheapest first:
+
+1. exact lookup of the whole normalized command (confidence 1.0),
+2. fuzzy lookup: the command's own deletions are looked up in the delete
+   table, and the few candidates found are checked with a banded
+   Levenshtein distance, tolerating ASR slips and spelling variants
+   (confidence ``1 - edits / length``),
+3. a known phrase appearing as a run of whole words inside a longer
+   command, e.g. "হাসপাতাল কোথায় আছে বলো", found by walking the trie
+   from each word start. Confidence grows with how much of the command
+   the phrase covers, so a lone "help" inside an unrelated sentence
+   stays low, and is halved when the rest of the command holds a
+   negator ("no emergency", "হাসপাতাল না").
+
+Callers treat anything under ``INTENT_MIN_CONFIDENCE`` as free text for
+the LLM.
+"""
+
+import unicodedata
+from collections import namedtuple
+from functools import lru_cache
+
+IntentMatch = namedtuple("IntentMatch", ["intent", "confidence", "phrase"])
+
+INTENT_PHRASES = {
+    "health_tip": [
+        "স্বাস্থ্য তথ্য দেখাও", "স্বাস্থ্য তথ্য", "স্বাস্থ্য টিপ", "স্বাস্থ্য টিপস", "টিপ দেখাও", "টিপস দাও",
+        "show health info", "health info", "health tip", "health tips", "give me a health tip",
+        "health info dekhao", "health tip dao", "shastho tottho dekhao",
+    ],
+    "nearest_hospital": [
+        "হাসপাতাল", "হাসপাতাল কোথায়", "কাছের হাসপাতাল", "নিকটবর্তী হাসপাতাল", "হাসপাতাল কোথায় আছে",
+        "hospital", "where is hospital", "where is the hospital", "nearest hospital", "hospital near me",
+        "hospital kothay", "hospital kothai", "kacher hospital",
+    ],
+    "mood_check": [
+        "আমি আজ কেমন আছি", "আজ কেমন আছি", "কেমন আছি",
+        "how am i today", "how am i feeling", "mood check",
+        "ami aj kemon achi", "ami kemon achi", "aj kemon achi",
+    ],
+    "help": [
+        "সাহায্য কর", "সাহায্য করো", "সাহায্য করুন", "হেল্প", "আমি কী বলতে পারি",
+        "help me", "help", "what can i say",
+        "help korba", "help koro", "amake help koro", "tumi amk aktu help kroba",
+    ],
+    "emergency": [
+        "জরুরী", "জরুরি", "জরুরী সাহায্য", "জরুরি সাহায্য", "অ্যাম্বুলেন্স",
+        "emergency", "emergency help", "ambulance",
+        "joruri", "jorury help",
+    ],
+}
+
+
+# Words that turn a contained phrase around; "don't" normalizes to "don t"
+NEGATORS = {"no", "not", "never", "dont", "don", "na", "ni", "noy", "nei", "nai", "না", "নয়", "নেই", "নাই", "নি"}
+
+
+def normalize_command(text):
+    """NFC, casefold, and reduce punctuation/whitespace runs to single spaces"""
+    text = unicodedata.normalize("NFC", text or "").casefold()
+    chars = [" " if unicodedata.category(ch)[0] in "PZSC" else ch for ch in text]
+    return " ".join("".join(chars).split())
+
+
+def max_edits(length):
+    """Edits tolerated for a phrase of ``length`` characters.
+
+    One edit in four characters would score 0.75, the default
+    ``INTENT_MIN_CONFIDENCE``, turning "yelp" into "help"; so short
+    phrases must match exactly and a fuzzy match always scores 0.8 or more.
+    """
+    if length <= 4:
+        return 0
+    if length <= 7:
+        return 1
+    return 2
+
+
+def deletions(word, depth):
+    """Every string reachable from ``word`` by deleting up to ``depth`` characters"""
+    results = {word}
+    frontier = {word}
+    for _ in range(depth):
+        frontier = {w[:i] + w[i + 1:] for w in frontier for i in range(len(w))}
+        results |= frontier
+    return results
+
+
+def bounded_distance(a, b, limit):
+    """Levenshtein distance between a and b, or ``limit + 1`` if it exceeds ``limit``"""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    over = limit + 1
+    previous = [i if i <= limit else over for i in range(len(b) + 1)]
+    for i in range(1, len(a) + 1):
+        row = [over] * (len(b) + 1)
+        if i <= limit:
+            row[0] = i
+        # Cells further than ``limit`` from the diagonal can never come back under it
+        for j in range(max(1, i - limit), min(len(b), i + limit) + 1):
+            row[j] = min(row[j - 1] + 1, previous[j] + 1, previous[j - 1] + (a[i - 1] != b[j - 1]), over)
+        if min(row) > limit:
+            return over
+        previous = row
+    return previous[-1]
+
+
+class _Node:
+    __slots__ = ("children", "match")
+
+    def __init__(self):
+        self.children = {}
+        self.match = None
+
+
+class IntentMatcher:
+    def __init__(self, phrases=INTENT_PHRASES):
+        self.root = _Node()
+        self.exact = {}
+        self.deletes = {}
+        for intent, variants in phrases.items():
+            for phrase in variants:
+                key = normalize_command(phrase)
+                self.exact[key] = intent
+                for variant in deletions(key, max_edits(len(key))):
+                    self.deletes.setdefault(variant, set()).add(key)
+                node = self.root
+                for ch in key:
+                    node = node.children.setdefault(ch, _Node())
+                node.match = (intent, key)
+        self.budget = max(max_edits(len(key)) for key in self.exact)
+        self.longest = max(len(key) for key in self.exact)
+        # ASR output repeats a lot; remember recent answers per normalized command
+        self._match_text = lru_cache(maxsize=4096)(self._match_text)
+
+    def match(self, command):
+        """Best IntentMatch for a command, or None if nothing is close"""
+        text = normalize_command(command)
+        if not text:
+            return None
+        return self._match_text(text)
+
+    def _match_text(self, text):
+        intent = self.exact.get(text)
+        if intent:
+            return IntentMatch(intent, 1.0, text)
+
+        best = self._fuzzy(text)
+        contained = self._contained(text)
+        if contained and (best is None or contained.confidence > best.confidence):
+            best = contained
+        return best
+
+    def _fuzzy(self, text):
+        # No phrase can be within its edit budget of a much longer command
+        if len(text) > self.longest + self.budget:
+            return None
+        candidates = set()
+        for variant in deletions(text, self.budget):
+            candidates.update(self.deletes.get(variant, ()))
+
+        best, best_distance = None, None
+        for phrase in candidates:
+            limit = max_edits(len(phrase))
+            distance = bounded_distance(text, phrase, limit)
+            if distance <= limit and (best is None or distance < best_distance):
+                best, best_distance = phrase, distance
+        if best is None:
+            return None
+        confidence = round(1 - best_distance / max(len(best), len(text)), 3)
+        return IntentMatch(self.exact[best], confidence, best)
+
+    def _contained(self, text):
+        """Longest known phrase that appears as whole words inside the command"""
+        best = None
+        starts = [0] + [i + 1 for i, ch in enumerate(text) if ch == " "]
+        for start in starts:
+            node = self.root
+            for end in range(start, len(text) + 1):
+                at_word_end = end == len(text) or text[end] == " "
+                if at_word_end and node.match and (best is None or len(node.match[1]) > len(best[1])):
+                    best = node.match
+                if end == len(text):
+                    break
+                node = node.children.get(text[end])
+                if node is None:
+                    break
+        if best is None:
+            return None
+        intent, phrase = best
+        confidence = 0.3 + 0.6 * len(phrase) / len(text)
+        if NEGATORS.intersection(text.split()) - set(phrase.split()):
+            confidence *= 0.5
+        return IntentMatch(intent, round(confidence, 3), phrase)
+
+
+intent_matcher = IntentMatcher()
@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand
+
+from main.ai_cache import response_cache
+
+
+class Command(BaseCommand):
+    help = "Show hit/miss counters for the AI response cache, or clear it."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--clear", action="store_true", help="Drop every cached response")
+        parser.add_argument("--reset-stats", action="store_true", help="Zero the hit/miss counters")
+
+    def handle(self, *args, **options):
+        if options["clear"]:
+            response_cache.clear()
+            self.stdout.write(self.style.SUCCESS("AI response cache cleared"))
+        if options["reset_stats"]:
+            response_cache.reset_stats()
+            self.stdout.write(self.style.SUCCESS("AI response cache counters reset"))
+
+        stats = response_cache.stats()
+        self.stdout.write(
+            f"local hits: {stats['local_hits']}  shared hits: {stats['shared_hits']}  "
+            f"misses: {stats['misses']}  hit rate: {stats['hit_rate']:.1%}"
+        )
@@ -0,0 +1,99 @@
+import gzip
+import re
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.staticfiles import finders
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.core.management.base import BaseCommand, CommandError
+from django.test import Client, override_settings
+from django.urls import reverse
+
+PAGES = [
+    "home", "mood_tracker", "health_map", "voice_assistant", "help_request", "health_tips",
+    "maternal_tracker", "symptom_guide", "health_events", "worker_directory", "data_export",
+]
+
+# Measured as the first active staff user, since anyone else is redirected to the login page
+STAFF_PAGES = {"data_export"}
+
+ASSET_REF = re.compile(r"""<(?:link[^>]*\bhref|script[^>]*\bsrc)=["']([^"']+)["']""")
+
+
+class Command(BaseCommand):
+    help = (
+        "Report the bytes each page costs: before (shared CSS/JS inlined in every response) and after "
+        "(minified, precompressed static files, cached after the first view). Run collectstatic first."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--budget", type=int, help="Fail if a repeat view of any page exceeds this many KB")
+
+    def handle(self, *args, **options):
+        if not staticfiles_storage.exists(getattr(staticfiles_storage, "manifest_name", "staticfiles.json")):
+            raise CommandError("No static manifest found; run `manage.py collectstatic` first.")
+
+        rows = []
+        with override_settings(ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, "testserver"], DEBUG=False):
+            client = Client()
+            staff_client = Client()
+            staff = get_user_model().objects.filter(is_staff=True, is_active=True).order_by("pk").first()
+            if staff is not None:
+                staff_client.force_login(staff)
+            for page in PAGES:
+                if page in STAFF_PAGES and staff is None:
+                    self.stderr.write(f"{page}: needs a staff user (manage.py createsuperuser), skipped")
+                    continue
+                response = (staff_client if page in STAFF_PAGES else client).get(reverse(page))
+                if response.status_code != 200:
+                    self.stderr.write(f"{page}: HTTP {response.status_code}, skipped")
+                    continue
+                rows.append((page, *self.measure(response.content)))
+            staff_client.logout()  # Drop the session force_login stored
+
+        self.stdout.write(
+            f"{'page':<18}{'before':>10}{'html':>10}{'html gz':>10}{'assets':>10}{'first view':>12}{'repeat':>10}"
+        )
+        over = []
+        for page, before, html, html_gz, assets in rows:
+            # The app does not compress HTML itself, so pages are counted uncompressed (html gz: with a proxy)
+            first, repeat = html + assets, html
+            self.stdout.write(
+                f"{page:<18}{kb(before):>10}{kb(html):>10}{kb(html_gz):>10}{kb(assets):>10}{kb(first):>12}{kb(repeat):>10}"
+            )
+            if options["budget"] and repeat > options["budget"] * 1024:
+                over.append(page)
+        self.stdout.write(
+            "before: HTML with the static files' source inlined, on every view. assets: the static files "
+            "a first view downloads, in their smallest precompressed form; later views reuse them from cache."
+        )
+        if over:
+            raise CommandError(f"Over the {options['budget']} KB budget: {', '.join(over)}")
+
+    def measure(self, html):
+        """(before, html, html gzipped, assets) in bytes for one rendered page"""
+        before = assets = 0
+        for url in set(ASSET_REF.findall(html.decode("utf-8"))):
+            if not url.startswith(settings.STATIC_URL):
+                continue  # Third-party CDNs are the same before and after
+            name = url[len(settings.STATIC_URL):]
+            if not staticfiles_storage.exists(name):
+                continue
+            assets += min(
+                staticfiles_storage.size(variant)
+                for variant in (name, name + ".br", name + ".gz")
+                if staticfiles_storage.exists(variant)
+            )
+            source = finders.find(unhashed(name))
+            if source:
+                with open(source, "rb") as f:
+                    before += len(f.read())
+        return len(html) + before, len(html), len(gzip.compress(html)), assets
+
+
+def unhashed(name):
+    return re.sub(r"\.[0-9a-f]{12}(\.\w+)$", r"\1", name)
+
+
+def kb(size):
+    return f"{size / 1024:.1f}K"
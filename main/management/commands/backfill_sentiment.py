@@ -0,0 +1,109 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand
+
+from main.ai_service import AIService
+from main.models import BackfillCheckpoint, ChatMessage, MoodCheckIn
+from main.sentiment import LABELS, classify
+
+CHECKPOINT_NAME = "sentiment:{}"
+
+# source -> (model, base filter, text field); only what users wrote says anything about their mood
+SOURCES = {
+    "mood": (MoodCheckIn, {}, "notes"),
+    "chat": (ChatMessage, {"role": "user"}, "content"),
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "Label MoodCheckIn notes and chat history with a sentiment. Rows the local classifier is unsure "
+        "about are packed many to an LLM request, with a bounded number of requests in flight."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--sources", nargs="+", default=list(SOURCES), choices=list(SOURCES))
+        parser.add_argument("--batch-size", type=int, default=25, help="Texts per LLM request")
+        parser.add_argument("--concurrency", type=int, default=4, help="LLM requests in flight at once")
+        parser.add_argument("--min-confidence", type=float, default=0.6,
+                            help="Local labels at or above this confidence skip the LLM")
+        parser.add_argument("--restart", action="store_true",
+                            help="Ignore saved checkpoints and rescan every unlabelled row")
+        parser.add_argument("--relabel", action="store_true", help="Also relabel rows that already have a sentiment")
+
+    def handle(self, *args, **options):
+        self.options = options
+        self.ai_service = AIService()
+
+        with ThreadPoolExecutor(max_workers=options["concurrency"]) as executor:
+            self.executor = executor
+            for source in options["sources"]:
+                self.backfill(source)
+
+    def backfill(self, source):
+        model, base_filter, text_field = SOURCES[source]
+        # Kept in the database: a lost checkpoint would mean rescanning, and re-billing, every row
+        checkpoint, _ = BackfillCheckpoint.objects.get_or_create(name=CHECKPOINT_NAME.format(source))
+        if self.options["restart"]:
+            checkpoint.last_id = 0
+        last_id = checkpoint.last_id
+
+        rows = model.objects.filter(id__gt=last_id, **base_filter)
+        rows = rows.order_by("id").only("id", text_field, "sentiment")
+        if not self.options["relabel"]:
+            rows = rows.filter(sentiment="")
+
+        # One window is as many rows as the LLM requests in flight can hold
+        window_size = self.options["batch_size"] * self.options["concurrency"]
+        totals = {"local": 0, "llm": 0, "failed": 0}
+        window = []
+        for row in rows.iterator(chunk_size=window_size):
+            window.append(row)
+            if len(window) >= window_size:
+                self.label_window(model, window, text_field, totals)
+                self.save_checkpoint(checkpoint, window[-1].id)
+                window = []
+        if window:
+            self.label_window(model, window, text_field, totals)
+            self.save_checkpoint(checkpoint, window[-1].id)
+
+        self.stdout.write(self.style.SUCCESS(
+            f"{source}: {totals['local']} labelled locally, {totals['llm']} by the LLM, {totals['failed']} failed"
+        ))
+        if totals["failed"]:
+            self.stdout.write("Run again with --restart to retry the rows that failed")
+
+    def save_checkpoint(self, checkpoint, last_id):
+        checkpoint.last_id = last_id
+        checkpoint.save(update_fields=["last_id", "updated_at"])
+
+    def label_window(self, model, window, text_field, totals):
+        unsure = []
+        for row in window:
+            text = getattr(row, text_field)
+            if not text.strip():
+                row.sentiment = "neutral"
+                totals["local"] += 1
+                continue
+            result = classify(text)
+            if result.confidence >= self.options["min_confidence"]:
+                row.sentiment = result.label
+                totals["local"] += 1
+            else:
+                unsure.append((row, text))
+
+        size = self.options["batch_size"]
+        batches = [unsure[i:i + size] for i in range(0, len(unsure), size)]
+        results = self.executor.map(
+            lambda batch: self.ai_service.analyze_sentiment_batch([text for _, text in batch]), batches
+        )
+        for batch, labels in zip(batches, results):
+            if labels is None:
+                totals["failed"] += len(batch)
+                continue
+            for (row, _), label in zip(batch, labels):
+                row.sentiment = label if label in LABELS else "neutral"
+            totals["llm"] += len(batch)
+
+        labelled = [row for row in window if row.sentiment]
+        model.objects.bulk_update(labelled, ["sentiment"])
@@ -0,0 +1,29 @@
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+
+from main import snapshot
+
+
+class Command(BaseCommand):
+    help = (
+        "Build or extend an offline analytics snapshot: a small SQLite file of anonymized daily counts, "
+        "plus a gzipped copy for slow links. Reruns only rebuild the days since the last snapshot."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="Snapshot file, e.g. snapshots/bhola.sqlite3; PATH.gz is written too")
+        parser.add_argument("--start", type=date.fromisoformat, required=True, help="First day covered (YYYY-MM-DD)")
+        parser.add_argument("--end", type=date.fromisoformat, help="Last day covered; defaults to today")
+        parser.add_argument("--district", type=int, help="Only this District id's unions")
+        parser.add_argument("--refresh-days", type=int, default=30,
+                            help="Days before the previous end to rebuild, to pick up late resolutions")
+
+    def handle(self, *args, **options):
+        if options["end"] and options["end"] < options["start"]:
+            raise CommandError("--end is before --start")
+        written = snapshot.build(
+            options["path"], options["start"], options["end"], options["district"], options["refresh_days"]
+        )
+        summary = ", ".join(f"{table} {count}" for table, count in written.items())
+        self.stdout.write(self.style.SUCCESS(f"Wrote {options['path']} and {options['path']}.gz ({summary})"))
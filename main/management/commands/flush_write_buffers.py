@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+
+from main.write_buffer import BUFFERS
+
+
+class Command(BaseCommand):
+    help = "Write rows left in write-buffer spool files by processes that died before flushing them."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--all", action="store_true",
+                            help="Also take spools of processes that look alive; only use while the server is stopped")
+
+    def handle(self, *args, **options):
+        for buffer in BUFFERS:
+            written = buffer.recover(include_live=options["all"])
+            self.stdout.write(self.style.SUCCESS(f"{buffer.label}: wrote {written} rows"))
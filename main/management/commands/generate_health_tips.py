@@ -0,0 +1,70 @@
+import re
+
+from django.core.management.base import BaseCommand
+
+from main import offline_pack, search
+from main.ai_service import AIService
+from main.models import HealthTip
+from main.tip_pool import tip_pool
+from main.versions import bump_version
+
+SEASON_PROMPTS = {
+    "all": "any time of year",
+    "summer": "the hot summer months (heat, diarrhoea, safe drinking water)",
+    "monsoon": "the monsoon (dengue, flooding, waterborne disease)",
+    "winter": "winter (cold, flu, pneumonia in children and the elderly)",
+}
+
+LANGUAGE_PROMPTS = {
+    "bn": "simple Bangla",
+    "en": "simple English",
+    "mixed": "simple Banglish (Bangla written in Latin letters mixed with English)",
+}
+
+# Leading "1.", "-", "•" and similar list markers
+_list_marker = re.compile(r"^\s*(?:[-*•]|\d+[.)]|[০-৯]+[.)])\s*")
+
+
+class Command(BaseCommand):
+    help = "Generate health tips ahead of time for every language and season so tip requests never call the LLM."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--per-bucket", type=int, default=10, help="Tips to request per language/season")
+        parser.add_argument("--languages", nargs="+", default=list(LANGUAGE_PROMPTS), choices=list(LANGUAGE_PROMPTS))
+        parser.add_argument("--seasons", nargs="+", default=list(SEASON_PROMPTS), choices=list(SEASON_PROMPTS))
+        parser.add_argument("--replace", action="store_true", help="Delete existing tips in each bucket first")
+
+    def handle(self, *args, **options):
+        ai_service = AIService()
+        created = 0
+
+        for language in options["languages"]:
+            fallback = ai_service._get_fallback_response(language)
+            for season in options["seasons"]:
+                prompt = (
+                    f"Write {options['per_bucket']} different, practical health tips for rural Bangladesh "
+                    f"for {SEASON_PROMPTS[season]}. Write them in {LANGUAGE_PROMPTS[language]}. "
+                    "One tip per line, each under 25 words, no numbering, no extra text."
+                )
+                reply = ai_service.get_ai_response(prompt, language, "health", use_cache=False)
+                if reply == fallback:
+                    self.stderr.write(f"Skipping {language}/{season}: AI service unavailable")
+                    continue
+
+                tips = [_list_marker.sub("", line).strip() for line in reply.splitlines()]
+                tips = [tip for tip in tips if tip]
+                if options["replace"]:
+                    HealthTip.objects.filter(language=language, season=season).delete()
+                for health_tip in HealthTip.objects.bulk_create(
+                    HealthTip(title=tip[:200], content=tip, language=language, season=season)
+                    for tip in tips
+                ):
+                    search.index_object(health_tip)
+                created += len(tips)
+                self.stdout.write(f"{language}/{season}: {len(tips)} tips")
+
+        # bulk_create skips post_save, so the search index above and the pools and packs here are updated explicitly
+        tip_pool.invalidate()
+        if created:
+            bump_version(offline_pack.VERSION_NAME)
+        self.stdout.write(self.style.SUCCESS(f"Created {created} health tips"))
@@ -0,0 +1,46 @@
+from django.core.management.base import BaseCommand
+from django.db.models import Q
+
+from main.geography import normalize_area_name
+from main.models import AreaAlias, HealthEvent, HealthFacility, HealthWorker, Union
+
+
+class Command(BaseCommand):
+    help = "Fill upazila_area/union_area on facilities, events and workers from their free-text upazila/union."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=500)
+
+    def handle(self, *args, **options):
+        # Load the alias table once instead of resolving row by row
+        upazilas = {}
+        unions = {}
+        union_parent = dict(Union.objects.values_list("id", "upazila_id"))
+        for alias, upazila_id, union_id in AreaAlias.objects.values_list("alias", "upazila_id", "union_id"):
+            if upazila_id:
+                upazilas.setdefault(alias, upazila_id)
+            if union_id:
+                unions.setdefault(alias, []).append(union_id)
+
+        for model in (HealthFacility, HealthEvent, HealthWorker):
+            pending = model.objects.filter(Q(upazila_area__isnull=True) | Q(union_area__isnull=True))
+            batch = []
+            linked = 0
+            for obj in pending.only("id", "upazila", "union", "upazila_area", "union_area").iterator():
+                if obj.upazila_area_id is None:
+                    obj.upazila_area_id = upazilas.get(normalize_area_name(obj.upazila))
+                if obj.union_area_id is None:
+                    candidates = unions.get(normalize_area_name(obj.union), [])
+                    if obj.upazila_area_id:
+                        candidates = [c for c in candidates if union_parent.get(c) == obj.upazila_area_id]
+                    if candidates:
+                        obj.union_area_id = candidates[0]
+                        obj.upazila_area_id = obj.upazila_area_id or union_parent.get(candidates[0])
+                if obj.upazila_area_id or obj.union_area_id:
+                    batch.append(obj)
+                if len(batch) >= options["batch_size"]:
+                    linked += model.objects.bulk_update(batch, ["upazila_area", "union_area"])
+                    batch = []
+            if batch:
+                linked += model.objects.bulk_update(batch, ["upazila_area", "union_area"])
+            self.stdout.write(f"{model.__name__}: linked {linked} rows")
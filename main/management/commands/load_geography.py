@@ -0,0 +1,63 @@
+import csv
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from main.geography import normalize_area_name
+from main.models import AreaAlias, District, Division, Union, Upazila
+
+
+class Command(BaseCommand):
+    help = (
+        "Load the Division/District/Upazila/Union reference tables from a CSV with columns "
+        "division, division_bn, district, district_bn, upazila, upazila_bn, union, union_bn "
+        "and optional upazila_aliases / union_aliases (semicolon-separated spellings)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("csv_path")
+
+    @transaction.atomic
+    def handle(self, *args, **options):
+        try:
+            handle = open(options["csv_path"], newline="", encoding="utf-8-sig")
+        except OSError as e:
+            raise CommandError(e)
+
+        counts = {"unions": 0, "aliases": 0}
+        with handle:
+            for row in csv.DictReader(handle):
+                division, _ = Division.objects.get_or_create(
+                    name=row["division"].strip(), defaults={"name_bn": row.get("division_bn", "").strip()}
+                )
+                district, _ = District.objects.get_or_create(
+                    division=division,
+                    name=row["district"].strip(),
+                    defaults={"name_bn": row.get("district_bn", "").strip()},
+                )
+                upazila, _ = Upazila.objects.get_or_create(
+                    district=district,
+                    name=row["upazila"].strip(),
+                    defaults={"name_bn": row.get("upazila_bn", "").strip()},
+                )
+                union = None
+                if row.get("union", "").strip():
+                    union, created = Union.objects.get_or_create(
+                        upazila=upazila,
+                        name=row["union"].strip(),
+                        defaults={"name_bn": row.get("union_bn", "").strip()},
+                    )
+                    counts["unions"] += created
+
+                for column, area, field in (("upazila_aliases", upazila, "upazila"), ("union_aliases", union, "union")):
+                    if area is None:
+                        continue
+                    for spelling in (row.get(column) or "").split(";"):
+                        alias = normalize_area_name(spelling)
+                        if alias:
+                            _, created = AreaAlias.objects.get_or_create(alias=alias, **{field: area})
+                            counts["aliases"] += created
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Loaded {counts['unions']} new unions and {counts['aliases']} new aliases")
+        )
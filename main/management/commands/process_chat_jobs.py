@@ -0,0 +1,25 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from main import chat_jobs
+
+
+class Command(BaseCommand):
+    help = "Answer queued chat jobs (the chat helper's deferred-answer mode) that no background thread finished."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--loop", action="store_true", help="Keep polling instead of running once")
+        parser.add_argument("--interval", type=float, default=2.0, help="Seconds between polls with --loop")
+        parser.add_argument("--batch-size", type=int, default=10)
+
+    def handle(self, *args, **options):
+        while True:
+            close_old_connections()
+            done, failed = chat_jobs.process_due(batch_size=options["batch_size"])
+            if done or failed or not options["loop"]:
+                self.stdout.write(f"Answered {done}, failed {failed}")
+            if not options["loop"]:
+                return
+            time.sleep(options["interval"])
@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from main import rollups
+
+
+class Command(BaseCommand):
+    help = "Recompute the mood and help request rollup tables from the source rows, fixing any drift."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--chunk-size", type=int, default=2000)
+
+    def handle(self, *args, **options):
+        mood_rows, help_rows = rollups.rebuild(chunk_size=options["chunk_size"])
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {mood_rows} mood rows and {help_rows} help request rows"))
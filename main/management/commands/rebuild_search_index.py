@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+
+from main import search
+
+
+class Command(BaseCommand):
+    help = "Rebuild the FTS5 search index over facilities, workers, events and tips."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        if not search.is_available():
+            self.stderr.write("Full-text index needs SQLite; search falls back to icontains here.")
+            return
+        total = search.rebuild(batch_size=options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(f"Indexed {total} rows"))
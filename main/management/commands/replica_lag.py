@@ -0,0 +1,42 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from main.db_router import replica_heartbeat, replicas, write_heartbeat
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure replica lag: write a heartbeat to the primary and time how long each replica takes to see it. "
+        "Run it from cron to keep a fresh heartbeat for dashboards too."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--wait", type=float, default=10.0, help="Seconds to wait for each replica")
+        parser.add_argument("--interval", type=float, default=0.2, help="Seconds between polls")
+
+    def handle(self, *args, **options):
+        aliases = replicas()
+        if not aliases:
+            self.stdout.write("No replicas configured (set DB_REPLICA_PATHS).")
+            return
+
+        beat = write_heartbeat()
+        started = time.monotonic()
+        waiting = set(aliases)
+        while waiting and time.monotonic() - started < options["wait"]:
+            for alias in sorted(waiting):
+                seen = replica_heartbeat(alias)
+                if seen and seen >= beat:
+                    waiting.discard(alias)
+                    self.stdout.write(self.style.SUCCESS(
+                        f"{alias}: caught up in {time.monotonic() - started:.2f}s"
+                    ))
+            if waiting:
+                time.sleep(options["interval"])
+
+        for alias in sorted(waiting):
+            seen = replica_heartbeat(alias)
+            behind = f"{(timezone.now() - seen).total_seconds():.1f}s behind" if seen else "has never seen a heartbeat"
+            self.stdout.write(self.style.WARNING(f"{alias}: not caught up after {options['wait']}s; {behind}"))
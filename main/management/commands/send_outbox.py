@@ -0,0 +1,25 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from main import outbox
+
+
+class Command(BaseCommand):
+    help = "Send due outbox emails (help request notifications and digests) over one SMTP connection per batch."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--loop", action="store_true", help="Keep polling instead of sending once")
+        parser.add_argument("--interval", type=float, default=5.0, help="Seconds between polls with --loop")
+        parser.add_argument("--batch-size", type=int, default=50)
+
+    def handle(self, *args, **options):
+        while True:
+            close_old_connections()
+            sent, failed = outbox.send_due(batch_size=options["batch_size"])
+            if sent or failed or not options["loop"]:
+                self.stdout.write(f"Sent {sent}, failed {failed}")
+            if not options["loop"]:
+                return
+            time.sleep(options["interval"])
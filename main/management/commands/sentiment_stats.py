@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand
+
+from main import sentiment
+
+
+class Command(BaseCommand):
+    help = "Show how often mood sentiment was classified locally versus escalated to the LLM."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--reset", action="store_true", help="Zero the counters")
+
+    def handle(self, *args, **options):
+        if options["reset"]:
+            sentiment.reset_stats()
+            self.stdout.write(self.style.SUCCESS("Sentiment counters reset"))
+
+        stats = sentiment.stats()
+        self.stdout.write(
+            f"local: {stats['local']}  escalated: {stats['escalated']}  "
+            f"escalation rate: {stats['escalation_rate']:.1%}"
+        )
@@ -0,0 +1,30 @@
+import sqlite3
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from main.db_router import PRIMARY, replicas
+
+
+class Command(BaseCommand):
+    help = (
+        "Copy the primary SQLite database into each replica file. Stands in for real replication when "
+        "testing the read/write router locally; run it on a timer to simulate replica lag."
+    )
+
+    def handle(self, *args, **options):
+        primary = settings.DATABASES[PRIMARY]
+        if primary["ENGINE"] != "django.db.backends.sqlite3":
+            raise CommandError("sync_replicas only copies SQLite files; use the database's own replication.")
+
+        source = sqlite3.connect(primary["NAME"])
+        try:
+            for alias in replicas():
+                target = sqlite3.connect(settings.DATABASES[alias]["NAME"])
+                try:
+                    source.backup(target)  # Consistent online copy, even while the primary takes writes
+                finally:
+                    target.close()
+                self.stdout.write(self.style.SUCCESS(f"Copied {PRIMARY} to {alias}"))
+        finally:
+            source.close()
@@ -0,0 +1,239 @@
+# Generated by Django 5.2.7 on 2026-10-17 16:22
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AnonymousHelpRequest',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('help_type', models.CharField(choices=[('mental_health', 'মানসিক স্বাস্থ্য সহায়তা'), ('physical_health', 'শারীরিক স্বাস্থ্য সমস্যা'), ('emergency', 'জরুরী সাহায্য প্রয়োজন'), ('other', 'অন্যান্য')], max_length=20)),
+                ('description', models.TextField()),
+                ('contact_preference', models.CharField(blank=True, max_length=100)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('is_resolved', models.BooleanField(default=False)),
+            ],
+            options={
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='ChildVaccination',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('child_name', models.CharField(max_length=100)),
+                ('birth_date', models.DateField()),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='Division',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100, unique=True)),
+                ('name_bn', models.CharField(blank=True, max_length=100)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='HealthTip',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('title', models.CharField(max_length=200)),
+                ('content', models.TextField()),
+                ('language', models.CharField(choices=[('bn', 'Bengali'), ('en', 'English'), ('mixed', 'Banglish')], default='bn', max_length=10)),
+                ('season', models.CharField(choices=[('all', 'All year'), ('summer', 'Summer (Mar-May)'), ('monsoon', 'Monsoon (Jun-Oct)'), ('winter', 'Winter (Nov-Feb)')], default='all', max_length=10)),
+                ('audio_file', models.FileField(blank=True, null=True, upload_to='health_tips/')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='Hospital',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=200)),
+                ('address', models.TextField()),
+                ('phone', models.CharField(blank=True, max_length=15)),
+                ('latitude', models.FloatField(blank=True, null=True)),
+                ('longitude', models.FloatField(blank=True, null=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='MoodCheckIn',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('mood', models.CharField(choices=[('happy', '😊 খুব ভালো'), ('neutral', '😐 ঠিক আছে'), ('sad', '😔 কিছুটা খারাপ'), ('anxious', '😰 চিন্তিত'), ('angry', '😠 রাগান্বিত')], max_length=20)),
+                ('notes', models.TextField(blank=True)),
+                ('sentiment', models.CharField(blank=True, choices=[('positive', 'Positive'), ('negative', 'Negative'), ('neutral', 'Neutral')], max_length=10)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='OpenRouterChat',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('messages', models.TextField()),
+                ('sentiment', models.CharField(blank=True, choices=[('positive', 'Positive'), ('negative', 'Negative'), ('neutral', 'Neutral')], max_length=10)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='PregnancyTracker',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('last_period_date', models.DateField()),
+                ('expected_delivery_date', models.DateField()),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='SymptomGuideEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=200)),
+                ('category', models.CharField(choices=[('fever', 'জ্বর'), ('respiratory', 'শ্বাসতন্ত্র'), ('digestive', 'পরিপাকতন্ত্র'), ('mental', 'মানসিক স্বাস্থ্য')], max_length=20)),
+                ('description', models.TextField()),
+                ('warning_level', models.CharField(choices=[('low', 'কম'), ('medium', 'মাঝারি'), ('high', 'উচ্চ')], default='low', max_length=10)),
+                ('home_care', models.TextField(blank=True)),
+                ('when_to_see_doctor', models.TextField(blank=True)),
+                ('emergency', models.TextField(blank=True)),
+                ('language', models.CharField(choices=[('bn', 'Bengali'), ('en', 'English'), ('mixed', 'Banglish')], default='bn', max_length=10)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='VoiceCommand',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('command_text', models.CharField(max_length=500)),
+                ('language', models.CharField(max_length=10)),
+                ('response_type', models.CharField(max_length=50)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='District',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100)),
+                ('name_bn', models.CharField(blank=True, max_length=100)),
+                ('division', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='districts', to='main.division')),
+            ],
+            options={
+                'unique_together': {('division', 'name')},
+            },
+        ),
+        migrations.CreateModel(
+            name='Upazila',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100)),
+                ('name_bn', models.CharField(blank=True, max_length=100)),
+                ('district', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='upazilas', to='main.district')),
+            ],
+            options={
+                'unique_together': {('district', 'name')},
+            },
+        ),
+        migrations.CreateModel(
+            name='Union',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100)),
+                ('name_bn', models.CharField(blank=True, max_length=100)),
+                ('upazila', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='unions', to='main.upazila')),
+            ],
+            options={
+                'unique_together': {('upazila', 'name')},
+            },
+        ),
+        migrations.CreateModel(
+            name='HealthWorker',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100)),
+                ('phone', models.CharField(max_length=15)),
+                ('whatsapp_available', models.BooleanField(default=False)),
+                ('village', models.CharField(max_length=100)),
+                ('union', models.CharField(max_length=100)),
+                ('upazila', models.CharField(max_length=100)),
+                ('skills', models.CharField(max_length=200)),
+                ('training_organization', models.CharField(max_length=200)),
+                ('available_hours', models.CharField(max_length=100)),
+                ('is_verified', models.BooleanField(default=False)),
+                ('languages', models.CharField(default='বাংলা', max_length=100)),
+                ('union_area', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='workers', to='main.union')),
+                ('upazila_area', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='workers', to='main.upazila')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='HealthFacility',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=200)),
+                ('facility_type', models.CharField(choices=[('clinic', 'কমিউনিটি ক্লিনিক'), ('hospital', 'হাসপাতাল'), ('pharmacy', 'ফার্মেসি'), ('chw', 'কমিউনিটি স্বাস্থ্যকর্মী')], max_length=20)),
+                ('address', models.TextField()),
+                ('upazila', models.CharField(max_length=100)),
+                ('union', models.CharField(max_length=100)),
+                ('contact', models.CharField(blank=True, max_length=20)),
+                ('hours', models.CharField(blank=True, max_length=100)),
+                ('latitude', models.FloatField(blank=True, null=True)),
+                ('longitude', models.FloatField(blank=True, null=True)),
+                ('union_area', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='facilities', to='main.union')),
+                ('upazila_area', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='facilities', to='main.upazila')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='HealthEvent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('title', models.CharField(max_length=200)),
+                ('event_type', models.CharField(choices=[('health_camp', 'স্বাস্থ্য ক্যাম্প'), ('vaccination', 'টিকাদান কর্মসূচী'), ('screening', 'স্বাস্থ্য স্ক্রীনিং'), ('awareness', 'সচেতনতা সেশন'), ('blood_donation', 'রক্তদান শিবির')], max_length=20)),
+                ('description', models.TextField()),
+                ('date', models.DateField()),
+                ('start_time', models.TimeField()),
+                ('end_time', models.TimeField()),
+                ('location', models.TextField()),
+                ('upazila', models.CharField(max_length=100)),
+                ('union', models.CharField(max_length=100)),
+                ('organizer', models.CharField(max_length=200)),
+                ('contact', models.CharField(blank=True, max_length=20)),
+                ('is_active', models.BooleanField(default=True)),
+                ('union_area', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='events', to='main.union')),
+                ('upazila_area', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='events', to='main.upazila')),
+            ],
+            options={
+                'ordering': ['date', 'start_time'],
+            },
+        ),
+        migrations.CreateModel(
+            name='AreaAlias',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('alias', models.CharField(db_index=True, max_length=100)),
+                ('union', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='aliases', to='main.union')),
+                ('upazila', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='aliases', to='main.upazila')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='VaccinationRecord',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('vaccine_type', models.CharField(choices=[('bcg', 'BCG (যক্ষ্মা)'), ('opv0', 'OPV-0 (পোলিও)'), ('penta1', 'Penta-1 (পেন্টাভ্যালেন্ট)'), ('penta2', 'Penta-2 (পেন্টাভ্যালেন্ট)'), ('penta3', 'Penta-3 (পেন্টাভ্যালেন্ট)'), ('mr1', 'MR-1 (হাম ও রুবেলা)'), ('mr2', 'MR-2 (হাম ও রুবেলা)')], max_length=20)),
+                ('scheduled_date', models.DateField()),
+                ('administered_date', models.DateField(blank=True, null=True)),
+                ('is_completed', models.BooleanField(default=False)),
+                ('child', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='main.childvaccination')),
+            ],
+        ),
+    ]
@@ -0,0 +1,60 @@
+# Generated by Django 5.2.7 on 2026-10-17 16:22
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def adopt_legacy_schema(apps, schema_editor):
+    """Create whatever the initial migration would have, for databases that only recorded it.
+
+    Databases built before these migrations were written carry a
+    ``main.0001_initial`` record from an older migration set, or none at all
+    when faked, while missing several of its tables and columns. Every
+    column added here is nullable or has a default; on a database that really
+    ran 0001 this does nothing.
+    """
+    connection = schema_editor.connection
+    with connection.cursor() as cursor:
+        tables = set(connection.introspection.table_names(cursor))
+        for model in apps.get_app_config("main").get_models():
+            table = model._meta.db_table
+            if table not in tables:
+                schema_editor.create_model(model)
+                continue
+            columns = {column.name for column in connection.introspection.get_table_description(cursor, table)}
+            for field in model._meta.local_fields:
+                if field.column not in columns:
+                    schema_editor.add_field(model, field)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(adopt_legacy_schema, migrations.RunPython.noop),
+        migrations.CreateModel(
+            name='Conversation',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('channel', models.CharField(choices=[('chat', 'Mood tracker chat'), ('voice', 'Voice assistant')], default='chat', max_length=10)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='ChatMessage',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('role', models.CharField(choices=[('user', 'User'), ('assistant', 'Assistant')], max_length=10)),
+                ('content', models.TextField()),
+                ('sentiment', models.CharField(blank=True, choices=[('positive', 'Positive'), ('negative', 'Negative'), ('neutral', 'Neutral')], max_length=10)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('conversation', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='messages', to='main.conversation')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['conversation', 'id'], name='chatmessage_conv_id_idx'), models.Index(fields=['role', 'created_at'], name='chatmessage_role_created_idx')],
+            },
+        ),
+    ]
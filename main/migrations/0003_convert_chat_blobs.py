@@ -0,0 +1,83 @@
+from django.db import migrations
+
+BATCH_SIZE = 500
+AI_MARKER = "\nAI: "
+
+
+def split_blob(blob):
+    """"User: ...\\nAI: ..." -> (user, ai), keeping any extra lines of either side"""
+    user, _, ai = blob.partition(AI_MARKER)
+    if user.startswith("User: "):
+        user = user[len("User: "):]
+    return user.strip(), ai.strip()
+
+
+def blobs_to_messages(apps, schema_editor):
+    """Each old exchange becomes its own conversation with a user and an assistant message"""
+    if "main_openrouterchat" not in schema_editor.connection.introspection.table_names():
+        return  # Nothing to convert on a database that never stored chats as blobs
+    OpenRouterChat = apps.get_model("main", "OpenRouterChat")
+    Conversation = apps.get_model("main", "Conversation")
+    ChatMessage = apps.get_model("main", "ChatMessage")
+
+    batch = []
+    for chat in OpenRouterChat.objects.order_by("id").iterator(chunk_size=BATCH_SIZE):
+        batch.append(chat)
+        if len(batch) >= BATCH_SIZE:
+            _convert(batch, Conversation, ChatMessage)
+            batch = []
+    if batch:
+        _convert(batch, Conversation, ChatMessage)
+
+
+def _convert(chats, Conversation, ChatMessage):
+    conversations = Conversation.objects.bulk_create(Conversation(channel="chat") for _ in chats)
+    messages = []
+    for chat, conversation in zip(chats, conversations):
+        user, ai = split_blob(chat.messages)
+        messages.append(ChatMessage(conversation=conversation, role="user", content=user, sentiment=chat.sentiment))
+        if ai:
+            messages.append(ChatMessage(conversation=conversation, role="assistant", content=ai))
+    ChatMessage.objects.bulk_create(messages)
+    # auto_now_add fields ignore explicit values on insert; carry the original times over afterwards
+    for chat, conversation in zip(chats, conversations):
+        conversation.created_at = chat.created_at
+    Conversation.objects.bulk_update(conversations, ["created_at"])
+    for message in messages:
+        message.created_at = message.conversation.created_at
+    ChatMessage.objects.bulk_update(messages, ["created_at"])
+
+
+def messages_to_blobs(apps, schema_editor):
+    OpenRouterChat = apps.get_model("main", "OpenRouterChat")
+    ChatMessage = apps.get_model("main", "ChatMessage")
+
+    blobs = []
+    user = None
+    for message in ChatMessage.objects.order_by("conversation_id", "id").iterator(chunk_size=BATCH_SIZE):
+        if message.role == "user":
+            if user:
+                blobs.append(OpenRouterChat(messages=f"User: {user.content}{AI_MARKER}", sentiment=user.sentiment))
+            user = message
+        elif user and user.conversation_id == message.conversation_id:
+            blobs.append(OpenRouterChat(
+                messages=f"User: {user.content}{AI_MARKER}{message.content}", sentiment=user.sentiment
+            ))
+            user = None
+        if len(blobs) >= BATCH_SIZE:
+            OpenRouterChat.objects.bulk_create(blobs)
+            blobs = []
+    if user:
+        blobs.append(OpenRouterChat(messages=f"User: {user.content}{AI_MARKER}", sentiment=user.sentiment))
+    OpenRouterChat.objects.bulk_create(blobs)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("main", "0002_conversation_chatmessage"),
+    ]
+
+    operations = [
+        migrations.RunPython(blobs_to_messages, messages_to_blobs),
+    ]
@@ -0,0 +1,16 @@
+# Generated by Django 5.2.7 on 2026-10-17 16:22
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0003_convert_chat_blobs'),
+    ]
+
+    operations = [
+        migrations.DeleteModel(
+            name='OpenRouterChat',
+        ),
+    ]
@@ -0,0 +1,57 @@
+# Generated by Django 5.2.7 on 2026-10-17 17:20
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0004_delete_openrouterchat'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='anonymoushelprequest',
+            name='resolved_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='anonymoushelprequest',
+            name='union_area',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='help_requests', to='main.union'),
+        ),
+        migrations.AddField(
+            model_name='moodcheckin',
+            name='union_area',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='mood_checkins', to='main.union'),
+        ),
+        migrations.CreateModel(
+            name='HelpRequestRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('help_type', models.CharField(choices=[('mental_health', 'মানসিক স্বাস্থ্য সহায়তা'), ('physical_health', 'শারীরিক স্বাস্থ্য সমস্যা'), ('emergency', 'জরুরী সাহায্য প্রয়োজন'), ('other', 'অন্যান্য')], max_length=20)),
+                ('count', models.IntegerField(default=0)),
+                ('resolved_count', models.IntegerField(default=0)),
+                ('response_seconds', models.BigIntegerField(default=0)),
+                ('union', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='main.union')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('day', 'union', 'help_type'), name='helprollup_unique_key'), models.UniqueConstraint(condition=models.Q(('union__isnull', True)), fields=('day', 'help_type'), name='helprollup_unique_no_union')],
+            },
+        ),
+        migrations.CreateModel(
+            name='MoodRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('mood', models.CharField(choices=[('happy', '😊 খুব ভালো'), ('neutral', '😐 ঠিক আছে'), ('sad', '😔 কিছুটা খারাপ'), ('anxious', '😰 চিন্তিত'), ('angry', '😠 রাগান্বিত')], max_length=20)),
+                ('count', models.IntegerField(default=0)),
+                ('union', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='main.union')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('day', 'union', 'mood'), name='moodrollup_unique_key'), models.UniqueConstraint(condition=models.Q(('union__isnull', True)), fields=('day', 'mood'), name='moodrollup_unique_no_union')],
+            },
+        ),
+    ]
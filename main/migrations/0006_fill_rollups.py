@@ -0,0 +1,51 @@
+from collections import Counter
+
+from django.db import migrations
+from django.utils import timezone
+
+BATCH_SIZE = 2000
+
+
+def fill_rollups(apps, schema_editor):
+    """Count the rows that predate the rollups; none have a union or a resolved_at yet"""
+    MoodCheckIn = apps.get_model("main", "MoodCheckIn")
+    AnonymousHelpRequest = apps.get_model("main", "AnonymousHelpRequest")
+    MoodRollup = apps.get_model("main", "MoodRollup")
+    HelpRequestRollup = apps.get_model("main", "HelpRequestRollup")
+
+    moods = Counter(
+        (timezone.localdate(created_at), mood)
+        for created_at, mood in MoodCheckIn.objects.values_list("created_at", "mood").iterator(chunk_size=BATCH_SIZE)
+    )
+    MoodRollup.objects.bulk_create(
+        (MoodRollup(day=day, mood=mood, count=count) for (day, mood), count in moods.items()),
+        batch_size=BATCH_SIZE,
+    )
+
+    help_types = Counter(
+        (timezone.localdate(created_at), help_type)
+        for created_at, help_type in AnonymousHelpRequest.objects.values_list(
+            "created_at", "help_type"
+        ).iterator(chunk_size=BATCH_SIZE)
+    )
+    HelpRequestRollup.objects.bulk_create(
+        (HelpRequestRollup(day=day, help_type=help_type, count=count)
+         for (day, help_type), count in help_types.items()),
+        batch_size=BATCH_SIZE,
+    )
+
+
+def empty_rollups(apps, schema_editor):
+    apps.get_model("main", "MoodRollup").objects.all().delete()
+    apps.get_model("main", "HelpRequestRollup").objects.all().delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0005_rollups'),
+    ]
+
+    operations = [
+        migrations.RunPython(fill_rollups, empty_rollups),
+    ]
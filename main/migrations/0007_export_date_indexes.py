@@ -0,0 +1,29 @@
+# Generated by Django 5.2.7 on 2026-10-17 17:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0006_fill_rollups'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='anonymoushelprequest',
+            index=models.Index(fields=['created_at'], name='helprequest_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='chatmessage',
+            index=models.Index(fields=['created_at'], name='chatmessage_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='moodcheckin',
+            index=models.Index(fields=['created_at'], name='moodcheckin_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='vaccinationrecord',
+            index=models.Index(fields=['scheduled_date'], name='vaccination_scheduled_idx'),
+        ),
+    ]
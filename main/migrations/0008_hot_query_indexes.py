@@ -0,0 +1,57 @@
+# Generated by Django 5.2.7 on 2026-10-17 17:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0007_export_date_indexes'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='vaccinationrecord',
+            name='vaccination_scheduled_idx',
+        ),
+        migrations.AddIndex(
+            model_name='anonymoushelprequest',
+            index=models.Index(fields=['is_resolved', 'created_at'], name='helprequest_resolved_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='anonymoushelprequest',
+            index=models.Index(fields=['union_area', 'created_at'], name='helprequest_union_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='healthevent',
+            index=models.Index(fields=['union_area', 'is_active', 'date'], name='event_union_active_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='healthevent',
+            index=models.Index(fields=['upazila_area', 'is_active', 'date'], name='event_upazila_active_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='healthevent',
+            index=models.Index(fields=['date', 'is_active'], name='event_date_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='healthfacility',
+            index=models.Index(fields=['upazila_area', 'facility_type'], name='facility_upazila_type_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='healthtip',
+            index=models.Index(fields=['language', 'season'], name='healthtip_language_season_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='moodcheckin',
+            index=models.Index(fields=['union_area', 'created_at'], name='moodcheckin_union_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='symptomguideentry',
+            index=models.Index(fields=['language'], name='symptom_language_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='vaccinationrecord',
+            index=models.Index(fields=['scheduled_date', 'is_completed'], name='vaccination_scheduled_idx'),
+        ),
+    ]
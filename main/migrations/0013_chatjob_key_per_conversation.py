@@ -0,0 +1,22 @@
+# Generated by Django 5.2.7 on 2026-10-17 17:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0012_backfillcheckpoint'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='chatjob',
+            name='idempotency_key',
+            field=models.CharField(max_length=64),
+        ),
+        migrations.AddConstraint(
+            model_name='chatjob',
+            constraint=models.UniqueConstraint(fields=('conversation', 'idempotency_key'), name='chatjob_unique_key'),
+        ),
+    ]
@@ -1,5 +1,70 @@
+import uuid
+
 from django.db import models
 from datetime import timedelta
+from django.utils import timezone
+
+
+class Division(models.Model):
+    """Administrative geography: Division -> District -> Upazila -> Union.
+
+    Facilities, events and workers point at Upazila/Union by id so area
+    filters are indexed equality joins; AreaAlias maps Bangla and Latin
+    spellings onto those ids (see main/geography.py).
+    """
+
+    name = models.CharField(max_length=100, unique=True)
+    name_bn = models.CharField(max_length=100, blank=True)
+
+    def __str__(self):
+        return self.name
+
+
+class District(models.Model):
+    division = models.ForeignKey(Division, on_delete=models.PROTECT, related_name="districts")
+    name = models.CharField(max_length=100)
+    name_bn = models.CharField(max_length=100, blank=True)
+
+    class Meta:
+        unique_together = [("division", "name")]
+
+    def __str__(self):
+        return self.name
+
+
+class Upazila(models.Model):
+    district = models.ForeignKey(District, on_delete=models.PROTECT, related_name="upazilas")
+    name = models.CharField(max_length=100)
+    name_bn = models.CharField(max_length=100, blank=True)
+
+    class Meta:
+        unique_together = [("district", "name")]
+
+    def __str__(self):
+        return self.name
+
+
+class Union(models.Model):
+    upazila = models.ForeignKey(Upazila, on_delete=models.PROTECT, related_name="unions")
+    name = models.CharField(max_length=100)
+    name_bn = models.CharField(max_length=100, blank=True)
+
+    class Meta:
+        unique_together = [("upazila", "name")]
+
+    def __str__(self):
+        return self.name
+
+
+class AreaAlias(models.Model):
+    """A normalized spelling of an upazila or union name (exactly one of the two is set)"""
+
+    alias = models.CharField(max_length=100, db_index=True)
+    upazila = models.ForeignKey(Upazila, null=True, blank=True, on_delete=models.CASCADE, related_name="aliases")
+    union = models.ForeignKey(Union, null=True, blank=True, on_delete=models.CASCADE, related_name="aliases")
+
+    def __str__(self):
+        return self.alias
 
 
 class MoodCheckIn(models.Model):
@@ -11,12 +76,28 @@ class MoodCheckIn(models.Model):
         ("angry", "😠 রাগান্বিত"),
     ]
 
+    SENTIMENT_CHOICES = [
+        ("positive", "Positive"),
+        ("negative", "Negative"),
+        ("neutral", "Neutral"),
+    ]
+
     mood = models.CharField(max_length=20, choices=MOOD_CHOICES)
     notes = models.TextField(blank=True)
+    # Label for notes, filled by `manage.py backfill_sentiment`; blank until labelled
+    sentiment = models.CharField(max_length=10, choices=SENTIMENT_CHOICES, blank=True)
+    union_area = models.ForeignKey(
+        Union, null=True, blank=True, on_delete=models.SET_NULL, related_name="mood_checkins"
+    )
     created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["created_at"], name="moodcheckin_created_idx"),
+            # Per-union exports stream in date order without a sort
+            models.Index(fields=["union_area", "created_at"], name="moodcheckin_union_created_idx"),
+        ]
 
 
 class HealthFacility(models.Model):
@@ -34,6 +115,20 @@ class HealthFacility(models.Model):
     union = models.CharField(max_length=100)
     contact = models.CharField(max_length=20, blank=True)
     hours = models.CharField(max_length=100, blank=True)
+    latitude = models.FloatField(null=True, blank=True)
+    longitude = models.FloatField(null=True, blank=True)
+    upazila_area = models.ForeignKey(
+        Upazila, null=True, blank=True, on_delete=models.SET_NULL, related_name="facilities"
+    )
+    union_area = models.ForeignKey(
+        Union, null=True, blank=True, on_delete=models.SET_NULL, related_name="facilities"
+    )
+
+    class Meta:
+        indexes = [
+            # Offline pack: an upazila's hospitals; also serves the plain upazila_area filter on the map
+            models.Index(fields=["upazila_area", "facility_type"], name="facility_upazila_type_idx"),
+        ]
 
     def __str__(self):
         return self.name
@@ -50,11 +145,21 @@ class AnonymousHelpRequest(models.Model):
     help_type = models.CharField(max_length=20, choices=HELP_TYPES)
     description = models.TextField()
     contact_preference = models.CharField(max_length=100, blank=True)
+    union_area = models.ForeignKey(
+        Union, null=True, blank=True, on_delete=models.SET_NULL, related_name="help_requests"
+    )
     created_at = models.DateTimeField(auto_now_add=True)
     is_resolved = models.BooleanField(default=False)
+    resolved_at = models.DateTimeField(null=True, blank=True)  # Set when is_resolved is first ticked
 
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["created_at"], name="helprequest_created_idx"),
+            # Admin "is_resolved" filter, newest first
+            models.Index(fields=["is_resolved", "created_at"], name="helprequest_resolved_idx"),
+            models.Index(fields=["union_area", "created_at"], name="helprequest_union_created_idx"),
+        ]
 
 
 class PregnancyTracker(models.Model):
@@ -92,6 +197,12 @@ class VaccinationRecord(models.Model):
     administered_date = models.DateField(null=True, blank=True)
     is_completed = models.BooleanField(default=False)
 
+    class Meta:
+        indexes = [
+            # Date-range exports and vaccination coverage counts
+            models.Index(fields=["scheduled_date", "is_completed"], name="vaccination_scheduled_idx"),
+        ]
+
 
 class HealthEvent(models.Model):
     EVENT_TYPES = [
@@ -114,9 +225,22 @@ class HealthEvent(models.Model):
     organizer = models.CharField(max_length=200)
     contact = models.CharField(max_length=20, blank=True)
     is_active = models.BooleanField(default=True)
+    upazila_area = models.ForeignKey(
+        Upazila, null=True, blank=True, on_delete=models.SET_NULL, related_name="events"
+    )
+    union_area = models.ForeignKey(
+        Union, null=True, blank=True, on_delete=models.SET_NULL, related_name="events"
+    )
 
     class Meta:
         ordering = ["date", "start_time"]
+        indexes = [
+            # Offline pack: a union's or upazila's upcoming active events
+            models.Index(fields=["union_area", "is_active", "date"], name="event_union_active_date_idx"),
+            models.Index(fields=["upazila_area", "is_active", "date"], name="event_upazila_active_date_idx"),
+            # Snapshot date windows
+            models.Index(fields=["date", "is_active"], name="event_date_active_idx"),
+        ]
 
 
 class HealthWorker(models.Model):
@@ -136,6 +260,12 @@ class HealthWorker(models.Model):
     village = models.CharField(max_length=100)
     union = models.CharField(max_length=100)
     upazila = models.CharField(max_length=100)
+    upazila_area = models.ForeignKey(
+        Upazila, null=True, blank=True, on_delete=models.SET_NULL, related_name="workers"
+    )
+    union_area = models.ForeignKey(
+        Union, null=True, blank=True, on_delete=models.SET_NULL, related_name="workers"
+    )
     skills = models.CharField(max_length=200)  # Comma-separated skills
     training_organization = models.CharField(max_length=200)
     available_hours = models.CharField(max_length=100)
@@ -146,30 +276,71 @@ class HealthWorker(models.Model):
         return self.name
 
 
-class OpenRouterChat(models.Model):
-    """Simple model to persist chat exchanges from the mood tracker chat helper.
+class Conversation(models.Model):
+    """One chat thread: the mood tracker chat helper or a voice assistant session.
 
-    We store a small text blob where each exchange is two lines:
-    User: ...\nAI: ...
+    Browsers keep their conversation id in the session; messages are paged
+    newest-first by id (see ChatMessage).
     """
-    messages = models.TextField()  # Stores the conversation history (simple two-line format)
+    CHANNEL_CHOICES = [
+        ("chat", "Mood tracker chat"),
+        ("voice", "Voice assistant"),
+    ]
+
+    channel = models.CharField(max_length=10, choices=CHANNEL_CHOICES, default="chat")
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"Conversation {self.id}"
+
+
+class ChatMessage(models.Model):
+    ROLE_CHOICES = [
+        ("user", "User"),
+        ("assistant", "Assistant"),
+    ]
+
+    conversation = models.ForeignKey(Conversation, on_delete=models.CASCADE, related_name="messages")
+    role = models.CharField(max_length=10, choices=ROLE_CHOICES)
+    content = models.TextField()
+    # Label for user messages, filled by `manage.py backfill_sentiment`; blank until labelled
+    sentiment = models.CharField(max_length=10, choices=MoodCheckIn.SENTIMENT_CHOICES, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            # Keyset pagination: WHERE conversation_id = ? AND id < ? ORDER BY id DESC
+            models.Index(fields=["conversation", "id"], name="chatmessage_conv_id_idx"),
+            models.Index(fields=["role", "created_at"], name="chatmessage_role_created_idx"),
+            models.Index(fields=["created_at"], name="chatmessage_created_idx"),
+        ]
+
     def __str__(self):
-        return f"Chat {self.id}"
+        return f"{self.role}: {self.content[:50]}"
 
 class HealthTip(models.Model):
     LANGUAGE_CHOICES = [
         ('bn', 'Bengali'),
         ('en', 'English'),
+        ('mixed', 'Banglish'),
+    ]
+    SEASON_CHOICES = [
+        ('all', 'All year'),
+        ('summer', 'Summer (Mar-May)'),
+        ('monsoon', 'Monsoon (Jun-Oct)'),
+        ('winter', 'Winter (Nov-Feb)'),
     ]
     
     title = models.CharField(max_length=200)
     content = models.TextField()
-    language = models.CharField(max_length=2, choices=LANGUAGE_CHOICES, default='bn')
+    language = models.CharField(max_length=10, choices=LANGUAGE_CHOICES, default='bn')
+    season = models.CharField(max_length=10, choices=SEASON_CHOICES, default='all')
     audio_file = models.FileField(upload_to='health_tips/', blank=True, null=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [models.Index(fields=['language', 'season'], name='healthtip_language_season_idx')]
+
 class Hospital(models.Model):
     name = models.CharField(max_length=200)
     address = models.TextField()
@@ -181,4 +352,163 @@ class VoiceCommand(models.Model):
     command_text = models.CharField(max_length=500)
     language = models.CharField(max_length=10)
     response_type = models.CharField(max_length=50)
-    created_at = models.DateTimeField(auto_now_add=True)
\ No newline at end of file
+    created_at = models.DateTimeField(auto_now_add=True)
+
+class SymptomGuideEntry(models.Model):
+    """Symptom guide reference data, shipped to phones in the offline pack (see main/offline_pack.py)."""
+    CATEGORY_CHOICES = [
+        ('fever', 'জ্বর'),
+        ('respiratory', 'শ্বাসতন্ত্র'),
+        ('digestive', 'পরিপাকতন্ত্র'),
+        ('mental', 'মানসিক স্বাস্থ্য'),
+    ]
+    WARNING_LEVELS = [
+        ('low', 'কম'),
+        ('medium', 'মাঝারি'),
+        ('high', 'উচ্চ'),
+    ]
+
+    name = models.CharField(max_length=200)
+    category = models.CharField(max_length=20, choices=CATEGORY_CHOICES)
+    description = models.TextField()
+    warning_level = models.CharField(max_length=10, choices=WARNING_LEVELS, default='low')
+    home_care = models.TextField(blank=True)  # One step per line
+    when_to_see_doctor = models.TextField(blank=True)  # One sign per line
+    emergency = models.TextField(blank=True)  # When to go to hospital right away
+    language = models.CharField(max_length=10, choices=HealthTip.LANGUAGE_CHOICES, default='bn')
+
+    class Meta:
+        indexes = [models.Index(fields=['language'], name='symptom_language_idx')]
+
+    def __str__(self):
+        return self.name
+
+
+class MoodRollup(models.Model):
+    """Mood check-in counts per day, union and mood, maintained on insert by main/rollups.py."""
+    day = models.DateField()
+    union = models.ForeignKey(Union, null=True, blank=True, on_delete=models.CASCADE, related_name="+")
+    mood = models.CharField(max_length=20, choices=MoodCheckIn.MOOD_CHOICES)
+    count = models.IntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["day", "union", "mood"], name="moodrollup_unique_key"),
+            # NULLs never collide in a unique index, so rows without a union need their own
+            models.UniqueConstraint(
+                fields=["day", "mood"], condition=models.Q(union__isnull=True), name="moodrollup_unique_no_union"
+            ),
+        ]
+
+
+class HelpRequestRollup(models.Model):
+    """Help request counts and response times per day, union and help type (see main/rollups.py)."""
+    day = models.DateField()
+    union = models.ForeignKey(Union, null=True, blank=True, on_delete=models.CASCADE, related_name="+")
+    help_type = models.CharField(max_length=20, choices=AnonymousHelpRequest.HELP_TYPES)
+    count = models.IntegerField(default=0)
+    resolved_count = models.IntegerField(default=0)
+    response_seconds = models.BigIntegerField(default=0)  # Summed over resolved requests
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["day", "union", "help_type"], name="helprollup_unique_key"),
+            models.UniqueConstraint(
+                fields=["day", "help_type"], condition=models.Q(union__isnull=True),
+                name="helprollup_unique_no_union",
+            ),
+        ]
+
+
+class ReplicationHeartbeat(models.Model):
+    """A timestamp written to the primary; how old a replica's copy is gives its lag (see main/db_router.py)."""
+    beat_at = models.DateTimeField()
+
+
+class OutboxEmail(models.Model):
+    """A notification waiting to be sent by `manage.py send_outbox` (see main/outbox.py)."""
+    PRIORITY_CHOICES = [
+        ("immediate", "Immediate"),
+        ("digest", "Digest"),
+    ]
+    STATUS_CHOICES = [
+        ("pending", "Pending"),
+        ("sending", "Sending"),
+        ("sent", "Sent"),
+        ("failed", "Failed"),
+    ]
+
+    subject = models.CharField(max_length=200)
+    body = models.TextField()
+    recipients = models.JSONField()
+    priority = models.CharField(max_length=10, choices=PRIORITY_CHOICES, default="immediate")
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default="pending")
+    attempts = models.PositiveSmallIntegerField(default=0)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    claimed_at = models.DateTimeField(null=True, blank=True)  # Set while a sender holds the row
+    last_error = models.TextField(blank=True)
+    help_request = models.ForeignKey(
+        AnonymousHelpRequest, null=True, blank=True, on_delete=models.SET_NULL, related_name="notifications"
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            # The sender's poll: due rows of one priority, oldest first
+            models.Index(fields=["status", "priority", "next_attempt_at"], name="outbox_due_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.subject} ({self.status})"
+
+
+class ChatJob(models.Model):
+    """A chat message answered in the background, for clients on links too flaky to wait (see main/chat_jobs.py).
+
+    The random id is what the client polls with; the client-chosen
+    idempotency key makes a resubmitted message find its existing job
+    instead of asking the model again.
+    """
+    STATUS_CHOICES = [
+        ("pending", "Pending"),
+        ("running", "Running"),
+        ("done", "Done"),
+        ("failed", "Failed"),
+    ]
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    idempotency_key = models.CharField(max_length=64)
+    conversation = models.ForeignKey(Conversation, on_delete=models.CASCADE, related_name="jobs")
+    message = models.TextField()
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default="pending")
+    attempts = models.PositiveSmallIntegerField(default=0)
+    claimed_at = models.DateTimeField(null=True, blank=True)  # Set while a worker holds the job
+    last_error = models.TextField(blank=True)
+    user_message = models.ForeignKey(ChatMessage, null=True, blank=True, on_delete=models.SET_NULL, related_name="+")
+    reply = models.ForeignKey(ChatMessage, null=True, blank=True, on_delete=models.SET_NULL, related_name="+")
+    created_at = models.DateTimeField(auto_now_add=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        constraints = [
+            # Keys are chosen by clients, so they only need to be unique within one conversation
+            models.UniqueConstraint(fields=["conversation", "idempotency_key"], name="chatjob_unique_key"),
+        ]
+        indexes = [
+            # The worker's poll: unfinished jobs, oldest first
+            models.Index(fields=["status", "created_at"], name="chatjob_due_idx"),
+        ]
+
+    def __str__(self):
+        return f"Job {self.id} ({self.status})"
+
+
+class BackfillCheckpoint(models.Model):
+    """The last row id a resumable backfill finished, kept until it runs with --restart (see backfill_sentiment)."""
+    name = models.CharField(max_length=50, unique=True)
+    last_id = models.BigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.name}: {self.last_id}"
@@ -0,0 +1,136 @@
+"""Per-union offline packs: one gzip-compressed JSON bundle of reference data.
+
+A pack holds everything a phone needs to browse its union without a
+connection: the union's facilities (plus hospitals anywhere in its
+upazila), its health workers, upcoming events, symptom guide entries and
+health tips in the requested language.
+
+Packs are built once, compressed with a fixed gzip mtime so identical
+content always yields identical bytes, and kept in the shared cache. The
+strong ETag is the SHA-256 of the uncompressed JSON, so a phone that
+already holds the current pack revalidates with a bodyless 304.
+
+Any write to a table that feeds the packs bumps the ``offline-pack``
+version (see ``main.signals``), which retires every cached pack at once.
+The build date is part of the cache key too, because events drop out of
+a pack once their day has passed.
+"""
+
+import gzip
+import hashlib
+import json
+from collections import namedtuple
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Q
+from django.utils import timezone
+
+from .versions import get_version
+
+VERSION_NAME = "offline-pack"
+PACK_FORMAT = 1
+
+Pack = namedtuple("Pack", ["etag", "body", "size"])  # body is gzip bytes, size the uncompressed length
+
+
+def _cache():
+    return caches[getattr(settings, "OFFLINE_PACK_CACHE_ALIAS", "shared")]
+
+
+def _lines(text):
+    return [line.strip() for line in text.splitlines() if line.strip()]
+
+
+def build_pack(union, language):
+    """The pack contents for a Union, as plain JSON-ready data"""
+    from .models import HealthEvent, HealthFacility, HealthTip, HealthWorker, SymptomGuideEntry
+
+    upazila = union.upazila
+    facilities = HealthFacility.objects.filter(
+        Q(union_area=union) | Q(upazila_area=upazila, facility_type="hospital")
+    ).order_by("id")
+    workers = HealthWorker.objects.filter(union_area=union).order_by("id")
+    # Upazila-wide events (no union set) are relevant to every union in the upazila
+    events = HealthEvent.objects.filter(
+        Q(union_area=union) | Q(upazila_area=upazila, union_area__isnull=True),
+        is_active=True,
+        date__gte=timezone.localdate(),
+    ).order_by("date", "start_time", "id")
+    symptoms = SymptomGuideEntry.objects.filter(language=language).order_by("id")
+    tips = HealthTip.objects.filter(language=language).order_by("id")
+
+    return {
+        "format": PACK_FORMAT,
+        "language": language,
+        "union": {
+            "id": union.id,
+            "name": union.name,
+            "name_bn": union.name_bn,
+            "upazila": {"id": upazila.id, "name": upazila.name, "name_bn": upazila.name_bn},
+        },
+        "facilities": list(facilities.values(
+            "id", "name", "facility_type", "address", "contact", "hours", "latitude", "longitude"
+        )),
+        "workers": [
+            {
+                "id": worker.id,
+                "name": worker.name,
+                "phone": worker.phone,
+                "whatsapp_available": worker.whatsapp_available,
+                "village": worker.village,
+                "skills": [skill.strip() for skill in worker.skills.split(",") if skill.strip()],
+                "available_hours": worker.available_hours,
+                "languages": worker.languages,
+                "is_verified": worker.is_verified,
+            }
+            for worker in workers
+        ],
+        "events": list(events.values(
+            "id", "title", "event_type", "description", "date", "start_time", "end_time",
+            "location", "organizer", "contact",
+        )),
+        # Same shape as the symptom guide page's own symptomsData
+        "symptoms": [
+            {
+                "id": entry.id,
+                "category": entry.category,
+                "name": entry.name,
+                "description": entry.description,
+                "warningLevel": entry.warning_level,
+                "homeCare": _lines(entry.home_care),
+                "whenToSeeDoctor": _lines(entry.when_to_see_doctor),
+                "emergency": entry.emergency,
+            }
+            for entry in symptoms
+        ],
+        "tips": list(tips.values("id", "title", "content", "season")),
+    }
+
+
+def encode_pack(data):
+    """Serialize deterministically and compress; returns a Pack"""
+    raw = json.dumps(
+        data, cls=DjangoJSONEncoder, ensure_ascii=False, sort_keys=True, separators=(",", ":")
+    ).encode("utf-8")
+    etag = '"%s"' % hashlib.sha256(raw).hexdigest()
+    return Pack(etag, gzip.compress(raw, compresslevel=9, mtime=0), len(raw))
+
+
+def get_pack(union_id, language="bn"):
+    """The current Pack for a union, building it on a cache miss; None for an unknown union"""
+    from .models import Union
+
+    key = f"offline-pack:{union_id}:{language}:{get_version(VERSION_NAME)}:{timezone.localdate().isoformat()}"
+    cache = _cache()
+    pack = cache.get(key)
+    if pack is not None:
+        return Pack(*pack)
+
+    union = Union.objects.select_related("upazila").filter(id=union_id).first()
+    if union is None:
+        return None
+    pack = encode_pack(build_pack(union, language))
+    cache.set(key, tuple(pack), timeout=getattr(settings, "OFFLINE_PACK_CACHE_SECONDS", 24 * 60 * 60))
+    return pack
@@ -0,0 +1,176 @@
+"""Durable email outbox for help request notifications.
+
+``help_request`` no longer talks to SMTP. It stores an
+:class:`~main.models.OutboxEmail` row and returns. ``manage.py
+send_outbox --loop`` sends due rows in batches over one SMTP connection.
+A failed row is retried with exponential backoff and marked ``failed``
+after ``OUTBOX_MAX_ATTEMPTS``.
+
+Help types in ``OUTBOX_IMMEDIATE_HELP_TYPES`` (emergencies) are also
+handed to a background thread as soon as they are committed, so they do
+not wait for the next poll. Everything else is a digest item: pending
+digest items go out together as one email once the oldest has waited
+``OUTBOX_DIGEST_SECONDS``.
+
+Senders claim a row by flipping it from ``pending`` to ``sending`` in a
+conditional UPDATE, so the worker and the background thread never send
+the same row twice. A claim older than ``OUTBOX_CLAIM_TIMEOUT`` (a sender
+that died mid-batch) can be taken over.
+"""
+
+import logging
+import threading
+from collections import defaultdict
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.db import connections, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from .models import OutboxEmail
+
+logger = logging.getLogger(__name__)
+
+HELP_SUBJECT = "[MonBondhu] নতুন গোপন সাহায্য অনুরোধ"
+DIGEST_SUBJECT = "[MonBondhu] {count}টি নতুন সাহায্য অনুরোধ"
+
+
+def _setting(name, default):
+    return getattr(settings, f"OUTBOX_{name}", default)
+
+
+def _help_body(help_request):
+    return (
+        f"Help type: {help_request.help_type}\n"
+        f"Description: {help_request.description}\n"
+        f"Contact preference: {help_request.contact_preference}\n"
+        f"Submitted at: {help_request.created_at}\n"
+        f"Request id: {help_request.id}\n"
+    )
+
+
+def notify_help_request(help_request):
+    """Queue the support notification for a new help request"""
+    immediate = help_request.help_type in _setting("IMMEDIATE_HELP_TYPES", ["emergency"])
+    email = OutboxEmail.objects.create(
+        subject=HELP_SUBJECT,
+        body=_help_body(help_request),
+        recipients=list(_setting("HELP_RECIPIENTS", [])),
+        priority="immediate" if immediate else "digest",
+        help_request=help_request,
+    )
+    if immediate and _setting("SEND_IMMEDIATE_IN_BACKGROUND", True):
+        transaction.on_commit(
+            lambda: threading.Thread(target=_send_in_background, args=([email.id],), daemon=True).start()
+        )
+    return email
+
+
+def _send_in_background(ids):
+    try:
+        send_due(OutboxEmail.objects.filter(id__in=ids), include_digest=False)
+    except Exception:
+        logger.exception("Background send of outbox rows %s failed; send_outbox will retry", ids)
+    finally:
+        connections.close_all()
+
+
+def _claimable(now):
+    stale = now - timedelta(seconds=_setting("CLAIM_TIMEOUT", 10 * 60))
+    return Q(status="pending", next_attempt_at__lte=now) | Q(status="sending", claimed_at__lt=stale)
+
+
+def _claim(queryset, now, limit):
+    candidates = queryset.filter(_claimable(now)).order_by("next_attempt_at", "id").values_list("id", flat=True)
+    claimed = []
+    for email_id in candidates[:limit]:
+        if OutboxEmail.objects.filter(_claimable(now), id=email_id).update(status="sending", claimed_at=now):
+            claimed.append(email_id)
+    return list(OutboxEmail.objects.filter(id__in=claimed).order_by("id"))
+
+
+def _mark_sent(emails):
+    OutboxEmail.objects.filter(id__in=[email.id for email in emails]).update(
+        status="sent", sent_at=timezone.now(), claimed_at=None, last_error=""
+    )
+
+
+def _retry(emails, error):
+    """Back off exponentially: OUTBOX_RETRY_SECONDS, then double each attempt up to OUTBOX_MAX_BACKOFF"""
+    now = timezone.now()
+    for email in emails:
+        email.attempts += 1
+        email.last_error = repr(error)[:1000]
+        email.claimed_at = None
+        if email.attempts >= _setting("MAX_ATTEMPTS", 8):
+            email.status = "failed"
+        else:
+            delay = _setting("RETRY_SECONDS", 60) * 2 ** (email.attempts - 1)
+            delay = min(delay, _setting("MAX_BACKOFF", 6 * 60 * 60))
+            email.status = "pending"
+            email.next_attempt_at = now + timedelta(seconds=delay)
+        email.save(update_fields=["attempts", "last_error", "claimed_at", "status", "next_attempt_at"])
+    logger.warning("Could not send %d outbox emails: %r", len(emails), error)
+
+
+def _from_email():
+    """The SMTP login as sender, as help_request used; None falls back to DEFAULT_FROM_EMAIL"""
+    return settings.EMAIL_HOST_USER or None
+
+
+def _digests(emails):
+    """One message per recipient list, listing every queued notification"""
+    groups = defaultdict(list)
+    for email in emails:
+        groups[tuple(email.recipients)].append(email)
+    for recipients, group in groups.items():
+        body = "\n\n".join(email.body for email in group)
+        yield EmailMessage(DIGEST_SUBJECT.format(count=len(group)), body, _from_email(), list(recipients)), group
+
+
+def _digest_due(queryset, now):
+    oldest = queryset.filter(_claimable(now)).order_by("created_at").values_list("created_at", flat=True).first()
+    return oldest is not None and oldest <= now - timedelta(seconds=_setting("DIGEST_SECONDS", 60 * 60))
+
+
+def send_due(queryset=None, include_digest=True, batch_size=50):
+    """Send due immediate rows (and a digest, if one is due) over one connection; returns (sent, failed)"""
+    queryset = OutboxEmail.objects.all() if queryset is None else queryset
+    now = timezone.now()
+
+    messages = [
+        (EmailMessage(email.subject, email.body, _from_email(), email.recipients), [email])
+        for email in _claim(queryset.filter(priority="immediate"), now, batch_size)
+    ]
+    digest_rows = queryset.filter(priority="digest")
+    if include_digest and _digest_due(digest_rows, now):
+        messages.extend(_digests(_claim(digest_rows, now, _setting("DIGEST_MAX_ITEMS", 200))))
+    if not messages:
+        return 0, 0
+
+    sent = failed = 0
+    connection = get_connection(fail_silently=False)
+    try:
+        connection.open()
+    except Exception as error:
+        _retry([email for _, group in messages for email in group], error)
+        return 0, sum(len(group) for _, group in messages)
+
+    try:
+        for message, group in messages:
+            message.connection = connection
+            try:
+                message.send()
+            except Exception as error:
+                _retry(group, error)
+                failed += len(group)
+                # The connection may be broken; later messages reconnect on their own
+                connection.close()
+            else:
+                _mark_sent(group)
+                sent += len(group)
+    finally:
+        connection.close()
+    return sent, failed
@@ -0,0 +1,197 @@
+"""Daily rollups behind the data export dashboard.
+
+``MoodRollup`` and ``HelpRequestRollup`` hold one row per (day, union,
+category). Signals in ``main.signals`` keep them current: each new
+check-in or help request adds one to its row, and resolving a request
+adds its response time. Check-ins written through the write buffer
+(``main.write_buffer``) are counted per batch instead. The dashboard
+therefore reads a few hundred small rows instead of scanning the source
+tables.
+
+Edits made outside those paths (``QuerySet.update``, raw SQL, changing a
+row's mood) are not tracked; ``python manage.py rebuild_rollups``
+recomputes both tables from scratch.
+"""
+
+from collections import Counter, defaultdict
+
+from django.db import IntegrityError, transaction
+from django.db.models import F, Sum
+from django.db.models.functions import TruncMonth
+from django.utils import timezone
+
+from .models import AnonymousHelpRequest, HelpRequestRollup, MoodCheckIn, MoodRollup
+
+
+def _bump(model, keys, **deltas):
+    """Add ``deltas`` to the rollup row at ``keys``, creating it on first use"""
+    increments = {field: F(field) + delta for field, delta in deltas.items()}
+    if model.objects.filter(**keys).update(**increments):
+        return
+    try:
+        with transaction.atomic():
+            model.objects.create(**keys, **deltas)
+    except IntegrityError:
+        # Another writer created the row first
+        model.objects.filter(**keys).update(**increments)
+
+
+def _day(moment):
+    return timezone.localdate(moment)
+
+
+def _checkin_keys(checkin):
+    return (_day(checkin.created_at), checkin.union_area_id, checkin.mood)
+
+
+def record_checkin(checkin, sign=1):
+    record_checkins([checkin], sign)
+
+
+def record_checkins(checkins, sign=1):
+    """One update per rollup row for a batch, e.g. from the check-in write buffer"""
+    for (day, union_id, mood), count in Counter(map(_checkin_keys, checkins)).items():
+        _bump(MoodRollup, {"day": day, "union_id": union_id, "mood": mood}, count=sign * count)
+
+
+def _response_seconds(request):
+    return max(int((request.resolved_at - request.created_at).total_seconds()), 0)
+
+
+def record_help_request(request, sign=1):
+    deltas = {"count": sign}
+    if request.is_resolved and request.resolved_at:
+        deltas.update(resolved_count=sign, response_seconds=sign * _response_seconds(request))
+    _bump(HelpRequestRollup, _help_keys(request), **deltas)
+
+
+def record_resolution(request):
+    _bump(HelpRequestRollup, _help_keys(request), resolved_count=1, response_seconds=_response_seconds(request))
+
+
+def _help_keys(request):
+    return {"day": _day(request.created_at), "union_id": request.union_area_id, "help_type": request.help_type}
+
+
+def rebuild(chunk_size=2000):
+    """Recompute both rollup tables from the source rows; returns (mood rows, help rows)"""
+    moods = defaultdict(int)
+    for created_at, union_id, mood in MoodCheckIn.objects.values_list(
+        "created_at", "union_area_id", "mood"
+    ).iterator(chunk_size=chunk_size):
+        moods[(_day(created_at), union_id, mood)] += 1
+
+    help_rows = defaultdict(lambda: [0, 0, 0])
+    for request in AnonymousHelpRequest.objects.only(
+        "created_at", "union_area_id", "help_type", "is_resolved", "resolved_at"
+    ).iterator(chunk_size=chunk_size):
+        row = help_rows[(_day(request.created_at), request.union_area_id, request.help_type)]
+        row[0] += 1
+        if request.is_resolved and request.resolved_at:
+            row[1] += 1
+            row[2] += _response_seconds(request)
+
+    with transaction.atomic():
+        MoodRollup.objects.all().delete()
+        MoodRollup.objects.bulk_create(
+            (MoodRollup(day=day, union_id=union_id, mood=mood, count=count)
+             for (day, union_id, mood), count in moods.items()),
+            batch_size=chunk_size,
+        )
+        HelpRequestRollup.objects.all().delete()
+        HelpRequestRollup.objects.bulk_create(
+            (HelpRequestRollup(day=day, union_id=union_id, help_type=help_type, count=count,
+                               resolved_count=resolved, response_seconds=seconds)
+             for (day, union_id, help_type), (count, resolved, seconds) in help_rows.items()),
+            batch_size=chunk_size,
+        )
+    return len(moods), len(help_rows)
+
+
+def _in_range(queryset, start, end):
+    if start:
+        queryset = queryset.filter(day__gte=start)
+    if end:
+        queryset = queryset.filter(day__lte=end)
+    return queryset
+
+
+def _union_label(name_bn, name):
+    return name_bn or name or "অজানা"
+
+
+def overview(start=None, end=None):
+    moods = _in_range(MoodRollup.objects.all(), start, end)
+    helps = _in_range(HelpRequestRollup.objects.all(), start, end)
+
+    mood_distribution = dict(moods.values_list("mood").annotate(total=Sum("count")).order_by("mood"))
+    help_types = dict(helps.values_list("help_type").annotate(total=Sum("count")).order_by("help_type"))
+
+    engagement = defaultdict(int)
+    for queryset in (moods, helps):
+        for union_id, name, name_bn, total in (
+            queryset.filter(union__isnull=False)
+            .values_list("union_id", "union__name", "union__name_bn")
+            .annotate(total=Sum("count"))
+        ):
+            engagement[_union_label(name_bn, name)] += total
+
+    top_type = max(help_types, key=help_types.get, default=None)
+    return {
+        "total_checkins": sum(mood_distribution.values()),
+        "help_requests": sum(help_types.values()),
+        "active_unions": len(engagement),
+        "top_help_type": dict(AnonymousHelpRequest.HELP_TYPES).get(top_type, ""),
+        "mood_distribution": mood_distribution,
+        "help_request_types": help_types,
+        "regional_engagement": dict(sorted(engagement.items(), key=lambda item: -item[1])),
+    }
+
+
+def regional(start=None, end=None):
+    rows = {}
+    helps = _in_range(HelpRequestRollup.objects.all(), start, end)
+    for union_id, name, name_bn, upazila, upazila_bn, help_type, count, resolved, seconds in (
+        helps.values_list(
+            "union_id", "union__name", "union__name_bn", "union__upazila__name", "union__upazila__name_bn",
+            "help_type",
+        )
+        .annotate(count=Sum("count"), resolved=Sum("resolved_count"), seconds=Sum("response_seconds"))
+        .order_by("union_id", "help_type")
+    ):
+        row = rows.setdefault(union_id, {
+            "upazila": _union_label(upazila_bn, upazila),
+            "union": _union_label(name_bn, name),
+            "total_requests": 0,
+            **{f"{key}_requests": 0 for key, _ in AnonymousHelpRequest.HELP_TYPES},
+            "resolved": 0,
+            "response_seconds": 0,
+        })
+        row["total_requests"] += count
+        row[f"{help_type}_requests"] += count
+        row["resolved"] += resolved
+        row["response_seconds"] += seconds
+
+    upazila_data = []
+    for row in rows.values():
+        resolved, seconds = row.pop("resolved"), row.pop("response_seconds")
+        row["avg_response_time_hours"] = round(seconds / resolved / 3600, 1) if resolved else None
+        upazila_data.append(row)
+    return {"upazila_data": upazila_data}
+
+
+def trends(start=None, end=None):
+    months = defaultdict(lambda: {"checkins": 0, "requests": 0})
+    for model, field in ((MoodRollup, "checkins"), (HelpRequestRollup, "requests")):
+        for month, total in (
+            _in_range(model.objects.all(), start, end)
+            .annotate(month=TruncMonth("day"))
+            .values_list("month")
+            .annotate(total=Sum("count"))
+            .order_by("month")
+        ):
+            months[month.strftime("%Y-%m")][field] += total
+    return {"monthly_usage": [{"month": month, **counts} for month, counts in sorted(months.items())]}
+
+
+SECTIONS = {"overview": overview, "regional": regional, "trends": trends}
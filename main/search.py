@@ -0,0 +1,190 @@
+"""Full-text search over facilities, workers, events and tips (SQLite FTS5).
+
+All four kinds share one FTS5 table. Each row's rowid encodes the kind and
+the source row's id, so keeping the index in sync from signals is a
+keyed delete/insert rather than a scan.
+
+FTS5's default ``unicode61`` tokenizer only treats letters and digits as
+token characters and so splits Bangla words at every vowel sign and
+hasanta ("স্বাস্থ্য" becomes "স", "ব", ...). The index therefore adds the
+mark categories (``M*``) to the token characters, and text is NFC
+normalized on the way in and on the way out.
+
+On databases other than SQLite, :func:`search` falls back to ``icontains``.
+"""
+
+import unicodedata
+
+from django.db import connection
+
+TABLE = "main_search_index"
+TOKENIZER = "unicode61 remove_diacritics 2 categories 'L* N* Co M*'"
+# bm25 column weights: kind, object_id, title, body
+WEIGHTS = (0.0, 0.0, 10.0, 1.0)
+
+KINDS = {"facility": 1, "worker": 2, "event": 3, "tip": 4}
+KIND_BITS = 3
+
+
+def _models():
+    from .models import HealthEvent, HealthFacility, HealthTip, HealthWorker
+
+    return {"facility": HealthFacility, "worker": HealthWorker, "event": HealthEvent, "tip": HealthTip}
+
+
+def kind_for(model):
+    for kind, candidate in _models().items():
+        if candidate is model:
+            return kind
+    return None
+
+
+def document_for(kind, obj):
+    """(title, body) indexed for an object"""
+    if kind == "facility":
+        return obj.name, f"{obj.address} {obj.upazila} {obj.union}"
+    if kind == "worker":
+        # Index the Bangla skill labels too, so "মাতৃস্বাস্থ্য" finds maternal_health workers
+        labels = dict(obj.SKILL_CHOICES)
+        skills = " ".join(f"{key} {labels.get(key.strip(), '')}" for key in obj.skills.split(","))
+        return obj.name, f"{skills} {obj.village} {obj.union} {obj.upazila}"
+    if kind == "event":
+        return obj.title, f"{obj.description} {obj.location} {obj.organizer}"
+    return obj.title, obj.content
+
+
+def _rowid(kind, object_id):
+    return (object_id << KIND_BITS) | KINDS[kind]
+
+
+def _normalize(text):
+    return unicodedata.normalize("NFC", text or "")
+
+
+def is_available():
+    return connection.vendor == "sqlite"
+
+
+def ensure_index(using_connection=None):
+    conn = using_connection or connection
+    if conn.vendor != "sqlite":
+        return
+    with conn.cursor() as cursor:
+        cursor.execute(
+            f'CREATE VIRTUAL TABLE IF NOT EXISTS {TABLE} '
+            f'USING fts5(kind UNINDEXED, object_id UNINDEXED, title, body, tokenize="{TOKENIZER}")'
+        )
+
+
+def index_object(obj):
+    kind = kind_for(type(obj))
+    if kind is None or not is_available():
+        return
+    title, body = document_for(kind, obj)
+    rowid = _rowid(kind, obj.pk)
+    with connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {TABLE} WHERE rowid = %s", [rowid])
+        cursor.execute(
+            f"INSERT INTO {TABLE} (rowid, kind, object_id, title, body) VALUES (%s, %s, %s, %s, %s)",
+            [rowid, kind, obj.pk, _normalize(title), _normalize(body)],
+        )
+
+
+def remove_object(obj):
+    kind = kind_for(type(obj))
+    if kind is None or not is_available():
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {TABLE} WHERE rowid = %s", [_rowid(kind, obj.pk)])
+
+
+def rebuild(batch_size=1000):
+    """Drop and refill the index from the source tables; returns rows indexed"""
+    ensure_index()
+    total = 0
+    with connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {TABLE}")
+        for kind, model in _models().items():
+            batch = []
+            for obj in model.objects.iterator(chunk_size=batch_size):
+                title, body = document_for(kind, obj)
+                batch.append((_rowid(kind, obj.pk), kind, obj.pk, _normalize(title), _normalize(body)))
+                if len(batch) >= batch_size:
+                    _insert_many(cursor, batch)
+                    total += len(batch)
+                    batch = []
+            if batch:
+                _insert_many(cursor, batch)
+                total += len(batch)
+        cursor.execute(f"INSERT INTO {TABLE}({TABLE}) VALUES ('optimize')")
+    return total
+
+
+def _insert_many(cursor, rows):
+    cursor.executemany(
+        f"INSERT INTO {TABLE} (rowid, kind, object_id, title, body) VALUES (%s, %s, %s, %s, %s)", rows
+    )
+
+
+def build_match(query):
+    """Turn free user text into a safe FTS5 expression: every term must match, as a prefix"""
+    terms = []
+    for raw in _normalize(query).split():
+        # Keep only characters the tokenizer would treat as part of a token
+        term = "".join(ch for ch in raw if unicodedata.category(ch)[0] in "LNM")
+        if term:
+            terms.append(f'"{term}"*')
+    return " ".join(terms)
+
+
+def search(query, kinds=None, limit=20, offset=0):
+    """Ranked search; returns (results, has_more)"""
+    match = build_match(query)
+    if not match:
+        return [], False
+    if not is_available():
+        return _fallback_search(query, kinds, limit, offset)
+
+    sql = (
+        f"SELECT kind, object_id, title, snippet({TABLE}, 3, '', '', '…', 12), "
+        f"bm25({TABLE}, {', '.join(str(w) for w in WEIGHTS)}) AS rank "
+        f"FROM {TABLE} WHERE {TABLE} MATCH %s"
+    )
+    params = [match]
+    if kinds:
+        sql += f" AND kind IN ({', '.join(['%s'] * len(kinds))})"
+        params.extend(kinds)
+    sql += " ORDER BY rank LIMIT %s OFFSET %s"
+    params.extend([limit + 1, offset])
+
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        rows = cursor.fetchall()
+    results = [
+        {"kind": kind, "id": object_id, "title": title, "snippet": snippet, "score": round(-rank, 4)}
+        for kind, object_id, title, snippet, rank in rows[:limit]
+    ]
+    return results, len(rows) > limit
+
+
+def _fallback_search(query, kinds, limit, offset):
+    from django.db.models import Q
+
+    fields = {
+        "facility": ("name", "address"),
+        "worker": ("name", "skills", "village"),
+        "event": ("title", "description", "location"),
+        "tip": ("title", "content"),
+    }
+    results = []
+    for kind, model in _models().items():
+        if kinds and kind not in kinds:
+            continue
+        condition = Q()
+        for field in fields[kind]:
+            condition |= Q(**{f"{field}__icontains": query})
+        title_field = fields[kind][0]
+        for object_id, title in model.objects.filter(condition).values_list("id", title_field)[: offset + limit + 1]:
+            results.append({"kind": kind, "id": object_id, "title": title, "snippet": "", "score": 0})
+    page = results[offset: offset + limit + 1]
+    return page[:limit], len(page) > limit
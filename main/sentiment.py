@@ -0,0 +1,253 @@
+"""On-box sentiment classifier for mood check-ins.
+
+Mood answers are short ("আমি ভালো আছি", "feeling low", "mon kharap"), so a
+weighted lexicon covers most of them. Text is normalized like voice
+commands, split into words, and each word is looked up as-is and then with
+common Bangla/Banglish inflections stripped ("ভালোই" -> "ভালো"). Weights
+are summed per label, with two adjustments:
+
+- an intensifier ("খুব", "very", "onek") right before a word scales it up,
+- a negator flips the polarity of the nearest sentiment word in the same
+  clause. English negators come before the word ("not good", "don't
+  feel good"); Bangla and Banglish ones follow it ("ভালো না", "valo
+  lagche na"). Clauses end at punctuation, so "no, I am happy" stays
+  positive.
+
+Confidence is high when one label clearly dominates and enough signal was
+found, and near zero for empty or mixed texts. Callers escalate to the LLM
+below ``SENTIMENT_MIN_CONFIDENCE`` (see :func:`aclassify_or_escalate`).
+How often that happens is counted in process and added to the shared
+cache every ``SENTIMENT_STATS_FLUSH_SECONDS``;
+``python manage.py sentiment_stats`` prints the counters.
+"""
+
+import math
+import re
+import threading
+import time
+from collections import Counter, namedtuple
+
+from django.conf import settings
+from django.core.cache import caches
+
+from .intents import normalize_command
+
+Sentiment = namedtuple("Sentiment", ["label", "confidence", "source"])
+
+LABELS = ("positive", "negative", "neutral")
+KEY_PREFIX = "sentiment"
+STATS_KEYS = ("local", "escalated")
+
+LEXICON = {
+    "positive": {
+        # Bangla
+        "ভালো": 1.0, "ভাল": 1.0, "খুশি": 1.2, "আনন্দ": 1.2, "আনন্দিত": 1.2, "সুস্থ": 1.0,
+        "চমৎকার": 1.2, "দারুণ": 1.2, "শান্তি": 1.0, "শান্ত": 0.8, "স্বস্তি": 0.8, "ফুরফুরে": 1.0,
+        "আলহামদুলিল্লাহ": 1.0, "ধন্যবাদ": 0.5,
+        # English
+        "good": 1.0, "great": 1.2, "happy": 1.2, "fine": 0.8, "well": 0.6, "better": 0.8, "calm": 0.8,
+        "relaxed": 0.8, "excited": 1.0, "wonderful": 1.2, "awesome": 1.2, "glad": 1.0, "peaceful": 1.0,
+        "grateful": 1.0, "healthy": 0.8, "nice": 0.8, "thanks": 0.5,
+        # Banglish
+        "valo": 1.0, "bhalo": 1.0, "khushi": 1.2, "khusi": 1.2, "anondo": 1.2, "shanti": 1.0,
+        "darun": 1.2, "sustho": 1.0, "alhamdulillah": 1.0,
+    },
+    "negative": {
+        # Bangla
+        "খারাপ": 1.0, "দুঃখ": 1.2, "দুঃখিত": 1.0, "কষ্ট": 1.2, "মন খারাপ": 1.5, "একা": 0.8, "একাকী": 1.0,
+        "চিন্তা": 0.8, "দুশ্চিন্তা": 1.2, "ভয়": 1.0, "রাগ": 1.0, "ক্লান্ত": 0.8, "অসুস্থ": 1.0,
+        "হতাশ": 1.2, "ব্যথা": 0.8, "কান্না": 1.2, "অস্থির": 1.0, "বিষণ্ণ": 1.5,
+        # English
+        "bad": 1.0, "sad": 1.2, "unhappy": 1.2, "depressed": 1.5, "anxious": 1.2, "worried": 1.0,
+        "stressed": 1.0, "tired": 0.8, "lonely": 1.0, "angry": 1.0, "upset": 1.0, "scared": 1.0,
+        "afraid": 1.0, "sick": 1.0, "pain": 0.8, "hopeless": 1.5, "terrible": 1.2, "awful": 1.2,
+        "low": 0.8, "down": 0.8, "crying": 1.2, "hurt": 1.0,
+        # Banglish
+        "kharap": 1.0, "dukkho": 1.2, "kosto": 1.2, "koshto": 1.2, "tension": 1.0, "chinta": 0.8,
+        "voy": 1.0, "bhoy": 1.0, "rag": 1.0, "klanto": 0.8, "osustho": 1.0, "hotash": 1.2, "eka": 0.8,
+        "mon kharap": 1.5,
+    },
+    "neutral": {
+        "মোটামুটি": 1.0, "ঠিক": 0.6, "ঠিকঠাক": 0.8, "চলছে": 0.6, "স্বাভাবিক": 0.8,
+        "okay": 0.8, "ok": 0.8, "alright": 0.8, "normal": 0.8, "usual": 0.6, "meh": 0.8,
+        "so so": 1.0, "motamuti": 1.0, "thik": 0.6, "cholche": 0.6, "sabhabik": 0.8,
+    },
+}
+
+# Word-level lexicon for lookups; multi-word entries are matched as phrases first
+_WORDS = {
+    word: (label, weight)
+    for label, words in LEXICON.items() for word, weight in words.items() if " " not in word
+}
+_PHRASES = {
+    tuple(phrase.split()): (label, weight)
+    for label, words in LEXICON.items() for phrase, weight in words.items() if " " in phrase
+}
+
+# Contractions are folded before normalizing ("don't" -> "dont"), which would otherwise split them in two
+NEGATORS_BEFORE = {
+    "not", "no", "never", "nor", "cannot", "dont", "doesnt", "didnt", "isnt", "wasnt", "arent", "werent",
+    "cant", "couldnt", "wont", "wouldnt", "shouldnt", "hardly",
+}
+NEGATORS_AFTER = {"না", "নয়", "নেই", "নাই", "নি", "na", "noy", "nei", "nai", "ni"}
+INTENSIFIERS = {
+    "খুব": 1.5, "অনেক": 1.5, "ভীষণ": 1.8, "একটু": 0.6, "কিছুটা": 0.6,
+    "very": 1.5, "so": 1.3, "really": 1.4, "extremely": 1.8, "quite": 1.2, "bit": 0.6, "little": 0.6,
+    "khub": 1.5, "onek": 1.5, "bhishon": 1.8, "ektu": 0.6,
+}
+# Inflections to strip, longest first: "ভালোই", "খারাপটা", "ভালোলাগছে" ...
+_SUFFIXES = sorted(
+    ["ই", "ও", "ে", "তে", "টা", "টি", "লাগছে", "লাগে", "লাগতেছে", "ভাবে", "ের", "র", "e", "i", "o", "ta", "lagche", "lage", "ly"],
+    key=len, reverse=True,
+)
+
+
+_contraction = re.compile(r"n['’]t\b", re.I)
+_clause_break = re.compile(r"[,;:.!?।\n]+")
+
+
+def _words(text):
+    """Normalized words of ``text``, and the clause each one belongs to"""
+    words, clauses = [], []
+    for clause, part in enumerate(_clause_break.split(_contraction.sub("nt", text or ""))):
+        for word in normalize_command(part).split():
+            words.append(word)
+            clauses.append(clause)
+    return words, clauses
+
+
+def _lookup(word):
+    entry = _WORDS.get(word)
+    if entry:
+        return entry
+    for suffix in _SUFFIXES:
+        if word.endswith(suffix) and len(word) - len(suffix) >= 2:
+            entry = _WORDS.get(word[: -len(suffix)])
+            if entry:
+                return entry
+    return None
+
+
+def classify(text):
+    """Label a text locally; returns Sentiment(label, confidence, "local")"""
+    words, clauses = _words(text)
+    hits = []  # [index, label, weight]
+    i = 0
+    while i < len(words):
+        for phrase, (label, weight) in _PHRASES.items():
+            if tuple(words[i:i + len(phrase)]) == phrase:
+                hits.append([i + len(phrase) - 1, label, weight])
+                i += len(phrase)
+                break
+        else:
+            entry = _lookup(words[i])
+            if entry and entry[1]:
+                hits.append([i, *entry])
+            i += 1
+
+    for hit in hits:
+        index, label, weight = hit
+        if index and words[index - 1] in INTENSIFIERS and clauses[index - 1] == clauses[index]:
+            hit[2] = weight * INTENSIFIERS[words[index - 1]]
+
+    flips = {"positive": "negative", "negative": "positive", "neutral": "neutral"}
+    for position, word in enumerate(words):
+        if word in NEGATORS_BEFORE:
+            target = next((h for h in hits if position < h[0] <= position + 3), None)
+        elif word in NEGATORS_AFTER:
+            target = next((h for h in reversed(hits) if position - 3 <= h[0] < position), None)
+        else:
+            continue
+        if target and clauses[target[0]] != clauses[position]:
+            target = None
+        if target:
+            # "not bad" is mild praise rather than strong praise
+            target[1] = flips[target[1]]
+            target[2] *= 0.8
+
+    scores = dict.fromkeys(LABELS, 0.0)
+    for _, label, weight in hits:
+        scores[label] += weight
+    total = sum(scores.values())
+    if not total:
+        return Sentiment("neutral", 0.0, "local")
+
+    ranked = sorted(LABELS, key=scores.get, reverse=True)
+    margin = (scores[ranked[0]] - scores[ranked[1]]) / total
+    confidence = margin * (1 - math.exp(-2 * total))
+    return Sentiment(ranked[0], round(confidence, 3), "local")
+
+
+def _shared():
+    return caches[getattr(settings, "SENTIMENT_STATS_CACHE_ALIAS", "shared")]
+
+
+_counts = Counter()
+_counts_lock = threading.Lock()
+_flushed_at = time.monotonic()
+
+
+def _tally(name):
+    """Count in process; True when the tallies are due to be added to the shared cache"""
+    with _counts_lock:
+        _counts[name] += 1
+        return time.monotonic() - _flushed_at >= getattr(settings, "SENTIMENT_STATS_FLUSH_SECONDS", 30)
+
+
+def _take_counts():
+    global _counts, _flushed_at
+    with _counts_lock:
+        counts, _counts = _counts, Counter()
+        _flushed_at = time.monotonic()
+    return counts
+
+
+async def _acount(name):
+    if _tally(name):
+        await aflush_stats()
+
+
+def flush_stats():
+    for name, count in _take_counts().items():
+        key = f"{KEY_PREFIX}:stats:{name}"
+        try:
+            _shared().add(key, 0, timeout=None)
+            _shared().incr(key, count)
+        except ValueError:
+            # Evicted between add() and incr(); losing one batch of counts is fine
+            pass
+
+
+async def aflush_stats():
+    for name, count in _take_counts().items():
+        key = f"{KEY_PREFIX}:stats:{name}"
+        try:
+            await _shared().aadd(key, 0, timeout=None)
+            await _shared().aincr(key, count)
+        except ValueError:
+            pass
+
+
+async def aclassify_or_escalate(text, language, ai_service):
+    """Classify locally, asking ``ai_service.aanalyze_sentiment`` only when unsure"""
+    result = classify(text)
+    if result.confidence >= getattr(settings, "SENTIMENT_MIN_CONFIDENCE", 0.6):
+        await _acount("local")
+        return result
+    await _acount("escalated")
+    label = await ai_service.aanalyze_sentiment(text, language)
+    return Sentiment(label if label in LABELS else "neutral", None, "llm")
+
+
+def stats():
+    flush_stats()
+    values = _shared().get_many([f"{KEY_PREFIX}:stats:{name}" for name in STATS_KEYS])
+    stats = {name: values.get(f"{KEY_PREFIX}:stats:{name}", 0) for name in STATS_KEYS}
+    total = stats["local"] + stats["escalated"]
+    stats["escalation_rate"] = stats["escalated"] / total if total else 0.0
+    return stats
+
+
+def reset_stats():
+    _take_counts()
+    _shared().delete_many([f"{KEY_PREFIX}:stats:{name}" for name in STATS_KEYS])
@@ -0,0 +1,112 @@
+from django.db import connections
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from . import offline_pack, rollups, search
+from .fragments import MOODS_VERSION, chat_version_name
+from .geo_index import facility_index
+from .geography import link_area, sync_canonical_aliases
+from .models import (
+    AnonymousHelpRequest, ChatMessage, HealthEvent, HealthFacility, HealthTip, HealthWorker, Hospital, MoodCheckIn,
+    SymptomGuideEntry, Union, Upazila,
+)
+from .tip_pool import tip_pool
+from .versions import bump_version
+
+
+@receiver([post_save, post_delete], sender=HealthTip)
+def refresh_tip_pool(sender, **kwargs):
+    tip_pool.invalidate()
+
+
+@receiver([post_save, post_delete], sender=HealthFacility)
+@receiver([post_save, post_delete], sender=Hospital)
+def refresh_facility_index(sender, **kwargs):
+    facility_index.invalidate()
+
+
+@receiver(pre_save, sender=HealthFacility)
+@receiver(pre_save, sender=HealthEvent)
+@receiver(pre_save, sender=HealthWorker)
+def link_area_foreign_keys(sender, instance, **kwargs):
+    link_area(instance)
+
+
+@receiver(post_save, sender=Upazila)
+@receiver(post_save, sender=Union)
+def add_canonical_aliases(sender, instance, **kwargs):
+    sync_canonical_aliases(instance)
+
+
+@receiver(post_save, sender=HealthFacility)
+@receiver(post_save, sender=HealthWorker)
+@receiver(post_save, sender=HealthEvent)
+@receiver(post_save, sender=HealthTip)
+def update_search_index(sender, instance, **kwargs):
+    search.index_object(instance)
+
+
+@receiver(post_delete, sender=HealthFacility)
+@receiver(post_delete, sender=HealthWorker)
+@receiver(post_delete, sender=HealthEvent)
+@receiver(post_delete, sender=HealthTip)
+def remove_from_search_index(sender, instance, **kwargs):
+    search.remove_object(instance)
+
+
+@receiver([post_save, post_delete], sender=HealthFacility)
+@receiver([post_save, post_delete], sender=HealthWorker)
+@receiver([post_save, post_delete], sender=HealthEvent)
+@receiver([post_save, post_delete], sender=HealthTip)
+@receiver([post_save, post_delete], sender=SymptomGuideEntry)
+@receiver([post_save, post_delete], sender=Union)
+@receiver([post_save, post_delete], sender=Upazila)
+def expire_offline_packs(sender, **kwargs):
+    bump_version(offline_pack.VERSION_NAME)
+
+
+@receiver([post_save, post_delete], sender=MoodCheckIn)
+def expire_mood_fragment(sender, **kwargs):
+    bump_version(MOODS_VERSION)
+
+
+@receiver([post_save, post_delete], sender=ChatMessage)
+def expire_chat_fragment(sender, instance, **kwargs):
+    bump_version(chat_version_name(instance.conversation_id))
+
+
+@receiver(post_save, sender=MoodCheckIn)
+def count_checkin(sender, instance, created, **kwargs):
+    if created:
+        rollups.record_checkin(instance)
+
+
+@receiver(post_delete, sender=MoodCheckIn)
+def uncount_checkin(sender, instance, **kwargs):
+    rollups.record_checkin(instance, sign=-1)
+
+
+@receiver(pre_save, sender=AnonymousHelpRequest)
+def stamp_resolution(sender, instance, **kwargs):
+    if instance.is_resolved and not instance.resolved_at:
+        instance.resolved_at = timezone.now()
+        instance._newly_resolved = True
+
+
+@receiver(post_save, sender=AnonymousHelpRequest)
+def count_help_request(sender, instance, created, **kwargs):
+    if created:
+        rollups.record_help_request(instance)
+    elif instance.__dict__.pop("_newly_resolved", False):
+        rollups.record_resolution(instance)
+
+
+@receiver(post_delete, sender=AnonymousHelpRequest)
+def uncount_help_request(sender, instance, **kwargs):
+    rollups.record_help_request(instance, sign=-1)
+
+
+def create_search_index(sender, using, **kwargs):
+    """post_migrate: FTS5 virtual tables are not models, so create it here"""
+    search.ensure_index(connections[using])
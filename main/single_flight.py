@@ -0,0 +1,127 @@
+"""Share one upstream LLM call between concurrent identical requests.
+
+Canned prompts (help, health tips) are the same for every user, so a
+burst of traffic sends many identical prompts at once, all missing the
+response cache because none has been answered yet. :class:`SingleFlight`
+lets the first caller for a key (the leader) make the call while later
+callers for the same key wait for its result instead of calling out too.
+
+Keys come from ``ai_cache.make_key`` (normalized prompt, language, context
+and model). Sync callers (threads) and async callers (tasks, on any event
+loop) join the same flights. If the leader fails, every waiter gets its
+exception and falls back as it would have on its own. Once a flight ends
+it is forgotten; later callers are served by the response cache.
+"""
+
+import asyncio
+import os
+import threading
+from collections import Counter
+
+
+class _Flight:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._done = threading.Event()
+        self._waiters = []  # (loop, future) for async followers
+        self.result = None
+        self.error = None
+
+    def finish(self, result=None, error=None):
+        with self._lock:
+            self.result, self.error = result, error
+            self._done.set()
+            waiters, self._waiters = self._waiters, []
+        for loop, future in waiters:
+            loop.call_soon_threadsafe(self._resolve, future)
+
+    def _resolve(self, future):
+        if not future.done():
+            future.set_result(None)
+
+    def _outcome(self):
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+    def wait(self):
+        self._done.wait()
+        return self._outcome()
+
+    async def await_(self):
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        with self._lock:
+            if self._done.is_set():
+                return self._outcome()
+            self._waiters.append((loop, future))
+        await future
+        return self._outcome()
+
+
+class SingleFlight:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._flights = {}
+        self.counters = Counter()
+
+    def _join(self, key):
+        """Return (flight, is_leader) for ``key``"""
+        with self._lock:
+            flight = self._flights.get(key)
+            if flight is not None:
+                self.counters["coalesced"] += 1
+                return flight, False
+            flight = self._flights[key] = _Flight()
+            self.counters["leaders"] += 1
+            return flight, True
+
+    def _land(self, key, flight, result=None, error=None):
+        with self._lock:
+            self._flights.pop(key, None)
+        if error is not None and not isinstance(error, Exception):
+            # The leader was cancelled or interrupted; that must not cancel its followers too
+            error = RuntimeError(f"shared call ended by {type(error).__name__}")
+        flight.finish(result, error)
+
+    def do(self, key, fn):
+        """Return ``fn()``, or the result of the identical call already in flight"""
+        flight, leader = self._join(key)
+        if not leader:
+            return flight.wait()
+        try:
+            result = fn()
+        except BaseException as error:
+            self._land(key, flight, error=error)
+            raise
+        self._land(key, flight, result=result)
+        return result
+
+    async def ado(self, key, coro_fn):
+        """Return ``await coro_fn()``, or the result of the identical call already in flight"""
+        flight, leader = self._join(key)
+        if not leader:
+            return await flight.await_()
+        try:
+            result = await coro_fn()
+        except BaseException as error:
+            self._land(key, flight, error=error)
+            raise
+        self._land(key, flight, result=result)
+        return result
+
+    def stats(self):
+        with self._lock:
+            return {"in_flight": len(self._flights), **self.counters}
+
+    def _reset(self):
+        self._lock = threading.Lock()
+        self._flights = {}
+        self.counters = Counter()
+
+
+llm_flights = SingleFlight()
+
+if hasattr(os, "register_at_fork"):
+    # Leaders do not survive a fork; a child must not wait on their flights
+    os.register_at_fork(after_in_child=llm_flights._reset)
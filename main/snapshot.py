@@ -0,0 +1,169 @@
+"""Offline analytics snapshots for district officers.
+
+A snapshot is a small SQLite file of pre-aggregated, anonymized counts
+(mood check-ins, help requests, health events, vaccination coverage),
+plus a gzipped copy to carry over slow links. Officers open it in any
+SQLite browser, or with pandas, and work offline.
+
+Building is incremental: an existing snapshot records the last day it
+covers, and a rebuild only replaces days from ``refresh_days`` before that
+onwards. The overlap picks up late changes such as help requests resolved
+after the day they were filed. Mood and help counts come straight from
+the rollup tables (see ``main.rollups``), so no source table is scanned.
+"""
+
+import gzip
+import os
+import shutil
+import sqlite3
+from collections import defaultdict
+from datetime import date, timedelta
+
+from django.db.models import Count, Q
+from django.db.models.functions import TruncMonth
+from django.utils import timezone
+
+from .models import HealthEvent, HelpRequestRollup, MoodRollup, Union, VaccinationRecord
+
+SNAPSHOT_FORMAT = 1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS unions (
+    id INTEGER PRIMARY KEY, name TEXT, name_bn TEXT, upazila TEXT, upazila_bn TEXT, district TEXT
+);
+CREATE TABLE IF NOT EXISTS mood_daily (
+    day TEXT NOT NULL, union_id INTEGER, mood TEXT NOT NULL, count INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS mood_daily_day ON mood_daily (day);
+CREATE TABLE IF NOT EXISTS help_daily (
+    day TEXT NOT NULL, union_id INTEGER, help_type TEXT NOT NULL, count INTEGER NOT NULL,
+    resolved_count INTEGER NOT NULL, response_seconds INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS help_daily_day ON help_daily (day);
+CREATE TABLE IF NOT EXISTS event_daily (
+    day TEXT NOT NULL, union_id INTEGER, upazila_id INTEGER, event_type TEXT NOT NULL, count INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS event_daily_day ON event_daily (day);
+CREATE TABLE IF NOT EXISTS vaccination_monthly (
+    month TEXT NOT NULL, vaccine_type TEXT NOT NULL, scheduled INTEGER NOT NULL, completed INTEGER NOT NULL
+);
+"""
+
+DAILY_TABLES = ("mood_daily", "help_daily", "event_daily")
+
+
+def _read_meta(db):
+    try:
+        return dict(db.execute("SELECT key, value FROM meta"))
+    except sqlite3.OperationalError:
+        return {}
+
+
+def _refresh_from(meta, start, district_id, refresh_days):
+    """First day to rebuild, or None when the existing snapshot cannot be extended and must be rebuilt"""
+    if meta.get("format") != str(SNAPSHOT_FORMAT) or not meta.get("end"):
+        return None
+    if date.fromisoformat(meta["start"]) != start or meta.get("district") != str(district_id or ""):
+        return None
+    return max(start, date.fromisoformat(meta["end"]) - timedelta(days=refresh_days))
+
+
+def _daily_rows(start, end, district_id):
+    moods = MoodRollup.objects.filter(day__gte=start, day__lte=end)
+    helps = HelpRequestRollup.objects.filter(day__gte=start, day__lte=end)
+    events = HealthEvent.objects.filter(date__gte=start, date__lte=end, is_active=True)
+    if district_id:
+        moods = moods.filter(union__upazila__district_id=district_id)
+        helps = helps.filter(union__upazila__district_id=district_id)
+        events = events.filter(
+            Q(union_area__upazila__district_id=district_id) | Q(upazila_area__district_id=district_id)
+        )
+
+    moods = moods.values_list("day", "union_id", "mood", "count")
+    helps = helps.values_list("day", "union_id", "help_type", "count", "resolved_count", "response_seconds")
+    events = (
+        events.values_list("date", "union_area_id", "upazila_area_id", "event_type")
+        .annotate(count=Count("id"))
+        .order_by()
+    )
+    return {"mood_daily": moods, "help_daily": helps, "event_daily": events}
+
+
+def _vaccination_rows(start, end):
+    # Coverage by the month a dose was due; administered dates change long after, so this is always recomputed
+    rows = (
+        VaccinationRecord.objects.filter(scheduled_date__gte=start, scheduled_date__lte=end)
+        .annotate(month=TruncMonth("scheduled_date"))
+        .values_list("month", "vaccine_type")
+        .annotate(scheduled=Count("id"), completed=Count("id", filter=Q(is_completed=True)))
+        .order_by("month", "vaccine_type")
+    )
+    return [(month.strftime("%Y-%m"), vaccine_type, scheduled, completed)
+            for month, vaccine_type, scheduled, completed in rows]
+
+
+def _union_rows(district_id):
+    unions = Union.objects.filter(upazila__district_id=district_id) if district_id else Union.objects.all()
+    return unions.values_list(
+        "id", "name", "name_bn", "upazila__name", "upazila__name_bn", "upazila__district__name"
+    ).order_by("id")
+
+
+def _insert(db, table, rows):
+    rows = [tuple(value.isoformat() if isinstance(value, date) else value for value in row) for row in rows]
+    if rows:
+        placeholders = ", ".join("?" * len(rows[0]))
+        db.executemany(f"INSERT INTO {table} VALUES ({placeholders})", rows)
+    return len(rows)
+
+
+def build(path, start, end=None, district_id=None, refresh_days=30):
+    """Create or extend the snapshot at ``path`` and write ``path.gz``; returns {table: rows written}.
+
+    With ``district_id`` only that district's unions are kept. Rows with no
+    union are left out, but vaccination coverage has no area and is always
+    national.
+    """
+    end = end or timezone.localdate()
+    work_path = f"{path}.tmp"
+    if os.path.exists(path):
+        shutil.copyfile(path, work_path)
+    elif os.path.exists(work_path):
+        os.remove(work_path)
+
+    written = defaultdict(int)
+    db = sqlite3.connect(work_path)
+    try:
+        refresh_from = _refresh_from(_read_meta(db), start, district_id, refresh_days)
+        if refresh_from is None:
+            for table in ("meta", "unions", *DAILY_TABLES, "vaccination_monthly"):
+                db.execute(f"DROP TABLE IF EXISTS {table}")
+            refresh_from = start
+        db.executescript(SCHEMA)
+
+        for table, rows in _daily_rows(refresh_from, end, district_id).items():
+            db.execute(f"DELETE FROM {table} WHERE day >= ?", (refresh_from.isoformat(),))
+            written[table] = _insert(db, table, rows.iterator())
+        whole_tables = {"unions": _union_rows(district_id), "vaccination_monthly": _vaccination_rows(start, end)}
+        for table, rows in whole_tables.items():
+            db.execute(f"DELETE FROM {table}")
+            written[table] = _insert(db, table, rows)
+
+        meta = {
+            "format": SNAPSHOT_FORMAT, "start": start, "end": end, "district": district_id or "",
+            "built_at": timezone.now(),
+        }
+        db.executemany(
+            "INSERT OR REPLACE INTO meta VALUES (?, ?)",
+            [(key, value.isoformat() if hasattr(value, "isoformat") else str(value)) for key, value in meta.items()],
+        )
+        db.commit()
+        db.execute("VACUUM")
+    finally:
+        db.close()
+
+    os.replace(work_path, path)
+    with open(path, "rb") as source, gzip.GzipFile(f"{path}.gz", "wb", mtime=0) as target:
+        shutil.copyfileobj(source, target)
+    return dict(written)
@@ -0,0 +1,62 @@
+"""Serve collected static files with their precompressed variants (see main/storage.py).
+
+Only used with ``STATIC_SERVE = True``, for deployments where nothing sits
+in front of the app to serve ``STATIC_ROOT``. Content-hashed names are
+cached for a year as immutable; anything else for
+``STATIC_UNHASHED_MAX_AGE`` seconds.
+"""
+
+import mimetypes
+import os
+import re
+
+from django.conf import settings
+from django.core.exceptions import SuspiciousFileOperation
+from django.http import FileResponse, Http404
+from django.utils._os import safe_join
+from django.utils.cache import patch_vary_headers
+
+from .storage import ENCODINGS
+
+HASHED_NAME = re.compile(r"\.[0-9a-f]{12}\.\w+$")
+IMMUTABLE = "public, max-age=31536000, immutable"
+
+
+def accepted_encodings(request):
+    """Content codings the client accepts, skipping any it refuses with q=0"""
+    accepted = set()
+    for item in request.headers.get("Accept-Encoding", "").split(","):
+        coding, _, params = item.strip().partition(";")
+        if re.fullmatch(r"\s*q=0(\.0*)?\s*", params):
+            continue
+        accepted.add(coding.strip().lower())
+    return accepted
+
+
+def serve(request, path):
+    try:
+        full_path = safe_join(settings.STATIC_ROOT, path)
+    except SuspiciousFileOperation:
+        raise Http404("Not found")
+    if not os.path.isfile(full_path):
+        raise Http404("Not found")
+
+    content_type = mimetypes.guess_type(full_path)[0] or "application/octet-stream"
+    encoding = None
+    accepted = accepted_encodings(request)
+    for coding, suffix in ENCODINGS.items():
+        if coding in accepted and os.path.isfile(full_path + suffix):
+            encoding, full_path = coding, full_path + suffix
+            break
+
+    response = FileResponse(open(full_path, "rb"), content_type=content_type)
+    if "Content-Disposition" in response:
+        del response["Content-Disposition"]
+    if encoding:
+        response["Content-Encoding"] = encoding
+    patch_vary_headers(response, ["Accept-Encoding"])
+    if HASHED_NAME.search(path):
+        response["Cache-Control"] = IMMUTABLE
+    else:
+        response["Cache-Control"] = f"public, max-age={getattr(settings, 'STATIC_UNHASHED_MAX_AGE', 60 * 60)}"
+    return response
@@ -0,0 +1,111 @@
+"""Static files: minified, content-hashed and precompressed at collectstatic time.
+
+The shared CSS and JS used to be inlined in every page, so each view on
+a 2G link downloaded all of it again. They now live under ``static/`` and
+``collectstatic`` builds them with :class:`PrecompressedManifestStorage`:
+
+1. CSS and JS are minified as they are copied (comments and indentation
+   dropped, nothing renamed), so the content hash covers the bytes served;
+2. ``ManifestStaticFilesStorage`` names each file after its content hash
+   (``base.3f2a…c1.css``), so a URL never changes meaning and may be
+   cached for a year;
+3. every hashed text file gets ``.gz`` and, when the ``brotli`` package is
+   installed, ``.br`` siblings, so nothing is compressed per request.
+
+A web server in front of the app should serve ``STATIC_ROOT`` with its
+precompressed variants (nginx ``gzip_static``/``brotli_static``) and
+``Cache-Control: max-age=31536000, immutable`` for hashed names. Without
+one, ``STATIC_SERVE = True`` lets :func:`main.static_serve.serve` do it.
+``manage.py asset_budget`` reports the bytes each page costs.
+"""
+
+import gzip
+import re
+
+from django.contrib.staticfiles.storage import ManifestStaticFilesStorage
+from django.core.files.base import ContentFile
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - brotli is optional; gzip variants are still written
+    brotli = None
+
+COMPRESSIBLE = (".css", ".js", ".svg", ".json", ".txt", ".html", ".xml", ".map")
+ENCODINGS = {"br": ".br", "gzip": ".gz"}
+
+_css_tokens = re.compile(r"(\"(?:\\.|[^\"\\])*\"|'(?:\\.|[^'\\])*')|/\*.*?\*/", re.S)
+_css_space = re.compile(r"\s+")
+_css_punctuation = re.compile(r"\s*([{};,>])\s*")
+
+
+def minify_css(text):
+    """Drop comments and redundant whitespace, leaving string literals untouched"""
+    parts = []
+    position = 0
+    for match in _css_tokens.finditer(text):
+        parts.append(_squeeze_css(text[position:match.start()]))
+        parts.append(match.group(1) or "")  # Strings are kept, comments dropped
+        position = match.end()
+    parts.append(_squeeze_css(text[position:]))
+    return "".join(parts).replace(";}", "}").strip()
+
+
+def _squeeze_css(text):
+    text = _css_punctuation.sub(r"\1", _css_space.sub(" ", text))
+    # "color: red" -> "color:red"; the space before a colon is kept since ".a :hover" differs from ".a:hover"
+    return text.replace(": ", ":")
+
+
+def minify_js(text):
+    """Drop indentation, blank lines and whole-line // comments; nothing is renamed or reordered.
+
+    Line breaks are kept, so automatic semicolon insertion behaves exactly as
+    before. Lines inside multi-line template literals are copied verbatim.
+    """
+    lines = []
+    in_template = False
+    for line in text.splitlines():
+        if in_template or (lines and lines[-1].endswith("\\")):
+            lines.append(line)
+        else:
+            line = line.strip()
+            if not line or line.startswith("//"):
+                continue  # Dropped, so its backticks do not open or close a template literal
+            lines.append(line)
+        if len(re.findall(r"(?<!\\)`", line)) % 2:
+            in_template = not in_template
+    return "\n".join(lines) + "\n"
+
+
+MINIFIERS = {".css": minify_css, ".js": minify_js}
+
+
+class PrecompressedManifestStorage(ManifestStaticFilesStorage):
+    def _save(self, name, content):
+        minify = next((fn for ext, fn in MINIFIERS.items() if name.endswith(ext)), None)
+        if minify and not re.search(r"\.min\.\w+$", name):
+            # post_process hands over files it has just read to hash them
+            content.seek(0)
+            content = ContentFile(minify(content.read().decode("utf-8")).encode("utf-8"))
+        return super()._save(name, content)
+
+    def post_process(self, paths, dry_run=False, **options):
+        yield from super().post_process(paths, dry_run=dry_run, **options)
+        if dry_run:
+            return
+        for name in set(self.hashed_files.values()):
+            if name.endswith(COMPRESSIBLE):
+                self._compress(name)
+
+    def _compress(self, name):
+        with self.open(name) as original:
+            data = original.read()
+        variants = {".gz": gzip.compress(data, compresslevel=9, mtime=0)}
+        if brotli is not None:
+            variants[".br"] = brotli.compress(data, quality=11)
+        for suffix, compressed in variants.items():
+            # Tiny files can grow when compressed; serve those as they are
+            if len(compressed) < len(data):
+                if self.exists(name + suffix):
+                    self.delete(name + suffix)
+                super()._save(name + suffix, ContentFile(compressed))
@@ -0,0 +1,62 @@
+"""Stream AI replies to the browser as they are generated.
+
+On a slow link, waiting for the whole completion leaves the user looking
+at a spinner, and speech synthesis cannot start before the last token. A
+streamed reply is sent as newline-delimited JSON (one object per line,
+``application/x-ndjson``), which ``fetch`` can read progressively:
+
+* ``{"delta": "..."}`` for each sentence, as soon as the model finishes it;
+* one final ``{"done": true, ...}`` carrying the full reply and whatever
+  the non-streaming JSON response would have held (message ids, type).
+
+Deltas are whole sentences rather than raw tokens, so the voice assistant
+can speak each one as it arrives. The chat history is written once, after
+the last sentence, by the view that built the stream.
+"""
+
+import json
+import re
+
+from django.http import StreamingHttpResponse
+
+NDJSON = "application/x-ndjson"
+
+# A sentence ends at . ! ? or the Bangla dari followed by whitespace, or at a line break. A terminator
+# at the end of the buffer waits for the next delta, so "3." + "5 mg" is not split.
+_sentence_end = re.compile(r"[.!?।]+[\"')\]]*\s+|\n+")
+# Periods that end a title rather than a sentence ("Dr. Rahman")
+_abbreviation = re.compile(r"(?:^|[\s(])(?:Dr|Mr|Mrs|Ms|Prof|St|Md|Mst|e\.g|i\.e|vs)\.$", re.I)
+
+
+def event(payload):
+    return json.dumps(payload, ensure_ascii=False) + "\n"
+
+
+def _last_sentence_end(text):
+    """Index just past the last complete sentence in ``text``, or 0 if there is none"""
+    end = 0
+    for match in _sentence_end.finditer(text):
+        if not _abbreviation.search(text, 0, match.start() + 1):
+            end = match.end()
+    return end
+
+
+async def sentences(deltas):
+    """Regroup token deltas into whole sentences (the last one may be unterminated)"""
+    pending = ""
+    async for delta in deltas:
+        pending += delta
+        end = _last_sentence_end(pending)
+        if end:
+            yield pending[:end]
+            pending = pending[end:]
+    if pending.strip():
+        yield pending
+
+
+def ndjson_response(events):
+    """A streaming response that proxies must pass through unbuffered"""
+    response = StreamingHttpResponse(events, content_type=NDJSON)
+    response["Cache-Control"] = "no-cache"
+    response["X-Accel-Buffering"] = "no"
+    return response
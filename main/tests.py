@@ -1,3 +1,1064 @@
-from django.test import TestCase
+import asyncio
+import gzip
+import json
+import re
+import sqlite3
+import tempfile
+import threading
+import time as clock
+from datetime import date, time, timedelta
+from pathlib import Path
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth.models import User
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.core import mail
+from django.core.cache import caches
+from django.core.management import call_command
+from django.db import OperationalError, connection
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from . import ai_clients, ai_governor, chat_jobs, outbox, rollups, search, sentiment, snapshot, static_serve, streaming
+from .ai_cache import AIResponseCache
+from .ai_service import SENTIMENT_MODEL, AIService
+from .db_router import PIN_COOKIE, PrimaryPinMiddleware, ReplicaRouter
+from .geo_index import FacilityIndex, facility_index, haversine_km
+from .geography import resolve_area, sync_canonical_aliases
+from .intents import IntentMatch, intent_matcher
+from .models import (
+    AnonymousHelpRequest, BackfillCheckpoint, ChatJob, ChatMessage, ChildVaccination, Conversation, District,
+    Division, HealthEvent, HealthFacility, HealthTip, HealthWorker, HelpRequestRollup, Hospital, MoodCheckIn,
+    MoodRollup, OutboxEmail, SymptomGuideEntry, Union, Upazila, VaccinationRecord, VoiceCommand,
+)
+from .sentiment import classify
+from .single_flight import SingleFlight
+from .storage import minify_css, minify_js
+from .tip_pool import TipPool, current_season, tip_pool
+from .versions import bump_version
+from .write_buffer import WriteBuffer
+
+# Tables that grow with use; reference tables small enough to scan (tips, symptoms, areas) are left out
+HOT_TABLES = {
+    f"main_{name}" for name in (
+        "moodcheckin", "anonymoushelprequest", "chatmessage", "vaccinationrecord", "healthevent",
+        "healthfacility", "healthworker", "moodrollup", "helprequestrollup", "areaalias",
+    )
+}
+
+# "SCAN main_moodcheckin" is a full table scan; "SCAN ... USING INDEX" and "SEARCH ..." are not
+FULL_SCAN = re.compile(r"^SCAN (\w+)$")
+
+TEST_CACHES = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "tests-default"},
+    "shared": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "tests-shared"},
+}
+
+# Templates render {% static %} without a collectstatic manifest
+TEST_STORAGES = {
+    "default": {"BACKEND": "django.core.files.storage.FileSystemStorage"},
+    "staticfiles": {"BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage"},
+}
+
+
+@override_settings(CACHES=TEST_CACHES, STORAGES=TEST_STORAGES)
+class QueryPlanTests(TestCase):
+    """Every query a hot view runs must reach the big tables through an index.
+
+    Each test requests a view, then runs EXPLAIN QUERY PLAN on the SELECTs
+    it issued. A new filter or ordering without a matching index in
+    ``Meta.indexes`` fails here instead of in production.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        division = Division.objects.create(name="Barishal")
+        district = District.objects.create(division=division, name="Bhola")
+        cls.upazila = Upazila.objects.create(district=district, name="Char Fasson")
+        cls.union = Union.objects.create(upazila=cls.upazila, name="Char Kukri Mukri")
+        sync_canonical_aliases(cls.upazila)
+
+        MoodCheckIn.objects.create(mood="happy", union_area=cls.union)
+        AnonymousHelpRequest.objects.create(help_type="other", description="-", union_area=cls.union)
+        HealthFacility.objects.create(
+            name="Clinic", facility_type="hospital", address="-", upazila="Char Fasson", union="-",
+            upazila_area=cls.upazila, union_area=cls.union,
+        )
+        HealthWorker.objects.create(
+            name="-", phone="-", village="-", union="-", upazila="-", union_area=cls.union, skills="-",
+            training_organization="-", available_hours="-",
+        )
+        HealthEvent.objects.create(
+            title="-", event_type="awareness", description="-", date=date(2099, 1, 1), start_time=time(9),
+            end_time=time(10), location="-", upazila="-", union="-", organizer="-", union_area=cls.union,
+        )
+        HealthTip.objects.create(title="-", content="-")
+        SymptomGuideEntry.objects.create(name="-", category="fever", description="-")
+        child = ChildVaccination.objects.create(child_name="-", birth_date=date(2026, 1, 1))
+        VaccinationRecord.objects.create(child=child, vaccine_type="bcg", scheduled_date=date(2026, 2, 1))
+        cls.conversation = Conversation.objects.create()
+        ChatMessage.objects.create(conversation=cls.conversation, role="user", content="-")
+        cls.staff = User.objects.create_user("staff", is_staff=True)
+
+    def setUp(self):
+        for alias in TEST_CACHES:
+            caches[alias].clear()
+
+    def assertIndexed(self, url, data=None, session=None):
+        if session:
+            client_session = self.client.session
+            client_session.update(session)
+            client_session.save()
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, data)
+            if response.streaming:
+                b"".join(response.streaming_content)
+        self.assertEqual(response.status_code, 200)
+
+        selects = [query["sql"] for query in queries if query["sql"].lstrip().upper().startswith("SELECT")]
+        self.assertTrue(selects, f"{url} ran no queries to check")
+        for sql in selects:
+            with connection.cursor() as cursor:
+                cursor.execute(f"EXPLAIN QUERY PLAN {sql}")
+                plan = [row[-1] for row in cursor.fetchall()]
+            scanned = {match.group(1) for match in map(FULL_SCAN.match, plan) if match} & HOT_TABLES
+            self.assertFalse(scanned, f"{url} scans {', '.join(sorted(scanned))}:\n{sql}\n" + "\n".join(plan))
+
+    def test_mood_tracker(self):
+        self.assertIndexed(reverse("mood_tracker"))
+
+    def test_chat_messages(self):
+        self.assertIndexed(reverse("mood_chat_messages"), session={"chat_conversation_id": self.conversation.id})
+        self.assertIndexed(
+            reverse("mood_chat_messages"), {"before": 10}, session={"chat_conversation_id": self.conversation.id}
+        )
+
+    def test_health_map_area_filter(self):
+        self.assertIndexed(reverse("health_map"), {"upazila": "Char Fasson"})
+
+    def test_offline_pack(self):
+        self.assertIndexed(reverse("offline_pack", args=[self.union.id]))
+
+    def test_analytics(self):
+        self.client.force_login(self.staff)
+        for section in ("overview", "regional", "trends"):
+            self.assertIndexed(reverse("analytics", args=[section]), {"start": "2026-01-01", "end": "2026-12-31"})
+
+    def test_exports(self):
+        self.client.force_login(self.staff)
+        for name in ("mood", "help", "vaccination", "chat"):
+            self.assertIndexed(reverse("export_table", args=[name]), {"start": "2026-01-01", "end": "2026-12-31"})
+        self.assertIndexed(reverse("export_table", args=["mood"]), {"union": self.union.id})
+
+
+@override_settings(CACHES=TEST_CACHES)
+@mock.patch("main.db_router.replicas", return_value=["replica1"])
+class ReplicaRouterTests(SimpleTestCase):
+    """Reads in a request go to a replica until that browser writes"""
+
+    def route(self, request, write=False):
+        router = ReplicaRouter()
+        seen = {}
+
+        def view(request):
+            seen["before"] = router.db_for_read(MoodCheckIn)
+            if write:
+                router.db_for_write(MoodCheckIn)
+                seen["after"] = router.db_for_read(MoodCheckIn)
+            return HttpResponse()
+
+        response = PrimaryPinMiddleware(view)(request)
+        return seen, response
+
+    def test_get_reads_from_replica(self, replicas):
+        seen, response = self.route(RequestFactory().get("/"))
+        self.assertEqual(seen["before"], "replica1")
+        self.assertNotIn(PIN_COOKIE, response.cookies)
+
+    def test_write_pins_request_and_browser(self, replicas):
+        seen, response = self.route(RequestFactory().get("/"), write=True)
+        self.assertEqual(seen["after"], "default")
+        self.assertIn(PIN_COOKIE, response.cookies)
+
+        request = RequestFactory().get("/")
+        request.COOKIES[PIN_COOKIE] = response.cookies[PIN_COOKIE].value
+        self.assertEqual(self.route(request)[0]["before"], "default")
+
+        request.COOKIES[PIN_COOKIE] = str(clock.time() - 1)
+        self.assertEqual(self.route(request)[0]["before"], "replica1")
+
+    def test_post_and_outside_requests_read_primary(self, replicas):
+        self.assertEqual(self.route(RequestFactory().post("/"))[0]["before"], "default")
+        self.assertEqual(ReplicaRouter().db_for_read(MoodCheckIn), "default")
+
+
+@override_settings(CACHES=TEST_CACHES, OUTBOX_HELP_RECIPIENTS=["support@example.com"], OUTBOX_DIGEST_SECONDS=3600)
+class OutboxTests(TestCase):
+    """Help request notifications are queued, then sent by the outbox worker (locmem mail backend)"""
+
+    def submit(self, help_type):
+        response = self.client.post(reverse("help_request"), {"help_type": help_type, "description": "help"})
+        self.assertEqual(response.status_code, 200)
+
+    def test_emergency_sent_on_next_send(self):
+        self.submit("emergency")
+        self.assertEqual(len(mail.outbox), 0)
+
+        self.assertEqual(outbox.send_due(), (1, 0))
+        self.assertEqual(mail.outbox[0].to, ["support@example.com"])
+        self.assertEqual(OutboxEmail.objects.get().status, "sent")
+
+    @override_settings(EMAIL_HOST_USER="alerts@example.com")
+    def test_sent_from_smtp_login(self):
+        self.submit("emergency")
+        self.submit("other")
+        OutboxEmail.objects.update(created_at=timezone.now() - timedelta(hours=2))
+        self.assertEqual(outbox.send_due(), (2, 0))
+        self.assertEqual([message.from_email for message in mail.outbox], ["alerts@example.com"] * 2)
+
+    def test_other_types_wait_for_one_digest(self):
+        self.submit("other")
+        self.submit("mental_health")
+        self.assertEqual(outbox.send_due(), (0, 0))
+
+        OutboxEmail.objects.update(created_at=timezone.now() - timedelta(hours=2))
+        self.assertEqual(outbox.send_due(), (2, 0))
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertIn("2", mail.outbox[0].subject)
+
+    def test_failure_backs_off_then_retries(self):
+        self.submit("emergency")
+        with mock.patch("django.core.mail.EmailMessage.send", side_effect=OSError("smtp down")):
+            self.assertEqual(outbox.send_due(), (0, 1))
+        email = OutboxEmail.objects.get()
+        self.assertEqual((email.status, email.attempts), ("pending", 1))
+        self.assertGreater(email.next_attempt_at, timezone.now() + timedelta(seconds=50))
+        self.assertEqual(outbox.send_due(), (0, 0))
+
+        OutboxEmail.objects.update(next_attempt_at=timezone.now())
+        self.assertEqual(outbox.send_due(), (1, 0))
+
+
+@override_settings(AI_BREAKER_FAILURES=2, AI_BREAKER_COOLDOWN=30.0, CACHES=TEST_CACHES)
+class AIGovernorTests(SimpleTestCase):
+    """Repeated AI failures open the breaker, which then serves fallbacks without calling out"""
+
+    def setUp(self):
+        ai_governor._reset_after_fork()
+
+    def fail(self, timeout):
+        raise ConnectionError("provider down")
+
+    def test_breaker_opens_then_half_opens(self):
+        for _ in range(2):
+            with self.assertRaises(ConnectionError):
+                ai_governor.call("openai", self.fail)
+        upstream = mock.Mock(return_value="ok")
+        with self.assertRaises(ai_governor.AIUnavailable):
+            ai_governor.call("openai", upstream)
+        upstream.assert_not_called()
+        self.assertEqual(ai_governor.metrics()["providers"]["openai"]["state"], "open")
+
+        ai_governor.breaker("openai").opened_at -= 31
+        self.assertEqual(ai_governor.call("openai", upstream), "ok")
+        self.assertEqual(ai_governor.metrics()["providers"]["openai"]["state"], "closed")
+
+    def test_open_breaker_serves_fallback(self):
+        with mock.patch("main.ai_service.get_openai_client") as client:
+            client.return_value.with_options.return_value.chat.completions.create.side_effect = ConnectionError
+            service = AIService()
+            fallback = service._get_fallback_response("en")
+            for _ in range(3):
+                self.assertEqual(service.get_ai_response("hello", "en", use_cache=False), fallback)
+        self.assertEqual(client.return_value.with_options.return_value.chat.completions.create.call_count, 2)
+
+    def test_async_deadline_counts_as_timeout(self):
+        async def slow():
+            await asyncio.sleep(1)
+
+        with self.assertRaises(asyncio.TimeoutError):
+            asyncio.run(ai_governor.acall("genai", slow, deadline=0.01))
+        self.assertEqual(ai_governor.metrics()["providers"]["genai"]["timeouts"], 1)
+
+
+@override_settings(CACHES=TEST_CACHES)
+class SingleFlightTests(SimpleTestCase):
+    """Identical prompts in flight at the same time make one upstream call"""
+
+    def setUp(self):
+        ai_governor._reset_after_fork()
+        caches["default"].clear()
+
+    def test_async_callers_share_one_call(self):
+        async def create(**kwargs):
+            await asyncio.sleep(0.05)
+            return mock.Mock(choices=[mock.Mock(message=mock.Mock(content="drink water"))])
+
+        async def burst():
+            service = AIService()
+            return await asyncio.gather(*(service.aget_ai_response("Help? ", "bn", "general") for _ in range(5)))
+
+        with mock.patch("main.ai_service.get_async_openai_client") as client:
+            client.return_value.chat.completions.create.side_effect = create
+            self.assertEqual(asyncio.run(burst()), ["drink water"] * 5)
+        self.assertEqual(client.return_value.chat.completions.create.call_count, 1)
+
+    def test_threads_share_one_call_and_its_error(self):
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def leader():
+            calls.append(1)
+            started.set()
+            release.wait()
+            raise ConnectionError("provider down")
+
+        flights = SingleFlight()
+        errors = []
+
+        def run():
+            try:
+                flights.do("key", leader)
+            except ConnectionError as error:
+                errors.append(error)
+
+        threads = [threading.Thread(target=run)]
+        threads[0].start()
+        started.wait()
+        threads += [threading.Thread(target=run) for _ in range(3)]
+        for thread in threads[1:]:
+            thread.start()
+        while flights.stats().get("coalesced", 0) < 3:
+            clock.sleep(0.01)
+        release.set()
+        for thread in threads:
+            thread.join()
+        self.assertEqual((len(calls), len(errors)), (1, 4))
+
+
+@override_settings(CACHES=TEST_CACHES, WRITE_BUFFER_ENABLED=False)
+class StreamingTests(TestCase):
+    """Stream mode sends NDJSON sentence events and saves the exchange once, at the end"""
+
+    async def events(self, response):
+        self.assertEqual(response["Content-Type"], streaming.NDJSON)
+        body = b"".join([chunk async for chunk in response.streaming_content])
+        return [json.loads(line) for line in body.decode().splitlines()]
+
+    @override_settings(OPENAI_API_KEY=None)
+    async def test_chat_stream_saves_exchange_once(self):
+        response = await self.async_client.post(reverse("mood_send_message"), {"message": "hello", "stream": "1"})
+        events = await self.events(response)
+
+        self.assertTrue(events[-1]["done"])
+        self.assertEqual("".join(event.get("delta", "") for event in events[:-1]), events[-1]["response"])
+        messages = [message async for message in ChatMessage.objects.order_by("id")]
+        self.assertEqual([message.id for message in messages], [events[-1]["user_message_id"], events[-1]["message_id"]])
+        session = await self.async_client.asession()
+        self.assertEqual(await session.aget("chat_conversation_id"), messages[0].conversation_id)
+
+    async def test_voice_stream_sends_sentences(self):
+        async def reply(*args):
+            for piece in ("Drink ", "water. Rest", " well."):
+                yield piece
+
+        with mock.patch("main.views.ai_service.astream_ai_response", side_effect=reply):
+            response = await self.async_client.post(
+                "/process-command/", {"command": "my head hurts", "stream": True}, content_type="application/json"
+            )
+            events = await self.events(response)
+
+        self.assertEqual([event.get("delta") for event in events[:-1]], ["Drink water. ", "Rest well."])
+        self.assertEqual(events[-1]["message"], "Drink water. Rest well.")
+        self.assertEqual(await VoiceCommand.objects.acount(), 1)
+
+    async def test_decimals_and_titles_do_not_end_sentences(self):
+        async def deltas():
+            for piece in ("Take 3.", "5 mg and see Dr. Rahman", " today. ", "Rest।", " ভালো থাকুন"):
+                yield piece
+
+        self.assertEqual(
+            [sentence async for sentence in streaming.sentences(deltas())],
+            ["Take 3.5 mg and see Dr. Rahman today. ", "Rest। ", "ভালো থাকুন"],
+        )
+
+
+@override_settings(CACHES=TEST_CACHES, OPENAI_API_KEY=None)
+class ChatJobTests(TestCase):
+    """Job mode answers each idempotency key once, however often the client resubmits"""
+
+    def submit(self, key="key-1", message="hello"):
+        return self.client.post(
+            reverse("mood_send_message"), {"message": message, "mode": "job", "idempotency_key": key}
+        )
+
+    def test_resubmits_share_one_job_and_one_answer(self):
+        first = self.submit()
+        self.assertEqual(first.status_code, 202)
+        self.assertEqual(self.submit().json()["job_id"], first.json()["job_id"])
+        self.assertEqual(ChatJob.objects.count(), 1)
+
+        with mock.patch("main.views.chat_fallback", return_value="rest well") as answer:
+            self.assertEqual(chat_jobs.process_due(), (1, 0))
+            self.assertEqual(chat_jobs.process_due(), (0, 0))
+        answer.assert_called_once()
+
+        done = self.client.get(reverse("mood_chat_job", args=[first.json()["job_id"]]))
+        self.assertEqual((done.status_code, done.json()["response"]), (200, "rest well"))
+        resubmit = self.submit()
+        self.assertEqual((resubmit.status_code, resubmit.json()["message_id"]), (200, done.json()["message_id"]))
+        self.assertEqual(ChatMessage.objects.count(), 2)
+
+    def test_key_reused_for_other_message_conflicts(self):
+        self.submit()
+        self.assertEqual(self.submit(message="something else").status_code, 409)
+
+    def test_poll_times_out_pending(self):
+        job_id = self.submit().json()["job_id"]
+        with override_settings(CHAT_JOB_POLL_SECONDS=0.01):
+            response = self.client.get(reverse("mood_chat_job", args=[job_id]), {"wait": "0.05"})
+        self.assertEqual((response.status_code, response.json()["status"]), (202, "pending"))
+
+    def test_keys_and_jobs_belong_to_one_browser(self):
+        job_id = self.submit().json()["job_id"]
+        other_browser = self.client_class()
+        self.assertEqual(other_browser.get(reverse("mood_chat_job", args=[job_id])).status_code, 404)
+
+        other_browser.post(reverse("mood_send_message"), {"message": "hi", "mode": "job", "idempotency_key": "key-1"})
+        self.assertEqual(ChatJob.objects.filter(idempotency_key="key-1").count(), 2)
+
+    @override_settings(OPENAI_API_KEY="test-key", CHAT_JOB_MAX_ATTEMPTS=2)
+    def test_model_failure_is_retried_not_answered(self):
+        job_id = self.submit().json()["job_id"]
+        with mock.patch("main.views.get_async_genai_client", side_effect=ConnectionError), self.assertLogs("main"):
+            self.assertEqual(chat_jobs.process_due(), (0, 1))
+            self.assertEqual(ChatJob.objects.get(id=job_id).status, "pending")
+            self.assertEqual(chat_jobs.process_due(), (0, 1))
+        self.assertEqual(ChatJob.objects.get(id=job_id).status, "failed")
+        self.assertFalse(ChatMessage.objects.exists())
+
+
+class StaticAssetTests(SimpleTestCase):
+    def test_minifiers_keep_strings_and_template_literals(self):
+        self.assertEqual(
+            minify_css('/* note */\n.a :hover {\n  content: "/* kept */";\n  color: red;\n}\n'),
+            '.a :hover{content:"/* kept */";color:red}',
+        )
+        source = "  // comment\n  const s = `\n    indented\n`;\n\n  go();\n"
+        self.assertEqual(minify_js(source), "const s = `\n    indented\n`;\ngo();\n")
+        # Backticks in dropped comments must not open a template literal
+        self.assertEqual(minify_js("// use `x` or `\n  a();\n"), "a();\n")
+
+    def test_collected_files_are_hashed_precompressed_and_served_immutable(self):
+        with tempfile.TemporaryDirectory() as root, override_settings(STATIC_ROOT=root):
+            call_command("collectstatic", interactive=False, verbosity=0)
+            hashed = staticfiles_storage.stored_name("css/base.css")
+            self.assertRegex(hashed, r"^css/base\.[0-9a-f]{12}\.css$")
+            self.assertTrue(staticfiles_storage.exists(hashed + ".gz"))
+
+            request = RequestFactory().get("/static/" + hashed, HTTP_ACCEPT_ENCODING="gzip, br;q=0")
+            response = static_serve.serve(request, hashed)
+            self.assertEqual(response["Content-Encoding"], "gzip")
+            self.assertEqual(response["Cache-Control"], static_serve.IMMUTABLE)
+            self.assertIn("Accept-Encoding", response["Vary"])
+            response.close()
+
+            plain = static_serve.serve(RequestFactory().get("/static/css/base.css"), "css/base.css")
+            self.assertNotIn("Content-Encoding", plain)
+            self.assertNotIn("immutable", plain["Cache-Control"])
+            plain.close()
+
+
+@override_settings(CACHES=TEST_CACHES)
+class AssetBudgetTests(TestCase):
+    def budget(self):
+        stdout, stderr = mock.Mock(), mock.Mock()
+        call_command("asset_budget", stdout=stdout, stderr=stderr)
+        return tuple("".join(call.args[0] for call in stream.write.call_args_list) for stream in (stdout, stderr))
+
+    def test_staff_page_measured_as_staff_or_reported_skipped(self):
+        with tempfile.TemporaryDirectory() as root, override_settings(STATIC_ROOT=root):
+            call_command("collectstatic", interactive=False, verbosity=0)
+            report, errors = self.budget()
+            self.assertIn("data_export: needs a staff user", errors)
+            self.assertNotIn("data_export", report)
+            self.assertIn("health_tips", report)
+
+            User.objects.create_user("staff", password="-", is_staff=True)
+            report, errors = self.budget()
+            self.assertEqual(errors, "")
+            self.assertRegex(report, r"\ndata_export +\d")
+
+
+@override_settings(CACHES=TEST_CACHES, OPENAI_API_KEY="test-key", WRITE_BUFFER_ENABLED=False)
+class AsyncViewTests(TestCase):
+    """The LLM-backed endpoints are async views; the sync test client drives them like a WSGI caller would"""
+
+    def setUp(self):
+        ai_governor._reset_after_fork()
+        for alias in TEST_CACHES:
+            caches[alias].clear()
+        patcher = mock.patch("main.ai_service.get_async_openai_client")
+        self.create = patcher.start().return_value.chat.completions.create = mock.AsyncMock()
+        self.addCleanup(patcher.stop)
+
+    def reply(self, content):
+        self.create.return_value = mock.Mock(choices=[mock.Mock(message=mock.Mock(content=content))])
+
+    def post(self, name, data):
+        response = self.client.post(reverse(name), data, content_type="application/json")
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def test_voice_command_asks_llm_and_logs(self):
+        self.reply("Drink water and rest.")
+        answer = self.post("process_command", {"command": "My head hurts"})
+        self.assertEqual((answer["type"], answer["message"]), ("ai_response", "Drink water and rest."))
+        self.assertEqual(self.create.call_count, 1)
+
+        self.assertEqual(self.post("process_command", {"command": "emergency"})["type"], "emergency")
+        self.assertEqual(self.create.call_count, 1)  # Matched locally
+        self.assertEqual(
+            list(VoiceCommand.objects.order_by("id").values_list("command_text", "language", "response_type")),
+            [("my head hurts", "en", "ai_response"), ("emergency", "en", "emergency")],
+        )
+
+    def test_unclear_mood_is_escalated_and_saved(self):
+        self.reply("negative")
+        answer = self.post("process_mood", {"mood_text": "went to the market", "language": "en"})
+        self.assertEqual(answer["sentiment"], "negative")
+        self.assertEqual(self.create.call_count, 1)
+        checkin = MoodCheckIn.objects.get()
+        self.assertEqual((checkin.mood, checkin.notes, checkin.sentiment), ("sad", "went to the market", "negative"))
+
+
+@override_settings(OPENAI_API_KEY="test-key")
+class AIClientTests(SimpleTestCase):
+    """Clients are built once per process (async: per event loop) and dropped after fork()"""
+
+    def setUp(self):
+        ai_clients._reset_after_fork()
+        self.addCleanup(ai_clients._reset_after_fork)
+
+    def test_sync_client_is_shared(self):
+        client = ai_clients.get_openai_client()
+        self.assertIs(ai_clients.get_openai_client(), client)
+        ai_clients._reset_after_fork()
+        self.assertIsNot(ai_clients.get_openai_client(), client)
+
+    def test_async_client_is_shared_per_loop(self):
+        async def twice():
+            return ai_clients.get_async_openai_client(), ai_clients.get_async_openai_client()
+
+        first, same = asyncio.run(twice())
+        self.assertIs(first, same)
+        other_loop, _ = asyncio.run(twice())
+        self.assertIsNot(other_loop, first)
+
+        async def after_fork():
+            loop_client = ai_clients.get_async_openai_client()
+            ai_clients._reset_after_fork()
+            return loop_client, ai_clients.get_async_openai_client()
+
+        before, after = asyncio.run(after_fork())
+        self.assertIsNot(after, before)
+
+
+@override_settings(CACHES=TEST_CACHES, AI_CACHE_ALIAS="shared", VERSION_CACHE_ALIAS="shared")
+class AIResponseCacheTests(SimpleTestCase):
+    def setUp(self):
+        for alias in TEST_CACHES:
+            caches[alias].clear()
+        self.cache = AIResponseCache()
+
+    def test_trivial_variants_share_an_answer(self):
+        self.cache.set("How do I treat a fever?", "bn", "health", "rest")
+        self.assertEqual(AIResponseCache().get("how do i  treat a FEVER", "bn", "health"), "rest")
+        self.assertIsNone(self.cache.get("how do i treat a fever", "en", "health"))
+
+    def test_clear_leaves_the_rest_of_the_shared_cache(self):
+        caches["shared"].set("offline-pack:1", "pack")
+        self.cache.set("fever", "bn", "health", "rest")
+        other_process = AIResponseCache()
+        self.assertEqual(other_process.get("fever", "bn", "health"), "rest")
+
+        self.cache.clear()
+        self.assertIsNone(self.cache.get("fever", "bn", "health"))
+        self.assertEqual(caches["shared"].get("offline-pack:1"), "pack")
+        with override_settings(SNAPSHOT_RECHECK_SECONDS=0):
+            self.assertIsNone(other_process.get("fever", "bn", "health"))
+
+    def test_local_hits_are_counted_without_shared_io(self):
+        self.cache.set("fever", "bn", "health", "rest")
+        with mock.patch.object(caches["shared"], "incr") as incr:
+            for _ in range(3):
+                self.cache.get("fever", "bn", "health")
+        incr.assert_not_called()
+        self.assertEqual(self.cache.stats()["local_hits"], 3)
+
+
+@override_settings(CACHES=TEST_CACHES)
+class SentimentTests(SimpleTestCase):
+    def assertLabel(self, text, label):
+        self.assertEqual(classify(text).label, label, text)
+
+    def test_contracted_negators_flip_polarity(self):
+        for text in ("I don't feel good", "I can't be happy", "I wasn't happy today", "I isn’t happy"):
+            self.assertLabel(text, "negative")
+        self.assertLabel("I don't feel bad", "positive")
+
+    def test_negation_stops_at_clause_punctuation(self):
+        self.assertLabel("no, I am happy", "positive")
+        self.assertLabel("not really. I am sad", "negative")
+
+    def test_bangla_negators_follow_the_word(self):
+        self.assertLabel("ভালো না", "negative")
+        self.assertLabel("valo lagche na", "negative")
+        self.assertLabel("আমি খুব ভালো আছি", "positive")
+
+    def test_counts_are_flushed_in_batches(self):
+        sentiment.reset_stats()
+        service = mock.Mock(aanalyze_sentiment=mock.AsyncMock(return_value="neutral"))
+        with mock.patch.object(caches["shared"], "aincr") as aincr:
+            for text in ("I am very happy", "I am very happy", "went to the market"):
+                asyncio.run(sentiment.aclassify_or_escalate(text, "en", service))
+        aincr.assert_not_called()
+        self.assertEqual(sentiment.stats()["local"], 2)
+        self.assertEqual(sentiment.stats()["escalated"], 1)
+
+
+class IntentMatcherTests(SimpleTestCase):
+    def test_exact_match_ignores_case_and_punctuation(self):
+        self.assertEqual(
+            intent_matcher.match("Nearest Hospital?"), IntentMatch("nearest_hospital", 1.0, "nearest hospital")
+        )
+
+    def test_fuzzy_match_tolerates_small_slips(self):
+        match = intent_matcher.match("ambulanse")
+        self.assertEqual((match.intent, match.phrase), ("emergency", "ambulance"))
+        self.assertGreaterEqual(match.confidence, 0.75)
+        self.assertIsNone(intent_matcher.match("hsp"))
+
+    def test_contained_phrase_scales_with_coverage(self):
+        match = intent_matcher.match("হাসপাতাল কোথায় আছে বলো")
+        self.assertEqual(match.intent, "nearest_hospital")
+        self.assertGreaterEqual(match.confidence, 0.75)
+        self.assertLess(intent_matcher.match("i need help with my homework today").confidence, 0.5)
+
+    def test_short_keywords_need_an_exact_match(self):
+        for command in ("yelp", "halp", "hel"):
+            self.assertIsNone(intent_matcher.match(command), command)
+        self.assertGreater(intent_matcher.match("hospitl").confidence, 0.75)
+
+    def test_negated_phrase_is_not_confident(self):
+        for command in ("no emergency", "হাসপাতাল না", "I don't need an ambulance"):
+            self.assertLess(intent_matcher.match(command).confidence, 0.5, command)
+
+
+@override_settings(CACHES=TEST_CACHES)
+class BackfillSentimentTests(TestCase):
+    def test_resumes_from_a_durable_checkpoint(self):
+        clear = MoodCheckIn.objects.create(mood="happy", notes="I am very happy")
+        unsure = MoodCheckIn.objects.create(mood="okay", notes="went to the market")
+        with mock.patch("main.ai_service.get_openai_client") as client:
+            create = client.return_value.with_options.return_value.chat.completions.create
+            create.return_value.choices = [mock.Mock(message=mock.Mock(content='["neutral"]'))]
+            call_command("backfill_sentiment", "--relabel", stdout=mock.Mock())
+            self.assertEqual(create.call_count, 1)
+            self.assertEqual(create.call_args.kwargs["model"], SENTIMENT_MODEL)
+
+            caches["shared"].clear()  # Checkpoints must not live in a cache
+            call_command("backfill_sentiment", "--relabel", stdout=mock.Mock())
+            self.assertEqual(create.call_count, 1)
+
+        clear.refresh_from_db()
+        unsure.refresh_from_db()
+        self.assertEqual((clear.sentiment, unsure.sentiment), ("positive", "neutral"))
+        self.assertEqual(BackfillCheckpoint.objects.get(name="sentiment:mood").last_id, unsure.id)
+
+    @override_settings(WRITE_BUFFER_ENABLED=False)
+    def test_voice_checkins_arrive_labelled(self):
+        response = self.client.post(
+            reverse("process_mood"), {"mood_text": "I am very happy today", "language": "en"},
+            content_type="application/json",
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(MoodCheckIn.objects.get().sentiment, "positive")
+
+
+@override_settings(CACHES=TEST_CACHES, WRITE_BUFFER_ENABLED=True, WRITE_BUFFER_MAX_ATTEMPTS=2)
+class WriteBufferTests(TestCase):
+    def setUp(self):
+        spool_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(spool_dir.cleanup)
+        self.spool_dir = Path(spool_dir.name)
+        self.enterContext(override_settings(WRITE_BUFFER_SPOOL_DIR=self.spool_dir))
+        self.enterContext(mock.patch.object(WriteBuffer, "_start"))  # Flushed by hand, not by a thread
+        self.buffer = WriteBuffer(VoiceCommand)
+
+    def test_poison_row_is_dead_lettered_after_retries(self):
+        self.buffer.add(command_text="one", language="bn", response_type="health")
+        self.buffer.add(command_text="bad", language=None, response_type="health")
+        self.buffer.add(command_text="two", language="en", response_type="health")
+
+        with self.assertLogs("main.write_buffer", "ERROR"):
+            self.assertEqual(self.buffer.flush(), 0)
+            self.assertEqual(self.buffer.flush(), 2)
+        self.assertEqual(sorted(VoiceCommand.objects.values_list("command_text", flat=True)), ["one", "two"])
+        dead = (self.spool_dir / "dead" / "main.voicecommand.jsonl").read_text(encoding="utf-8").splitlines()
+        self.assertEqual([json.loads(line)["fields"]["command_text"] for line in dead], ["bad"])
+        self.assertEqual(list(self.spool_dir.glob("main.voicecommand.*")), [])
+
+    def test_unavailable_database_keeps_rows(self):
+        self.buffer.add(command_text="one", language="bn", response_type="health")
+        locked = mock.patch.object(WriteBuffer, "_write", side_effect=OperationalError("database is locked"))
+        with self.assertLogs("main.write_buffer", "ERROR"), locked:
+            self.assertEqual(self.buffer.flush(), 0)
+            self.assertEqual(self.buffer.flush(), 0)
+        self.assertFalse((self.spool_dir / "dead").exists())
+        self.assertEqual(self.buffer.flush(), 1)
+        self.assertEqual(VoiceCommand.objects.get().command_text, "one")
+
+
+@override_settings(CACHES=TEST_CACHES, STORAGES=TEST_STORAGES)
+class ExportTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.staff = User.objects.create_user("staff", is_staff=True)
+        MoodCheckIn.objects.bulk_create([MoodCheckIn(mood="happy"), MoodCheckIn(mood="sad")])
+
+    def test_exports_are_staff_only(self):
+        urls = [reverse("data_export"), reverse("analytics", args=["overview"]), reverse("export_table", args=["mood"])]
+        for url in urls:
+            self.assertEqual(self.client.get(url).status_code, 302, url)
+        self.client.force_login(User.objects.create_user("visitor"))
+        self.assertEqual(self.client.get(reverse("export_table", args=["mood"])).status_code, 302)
+
+    async def test_asgi_export_streams_asynchronously(self):
+        await self.async_client.aforce_login(self.staff)
+        response = await self.async_client.get(reverse("export_table", args=["mood"]), {"format": "ndjson"})
+        self.assertTrue(response.is_async)
+        body = b"".join([chunk async for chunk in response.streaming_content])
+        self.assertEqual([json.loads(line)["mood"] for line in body.decode().splitlines()], ["happy", "sad"])
+
+
+
+@override_settings(CACHES=TEST_CACHES, TIP_POOL_RECHECK_SECONDS=0)
+class TipPoolTests(TestCase):
+    def setUp(self):
+        tip_pool.invalidate()
+
+    def titles(self, language, season):
+        """Titles of every tip the pool could pick"""
+        with mock.patch("main.tip_pool.random.choice", side_effect=lambda ids: ids[0]) as pick:
+            tip_pool.choice(language, season)
+        return sorted(tip_pool.get(tip_id)["title"] for tip_id in pick.call_args.args[0])
+
+    def generate(self, reply, *args, fallback=None):
+        stderr = mock.Mock()
+        with mock.patch("main.management.commands.generate_health_tips.AIService") as service:
+            service.return_value.get_ai_response.return_value = reply
+            service.return_value._get_fallback_response.return_value = fallback
+            call_command(
+                "generate_health_tips", "--languages", "en", "--seasons", "monsoon", *args,
+                stdout=mock.Mock(), stderr=stderr,
+            )
+        return stderr
+
+    def test_seasons_add_year_round_tips(self):
+        seasons = [current_season(date(2026, month, 1)) for month in (1, 4, 7, 11)]
+        self.assertEqual(seasons, ["winter", "summer", "monsoon", "winter"])
+        for title, season in (("Dengue", "monsoon"), ("Layers", "winter"), ("Water", "all")):
+            HealthTip.objects.create(title=title, content="-", language="en", season=season)
+        self.assertEqual(self.titles("en", "monsoon"), ["Dengue", "Water"])
+        self.assertEqual(self.titles("en", "all"), ["Water"])
+        self.assertIsNone(tip_pool.choice("bn", "monsoon"))
+
+    def test_reloads_after_a_change(self):
+        self.assertIsNone(tip_pool.choice("en", "all"))
+        tip = HealthTip.objects.create(title="Water", content="-", language="en", season="all")
+        self.assertEqual(tip_pool.choice("en", "all")["title"], "Water")
+
+        HealthTip.objects.filter(pk=tip.pk).update(title="Boiled water")  # No signal
+        self.assertEqual(tip_pool.choice("en", "all")["title"], "Water")
+        tip_pool.invalidate()
+        self.assertEqual(tip_pool.choice("en", "all")["title"], "Boiled water")
+
+        HealthTip.objects.filter(pk=tip.pk).update(title="Clean water")
+        bump_version(TipPool.version_name)  # As another process's invalidate() would
+        self.assertEqual(tip_pool.choice("en", "all")["title"], "Clean water")
+
+    def test_generate_strips_list_markers(self):
+        self.generate("1. Use a mosquito net\n- Empty standing water\n\n২) পানি ফুটিয়ে খান\n•   Wash hands")
+        self.assertEqual(
+            sorted(HealthTip.objects.filter(language="en", season="monsoon").values_list("content", flat=True)),
+            ["Empty standing water", "Use a mosquito net", "Wash hands", "পানি ফুটিয়ে খান"],
+        )
+        self.assertEqual(len(self.titles("en", "monsoon")), 4)
+
+    def test_generate_replace_only_clears_its_bucket(self):
+        HealthTip.objects.create(title="Old", content="Old", language="en", season="monsoon")
+        HealthTip.objects.create(title="Kept", content="Kept", language="en", season="winter")
+        self.generate("New tip")
+        self.assertEqual(HealthTip.objects.filter(season="monsoon").count(), 2)
+        self.generate("Newer tip", "--replace")
+        self.assertEqual(sorted(HealthTip.objects.values_list("content", flat=True)), ["Kept", "Newer tip"])
+
+    def test_generate_skips_fallback_replies(self):
+        stderr = self.generate("Sorry, try again later", fallback="Sorry, try again later")
+        self.assertIn("Skipping en/monsoon", stderr.write.call_args.args[0])
+        self.assertFalse(HealthTip.objects.exists())
+
+
+@override_settings(CACHES=TEST_CACHES)
+class FacilityIndexTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        # Scattered around Bhola, plus one far away in Dhaka
+        points = [(22.68, 90.64), (22.69, 90.66), (22.71, 90.60), (22.55, 90.70), (22.80, 90.50), (23.81, 90.41)]
+        for i, (lat, lon) in enumerate(points):
+            HealthFacility.objects.create(
+                name=f"F{i}", facility_type="pharmacy" if i % 2 else "clinic", address="-", upazila="-", union="-",
+                latitude=lat, longitude=lon,
+            )
+        Hospital.objects.create(name="H", address="-", latitude=22.70, longitude=90.65)
+        HealthFacility.objects.create(name="No location", facility_type="clinic", address="-", upazila="-", union="-")
+
+    def brute_force(self, lat, lon, types=None):
+        rows = [
+            (haversine_km(lat, lon, f.latitude, f.longitude), f.name)
+            for f in HealthFacility.objects.exclude(latitude=None) if not types or f.facility_type in types
+        ]
+        if not types or "hospital" in types:
+            rows += [(haversine_km(lat, lon, h.latitude, h.longitude), h.name) for h in Hospital.objects.all()]
+        return [name for _, name in sorted(rows)]
+
+    def test_matches_brute_force(self):
+        index = FacilityIndex()
+        for lat, lon in ((22.68, 90.64), (22.0, 91.0), (23.9, 90.3)):
+            self.assertEqual([f["name"] for f in index.nearest(lat, lon, k=4)], self.brute_force(lat, lon)[:4])
+            self.assertEqual(
+                [f["name"] for f in index.nearest(lat, lon, k=2, types={"pharmacy"})],
+                self.brute_force(lat, lon, {"pharmacy"})[:2],
+            )
+
+    def test_radius_and_refresh_on_write(self):
+        self.assertEqual([f["name"] for f in facility_index.nearest(23.81, 90.41, radius_km=5)], ["F5"])
+        HealthFacility.objects.create(
+            name="New", facility_type="clinic", address="-", upazila="-", union="-", latitude=23.80, longitude=90.40
+        )
+        nearest = facility_index.nearest(23.81, 90.41, radius_km=5)
+        self.assertEqual([f["name"] for f in nearest], ["F5", "New"])
+        self.assertLessEqual(nearest[0]["distance_km"], nearest[1]["distance_km"])
+
+
+@override_settings(CACHES=TEST_CACHES)
+class GeographyTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        district = District.objects.create(division=Division.objects.create(name="Barishal"), name="Bhola")
+        cls.char_fasson = Upazila.objects.create(district=district, name="Char Fasson", name_bn="চরফ্যাশন")
+        cls.lalmohan = Upazila.objects.create(district=district, name="Lalmohan", name_bn="লালমোহন")
+        # Union names repeat across upazilas
+        cls.union = Union.objects.create(upazila=cls.char_fasson, name="Hazariganj")
+        cls.other_union = Union.objects.create(upazila=cls.lalmohan, name="Hazariganj")
+
+    def test_spellings_resolve_to_one_upazila(self):
+        for spelling in ("Char Fasson", "char-fasson upazila", "চরফ্যাশন", "চরফ্যাশন উপজেলা"):
+            self.assertEqual(resolve_area(spelling), ("upazila", self.char_fasson.id), spelling)
+        self.assertIsNone(resolve_area("Dhaka"))
+
+    def test_saved_facility_links_scoped_union(self):
+        facility = HealthFacility.objects.create(
+            name="-", facility_type="clinic", address="-", upazila="লালমোহন", union="hazariganj union"
+        )
+        self.assertEqual((facility.upazila_area_id, facility.union_area_id), (self.lalmohan.id, self.other_union.id))
+
+
+@override_settings(CACHES=TEST_CACHES)
+class SearchTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.tip = HealthTip.objects.create(title="স্বাস্থ্যকর খাবার", content="শাকসবজি খান")
+        HealthTip.objects.create(title="Sleep", content="স্বাস্থ্যকর ঘুম দরকার")
+        cls.clinic = HealthFacility.objects.create(
+            name="Char Fasson Clinic", facility_type="clinic", address="Hospital road", upazila="-", union="-"
+        )
+
+    def test_bangla_prefix_ranks_title_over_body(self):
+        response = self.client.get(reverse("search"), {"q": "স্বাস্থ্য"})
+        results = response.json()["results"]
+        self.assertEqual([r["title"] for r in results], ["স্বাস্থ্যকর খাবার", "Sleep"])
+
+    def test_kind_filter_and_removal(self):
+        self.assertEqual(search.search("clinic", kinds=["tip"]), ([], False))
+        results, _ = search.search("char clin", kinds=["facility"])
+        self.assertEqual([(r["kind"], r["id"]) for r in results], [("facility", self.clinic.id)])
+        self.clinic.delete()
+        self.assertEqual(search.search("clinic"), ([], False))
+
+    def test_generated_tips_are_indexed(self):
+        with mock.patch("main.management.commands.generate_health_tips.AIService") as service:
+            service.return_value.get_ai_response.return_value = "Boil drinking water\nWash hands with soap"
+            call_command("generate_health_tips", "--languages", "en", "--seasons", "monsoon", stdout=mock.Mock())
+        results, _ = search.search("boil", kinds=["tip"])
+        self.assertEqual([r["title"] for r in results], ["Boil drinking water"])
+
+
+@override_settings(CACHES=TEST_CACHES)
+class OfflinePackTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        district = District.objects.create(division=Division.objects.create(name="Barishal"), name="Bhola")
+        upazila = Upazila.objects.create(district=district, name="Char Fasson")
+        cls.union = Union.objects.create(upazila=upazila, name="Hazariganj")
+        other_union = Union.objects.create(upazila=upazila, name="Aminabad")
+        HealthFacility.objects.create(
+            name="Clinic", facility_type="clinic", address="-", upazila="-", union="-", union_area=cls.union
+        )
+        HealthFacility.objects.create(
+            name="Elsewhere", facility_type="clinic", address="-", upazila="-", union="-", union_area=other_union
+        )
+        HealthFacility.objects.create(
+            name="Upazila Hospital", facility_type="hospital", address="-", upazila="-", union="-",
+            upazila_area=upazila,
+        )
+
+    def setUp(self):
+        for alias in TEST_CACHES:
+            caches[alias].clear()
+
+    def test_gzipped_pack_revalidates_until_data_changes(self):
+        url = reverse("offline_pack", args=[self.union.id])
+        response = self.client.get(url, HTTP_ACCEPT_ENCODING="gzip")
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        pack = json.loads(gzip.decompress(response.content))
+        self.assertEqual([f["name"] for f in pack["facilities"]], ["Clinic", "Upazila Hospital"])
+
+        etag = response["ETag"]
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+        HealthTip.objects.create(title="-", content="-", language="bn")
+        changed = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(changed.status_code, 200)
+        self.assertNotEqual(changed["ETag"], etag)
+        self.assertEqual(self.client.get(reverse("offline_pack", args=[self.union.id + 100])).status_code, 404)
+
+    def test_generated_tips_expire_packs(self):
+        url = reverse("offline_pack", args=[self.union.id])
+        etag = self.client.get(url)["ETag"]
+        with mock.patch("main.management.commands.generate_health_tips.AIService") as service:
+            service.return_value.get_ai_response.return_value = "খাবার পানি ফুটিয়ে খান"
+            call_command("generate_health_tips", "--languages", "bn", "--seasons", "all", stdout=mock.Mock())
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+
+@override_settings(CACHES=TEST_CACHES, OPENAI_API_KEY=None)
+class ChatHistoryTests(TestCase):
+    def test_pages_back_through_own_conversation(self):
+        for i in range(12):
+            self.client.post(reverse("mood_send_message"), {"message": f"m{i}"})
+        conversation = Conversation.objects.get()
+        self.assertEqual(ChatMessage.objects.filter(conversation=conversation).count(), 24)
+
+        url = reverse("mood_chat_messages")
+        first = self.client.get(url).json()
+        self.assertTrue(first["has_older"])
+        ids = [message["id"] for message in first["messages"]]
+        self.assertEqual(ids, sorted(ids))
+        self.assertEqual(first["messages"][-1]["role"], "assistant")
+
+        older = self.client.get(url, {"before": ids[0]}).json()
+        self.assertFalse(older["has_older"])
+        self.assertEqual(len(ids) + len(older["messages"]), 24)
+        self.assertEqual(older["messages"][0]["content"], "m0")
+        self.assertEqual(self.client_class().get(url).json(), {"messages": [], "has_older": False})
+
+
+@override_settings(CACHES=TEST_CACHES, STORAGES=TEST_STORAGES)
+class FragmentCacheTests(TestCase):
+    def setUp(self):
+        for alias in TEST_CACHES:
+            caches[alias].clear()
+
+    def test_cached_fragment_runs_no_queries_until_a_write(self):
+        MoodCheckIn.objects.create(mood="happy", notes="first note")
+        url = reverse("mood_tracker")
+        self.assertContains(self.client.get(url), "first note")
+
+        with CaptureQueriesContext(connection) as queries:
+            self.assertContains(self.client.get(url), "first note")
+        self.assertFalse([q["sql"] for q in queries if "main_moodcheckin" in q["sql"]])
+
+        MoodCheckIn.objects.create(mood="sad", notes="second note")
+        self.assertContains(self.client.get(url), "second note")
+
+
+@override_settings(CACHES=TEST_CACHES)
+class RollupTests(TestCase):
+    def rollup_rows(self):
+        return (
+            sorted(MoodRollup.objects.values_list("day", "union_id", "mood", "count")),
+            sorted(HelpRequestRollup.objects.values_list(
+                "day", "union_id", "help_type", "count", "resolved_count", "response_seconds"
+            )),
+        )
+
+    def test_signals_keep_rollups_equal_to_a_rebuild(self):
+        for mood in ("happy", "happy", "sad"):
+            MoodCheckIn.objects.create(mood=mood)
+        MoodCheckIn.objects.create(mood="sad").delete()
+        request = AnonymousHelpRequest.objects.create(help_type="other", description="-")
+        AnonymousHelpRequest.objects.create(help_type="other", description="-")
+        request.is_resolved = True  # resolved_at is stamped on save
+        request.save()
+
+        maintained = self.rollup_rows()
+        self.assertEqual([row[2:] for row in maintained[0]], [("happy", 2), ("sad", 1)])
+        self.assertEqual([row[3:5] for row in maintained[1]], [(2, 1)])
+        rollups.rebuild()
+        self.assertEqual(self.rollup_rows(), maintained)
+        self.assertEqual(rollups.overview()["total_checkins"], 3)
+
+
+@override_settings(CACHES=TEST_CACHES)
+class SnapshotTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        division = Division.objects.create(name="Barishal")
+        bhola = District.objects.create(division=division, name="Bhola")
+        barguna = District.objects.create(division=division, name="Barguna")
+        cls.district_id = bhola.id
+        cls.union = Union.objects.create(upazila=Upazila.objects.create(district=bhola, name="Char Fasson"), name="A")
+        other = Union.objects.create(upazila=Upazila.objects.create(district=barguna, name="Amtali"), name="B")
+        for day in (1, 2, 3):
+            MoodRollup.objects.create(day=date(2026, 3, day), union=cls.union, mood="happy", count=day)
+            MoodRollup.objects.create(day=date(2026, 3, day), union=other, mood="sad", count=1)
+
+    def mood_rows(self, path):
+        db = sqlite3.connect(path)
+        try:
+            return db.execute("SELECT day, count FROM mood_daily ORDER BY day").fetchall()
+        finally:
+            db.close()
+
+    def test_rebuild_only_replaces_recent_days(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = str(Path(directory) / "bhola.sqlite3")
+            snapshot.build(path, date(2026, 3, 1), date(2026, 3, 2), district_id=self.district_id)
+            self.assertEqual(self.mood_rows(path), [("2026-03-01", 1), ("2026-03-02", 2)])
+
+            # Day 1 is outside the refresh window, so its late change stays out of the snapshot
+            MoodRollup.objects.filter(day=date(2026, 3, 1)).update(count=10)
+            MoodRollup.objects.filter(day=date(2026, 3, 2), union=self.union).update(count=20)
+            written = snapshot.build(
+                path, date(2026, 3, 1), date(2026, 3, 3), district_id=self.district_id, refresh_days=0
+            )
+            self.assertEqual(written["mood_daily"], 2)
+            self.assertEqual(self.mood_rows(path), [("2026-03-01", 1), ("2026-03-02", 20), ("2026-03-03", 3)])
+            with open(path, "rb") as plain, gzip.open(path + ".gz") as packed:
+                self.assertEqual(plain.read(), packed.read())
@@ -0,0 +1,86 @@
+"""In-memory pool of pre-generated health tips.
+
+Tips are produced ahead of time by ``manage.py generate_health_tips`` and
+loaded here once per process, indexed by id and bucketed by
+(language, season), so picking a tip is a ``random.choice`` over a short
+list of ids: no LLM call and no table scan per request.
+
+Saving or deleting a ``HealthTip`` bumps the pool's version (see
+``main.signals`` and ``main.versions``); each process notices the new
+version within ``TIP_POOL_RECHECK_SECONDS`` and reloads.
+"""
+
+import random
+
+from asgiref.sync import sync_to_async
+from django.utils import timezone
+
+from .versions import VersionedSnapshot
+
+# Month -> season, following the seasonal advisories in the tips page
+SEASONS_BY_MONTH = {
+    3: "summer", 4: "summer", 5: "summer",
+    6: "monsoon", 7: "monsoon", 8: "monsoon", 9: "monsoon", 10: "monsoon",
+    11: "winter", 12: "winter", 1: "winter", 2: "winter",
+}
+
+DEFAULT_TIPS = {
+    'bn': 'নিয়মিত হাঁটাহাঁটি করুন এবং পর্যাপ্ত পানি পান করুন।',
+    'en': 'Walk regularly and drink plenty of water.',
+    'mixed': 'Regularly walk koren and plenty water drink korben.'
+}
+
+
+def current_season(today=None):
+    today = today or timezone.localdate()
+    return SEASONS_BY_MONTH[today.month]
+
+
+class TipPool(VersionedSnapshot):
+    version_name = "health-tip-pool"
+    recheck_setting = "TIP_POOL_RECHECK_SECONDS"
+
+    def __init__(self):
+        super().__init__()
+        self._tips = {}
+        self._choices = {}
+
+    def load(self):
+        from .models import HealthTip
+
+        tips = {}
+        buckets = {}
+        rows = HealthTip.objects.values_list("id", "language", "season", "title", "content")
+        for tip_id, language, season, title, content in rows.iterator():
+            tips[tip_id] = {"id": tip_id, "title": title, "content": content}
+            buckets.setdefault((language, season), []).append(tip_id)
+        # Precompute "this season + all year" id lists so a pick is a single random.choice
+        choices = {}
+        for language in {language for language, _ in buckets}:
+            year_round = buckets.get((language, "all"), [])
+            choices[(language, "all")] = year_round
+            for season in set(SEASONS_BY_MONTH.values()):
+                choices[(language, season)] = buckets.get((language, season), []) + year_round
+        self._tips, self._choices = tips, choices
+
+    def get(self, tip_id):
+        return self._tips.get(tip_id)
+
+    def choice(self, language, season=None):
+        """Pick a random tip for the language, preferring the current season"""
+        self.ensure_fresh()
+        return self._pick(language, season)
+
+    async def achoice(self, language, season=None):
+        if not self.is_fresh():
+            await sync_to_async(self.refresh)()
+        return self._pick(language, season)
+
+    def _pick(self, language, season):
+        ids = self._choices.get((language, season or current_season()))
+        if not ids:
+            return None
+        return self._tips.get(random.choice(ids))
+
+
+tip_pool = TipPool()
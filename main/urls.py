@@ -5,7 +5,12 @@ urlpatterns = [
     path("", views.home, name="home"),
     path("mood-tracker/", views.mood_tracker, name="mood_tracker"),
     path("mood-tracker/send-message/", views.send_message, name="mood_send_message"),
+    path("mood-tracker/messages/", views.chat_messages, name="mood_chat_messages"),
+    path("mood-tracker/jobs/<uuid:job_id>/", views.chat_job, name="mood_chat_job"),
     path("health-map/", views.health_map, name="health_map"),
+    path("api/facilities/nearest/", views.nearest_facilities, name="nearest_facilities"),
+    path("api/search/", views.search_api, name="search"),
+    path("api/offline-pack/<int:union_id>/", views.offline_pack, name="offline_pack"),
     path('voice-assistant/', views.voice_assistant, name='voice_assistant'),
     path('process-command/', views.process_voice_command, name='process_command'),
     path('process-mood/', views.process_mood_response, name='process_mood'),
@@ -16,4 +21,7 @@ urlpatterns = [
     path("health-events/", views.health_events, name="health_events"),
     path("worker-directory/", views.worker_directory, name="worker_directory"),
     path("data-export/", views.data_export, name="data_export"),
+    path("api/analytics/<str:section>/", views.analytics, name="analytics"),
+    path("api/export/<str:name>/", views.export_table, name="export_table"),
+    path("api/ai/metrics/", views.ai_metrics, name="ai_metrics"),
 ]
@@ -0,0 +1,96 @@
+"""Cross-process version counters for data that is cached in memory.
+
+Each in-memory structure (tip pool, facility index, ...) is tagged with a
+named version kept in the cache named by ``VERSION_CACHE_ALIAS``. Writers
+call :func:`bump_version` (usually from a signal); readers compare their
+snapshot against :func:`get_version` and reload when it moved.
+"""
+
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+
+
+def _cache():
+    return caches[getattr(settings, "VERSION_CACHE_ALIAS", "default")]
+
+
+def _key(name):
+    return f"version:{name}"
+
+
+def get_version(name):
+    return _cache().get(_key(name), 0)
+
+
+async def aget_version(name):
+    return await _cache().aget(_key(name), 0)
+
+
+def bump_version(name):
+    cache = _cache()
+    cache.add(_key(name), 0, timeout=None)
+    try:
+        return cache.incr(_key(name))
+    except ValueError:
+        cache.set(_key(name), 1, timeout=None)
+        return 1
+
+
+async def abump_version(name):
+    cache = _cache()
+    await cache.aadd(_key(name), 0, timeout=None)
+    try:
+        return await cache.aincr(_key(name))
+    except ValueError:
+        await cache.aset(_key(name), 1, timeout=None)
+        return 1
+
+
+class VersionedSnapshot:
+    """Base class for per-process snapshots that reload when their version moves.
+
+    Subclasses set ``version_name`` and implement ``load()``, which must
+    replace the snapshot's data in one assignment so readers never see a
+    half-built structure.
+    """
+
+    version_name = None
+    recheck_setting = "SNAPSHOT_RECHECK_SECONDS"
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._version = None
+        self._checked_at = 0.0
+        self._stale = True
+
+    def load(self):
+        raise NotImplementedError
+
+    def invalidate(self):
+        """Mark this process stale and tell the other processes to reload"""
+        self._stale = True
+        bump_version(self.version_name)
+
+    def is_fresh(self):
+        if self._stale:
+            return False
+        recheck = getattr(settings, self.recheck_setting, 30)
+        if time.monotonic() - self._checked_at < recheck:
+            return True
+        self._checked_at = time.monotonic()
+        return get_version(self.version_name) == self._version
+
+    def refresh(self):
+        with self._lock:
+            version = get_version(self.version_name)
+            self.load()
+            self._version = version
+            self._checked_at = time.monotonic()
+            self._stale = False
+
+    def ensure_fresh(self):
+        if not self.is_fresh():
+            self.refresh()
@@ -1,63 +1,153 @@
 from django.shortcuts import render, redirect
-from django.http import JsonResponse, HttpResponseBadRequest
+from django.http import JsonResponse, HttpResponseBadRequest, StreamingHttpResponse
 from django.conf import settings
-from django.core.mail import send_mail, BadHeaderError
+from asgiref.sync import sync_to_async
+from django.contrib.admin.views.decorators import staff_member_required
+from django.core.handlers.asgi import ASGIRequest
 from django.views.decorators.csrf import csrf_protect, ensure_csrf_cookie
+import asyncio
 import logging
+import time
 
 from .models import (
+    ChatJob,
     MoodCheckIn,
     HealthFacility,
     AnonymousHelpRequest,
-    OpenRouterChat,
+    Conversation,
+    ChatMessage,
+    Union,
 )
 from .forms import ChatForm
+from .ai_clients import get_async_genai_client
+from .ai_cache import response_cache
+from .geography import resolve_area
+from .versions import abump_version, get_version
+from .single_flight import llm_flights
+from .write_buffer import checkin_buffer, voice_command_buffer
+from .fragments import FRAGMENT_TIMEOUT, MOODS_VERSION, chat_version_name
+from . import ai_governor, chat_jobs, exports, outbox, rollups, streaming
+from django.utils.dateparse import parse_date
+from django.utils.functional import SimpleLazyObject
 import json
 from django.utils import timezone
 
 logger = logging.getLogger(__name__)
 
+GEMINI_MODEL = "gemini-2.5-flash"
+CHAT_PAGE_SIZE = 20
+
 
 def home(request):
     return render(request, "home.html")
 
 
+def posted_union_id(request):
+    """The optional union_id a client posted, or None if it names no known union"""
+    try:
+        union_id = int(request.POST.get("union_id", ""))
+    except ValueError:
+        return None
+    return union_id if Union.objects.filter(id=union_id).exists() else None
+
+
 def mood_tracker(request):
     if request.method == "POST":
         mood = request.POST.get("mood")
         notes = request.POST.get("notes", "")
 
         if mood:
-            MoodCheckIn.objects.create(mood=mood, notes=notes)
+            checkin_buffer.add(mood=mood, notes=notes, union_area_id=posted_union_id(request))
             return JsonResponse({"status": "success"})
 
-    # Get recent mood entries for display
+    # Both fragments are cached under their data's version (see main.signals), and the querysets
+    # below are lazy, so a page whose fragments are cached runs no queries at all
     recent_moods = MoodCheckIn.objects.all()[:10]
 
-    # Chat helper: show recent exchanges and the chat form
-    chats = OpenRouterChat.objects.order_by("id")[:20]
-    history = []
-    for item in chats:
-        lines = item.messages.splitlines()
-        user_line = lines[0].replace("User: ", "") if len(lines) > 0 else ""
-        ai_line = lines[1].replace("AI: ", "") if len(lines) > 1 else ""
-        history.append({"user": user_line, "ai": ai_line})
+    # Chat helper: show this browser's latest messages and the chat form
+    conversation_id = request.session.get("chat_conversation_id")
+    chat = SimpleLazyObject(lambda: dict(zip(("messages", "has_older"), chat_page(conversation_id))))
 
     form = ChatForm()
 
     return render(
         request,
         "mood_tracker.html",
-        {"recent_moods": recent_moods, "chat_form": form, "chat_history": history},
+        {
+            "recent_moods": recent_moods,
+            "moods_version": get_version(MOODS_VERSION),
+            "chat_form": form,
+            "chat": chat if conversation_id else {},
+            "conversation_id": conversation_id,
+            "chat_version": get_version(chat_version_name(conversation_id)) if conversation_id else 0,
+            "fragment_timeout": FRAGMENT_TIMEOUT,
+        },
     )
 
 
+def chat_page(conversation_id, before=None, limit=CHAT_PAGE_SIZE):
+    """Latest ``limit`` messages of a conversation older than id ``before``, oldest first.
+
+    Keyset pagination on (conversation_id, id), so every page is one index
+    range scan however long the conversation gets. Returns (messages, has_older).
+    """
+    messages = ChatMessage.objects.filter(conversation_id=conversation_id)
+    if before:
+        messages = messages.filter(id__lt=before)
+    page = list(messages.order_by("-id").values("id", "role", "content", "created_at")[: limit + 1])
+    return page[:limit][::-1], len(page) > limit
+
+
+def chat_messages(request):
+    """JSON API for the chat panel: ?before=<message id> pages back through this browser's conversation"""
+    conversation_id = request.session.get("chat_conversation_id")
+    try:
+        before = int(request.GET["before"]) if request.GET.get("before") else None
+    except ValueError:
+        return JsonResponse({"error": "before must be a message id."}, status=400)
+    if not conversation_id:
+        return JsonResponse({"messages": [], "has_older": False})
+
+    messages, has_older = chat_page(conversation_id, before)
+    return JsonResponse({"messages": messages, "has_older": has_older})
+
+
+async def conversation_for(request, channel):
+    """Id of this browser's conversation on ``channel``, starting one (and remembering it in the session) if needed"""
+    session_key = f"{channel}_conversation_id"
+    conversation_id = await request.session.aget(session_key)
+    if not conversation_id or not await Conversation.objects.filter(id=conversation_id).aexists():
+        conversation = await Conversation.objects.acreate(channel=channel)
+        conversation_id = conversation.id
+        await request.session.aset(session_key, conversation_id)
+    return conversation_id
+
+
+async def record_exchange(request, channel, user_message, ai_response):
+    """Append a user message and its reply to this browser's conversation on ``channel``"""
+    return await append_exchange(await conversation_for(request, channel), user_message, ai_response)
+
+
+async def append_exchange(conversation_id, user_message, ai_response):
+    messages = await ChatMessage.objects.abulk_create([
+        ChatMessage(conversation_id=conversation_id, role="user", content=user_message),
+        ChatMessage(conversation_id=conversation_id, role="assistant", content=ai_response),
+    ])
+    # bulk_create sends no signals, so retire the cached chat fragment here
+    await abump_version(chat_version_name(conversation_id))
+    return messages
+
+
 @csrf_protect
-def send_message(request):
+async def send_message(request):
     """AJAX endpoint used by the mood_tracker chat helper.
 
-    Accepts POST with 'message' and returns JSON {response: str, chat_id: int}.
+    Accepts POST with 'message' and returns JSON {response: str, user_message_id: int, message_id: int}.
+    With 'stream=1' the reply is streamed sentence by sentence as NDJSON instead (see main.streaming),
+    ending with a {done: true, ...} line holding the same fields.
+    With 'mode=job' and an 'idempotency_key' it returns a job id at once (see main.chat_jobs and chat_job).
     Tries to use external AI if OPENAI_API_KEY (or similar) is configured; falls back to echo.
+    Runs as an async view so the AI round trip does not hold a worker under ASGI.
     """
     if request.method != "POST":
         return HttpResponseBadRequest("Invalid request method")
@@ -70,50 +160,154 @@ def send_message(request):
     if not user_message:
         return JsonResponse({"error": "Message is required."}, status=400)
 
-    ai_response = None
-    api_key = getattr(settings, "OPENAI_API_KEY", None)
+    if request.POST.get("mode") == "job":
+        return await enqueue_chat_job(request, user_message)
+
+    if request.POST.get("stream") == "1":
+        # The session is saved with the response headers, before the body streams, so settle the conversation now
+        conversation_id = await conversation_for(request, "chat")
+        return streaming.ndjson_response(stream_chat_reply(conversation_id, user_message))
+
+    ai_response = await chat_reply(user_message)
+
+    # Persist the exchange
+    user_entry, ai_entry = await record_exchange(request, "chat", user_message, ai_response)
+
+    return JsonResponse(
+        {"response": ai_response, "user_message_id": user_entry.id, "message_id": ai_entry.id}, status=201
+    )
 
+
+async def enqueue_chat_job(request, user_message):
+    """send_message's job mode: queue the message under the client's idempotency key and return the job id"""
+    key = request.POST.get("idempotency_key", "").strip()
+    if not key or len(key) > 64:
+        return JsonResponse({"error": "idempotency_key (up to 64 characters) is required."}, status=400)
+
+    conversation_id = await conversation_for(request, "chat")
+    job, created = await sync_to_async(chat_jobs.enqueue)(key, conversation_id, user_message)
+    if job.message != user_message:
+        return JsonResponse({"error": "idempotency_key was already used for another message."}, status=409)
+    if job.status == "done":
+        job = await ChatJob.objects.select_related("reply").aget(id=job.id)
+        return JsonResponse(chat_jobs.payload(job))
+    return JsonResponse(chat_jobs.payload(job), status=202)
+
+
+async def chat_job(request, job_id):
+    """Long-poll for a deferred chat answer: ?wait=<seconds> holds the request until it is ready (capped)"""
     try:
-        if api_key:
-            # Try to use google genai if available (best-effort). If not installed, we'll fall back.
-            from google import genai  # type: ignore
-
-            client = genai.Client(api_key=api_key)
-            response = client.models.generate_content(
-                model="gemini-2.5-flash",
-                contents=user_message,
-            )
-            ai_response = (
-                response.text.strip()
-                if response and hasattr(response, "text") and response.text
-                else None
-            )
+        wait = min(max(float(request.GET.get("wait", 0)), 0), getattr(settings, "CHAT_JOB_MAX_WAIT", 25))
+    except ValueError:
+        return JsonResponse({"error": "wait must be a number of seconds."}, status=400)
+
+    # Only the browser whose conversation the job belongs to may read its answer
+    conversation_id = await request.session.aget("chat_conversation_id")
+    give_up_at = time.monotonic() + wait
+    while True:
+        job = await ChatJob.objects.select_related("reply").filter(id=job_id, conversation_id=conversation_id).afirst()
+        if conversation_id is None or job is None:
+            return JsonResponse({"error": "Unknown job."}, status=404)
+        if job.status in ("done", "failed") or time.monotonic() >= give_up_at:
+            return JsonResponse(chat_jobs.payload(job), status=200 if job.status == "done" else 202)
+        await asyncio.sleep(getattr(settings, "CHAT_JOB_POLL_SECONDS", 0.5))
+
+
+async def chat_reply(user_message):
+    """The assistant's answer to a chat message: cached, from Gemini, or the gentle fallback"""
+    try:
+        ai_response = await model_chat_reply(user_message)
     except Exception as e:  # pragma: no cover - best-effort external call
         logger.warning("External AI call failed: %s", e)
+        ai_response = None
+    return ai_response or chat_fallback(user_message)
+
+
+async def model_chat_reply(user_message):
+    """Gemini's answer (cached or fresh), or None without an API key; raises if the call fails"""
+    ai_response = await response_cache.aget(user_message, "bn", "chat", GEMINI_MODEL)
+    if ai_response or not getattr(settings, "OPENAI_API_KEY", None):
+        return ai_response
+
+    # Try to use google genai if available (best-effort). If not installed, the caller falls back.
+    client = get_async_genai_client()
+    response = await ai_governor.acall("genai", lambda: client.aio.models.generate_content(
+        model=GEMINI_MODEL,
+        contents=user_message,
+    ))
+    ai_response = (
+        response.text.strip()
+        if response and hasattr(response, "text") and response.text
+        else None
+    )
+    await response_cache.aset(user_message, "bn", "chat", ai_response, GEMINI_MODEL)
+    return ai_response
 
-    if not ai_response:
-        # Gentle, empathetic fallback tailored for the mood tracker users
-        # Keep language simple and validation-friendly for rural users
-        ai_response = (
-            "আমি শুনলাম — এটা সহজ নয়। আপনি বলছেন: '" + user_message + "'. "
-            "যদি আপনি চান, আমি একটু শান্ত করার কথা বলতে পারি বা সাহায্যের পথ বলব।"
-        )
 
-    # Persist the exchange
-    chat = OpenRouterChat.objects.create(messages=f"User: {user_message}\nAI: {ai_response}")
+def chat_fallback(user_message):
+    # Gentle, empathetic fallback tailored for the mood tracker users
+    # Keep language simple and validation-friendly for rural users
+    return (
+        "আমি শুনলাম — এটা সহজ নয়। আপনি বলছেন: '" + user_message + "'. "
+        "যদি আপনি চান, আমি একটু শান্ত করার কথা বলতে পারি বা সাহায্যের পথ বলব।"
+    )
+
+
+async def gemini_deltas(prompt):
+    """Text pieces of a streamed Gemini reply, as they arrive"""
+    client = get_async_genai_client()
+    chunks = ai_governor.astream(
+        "genai", lambda: client.aio.models.generate_content_stream(model=GEMINI_MODEL, contents=prompt)
+    )
+    async for chunk in chunks:
+        if chunk.text:
+            yield chunk.text
 
-    return JsonResponse({"response": ai_response, "chat_id": chat.id}, status=201)
+
+async def stream_chat_reply(conversation_id, user_message):
+    """NDJSON events for send_message's stream mode; the exchange is saved once the reply is complete"""
+    ai_response = await response_cache.aget(user_message, "bn", "chat", GEMINI_MODEL)
+    if not ai_response and getattr(settings, "OPENAI_API_KEY", None):
+        parts = []
+        try:
+            async for sentence in streaming.sentences(gemini_deltas(user_message)):
+                parts.append(sentence)
+                yield streaming.event({"delta": sentence})
+        except Exception as e:  # pragma: no cover - best-effort external call
+            logger.warning("External AI stream failed: %s", e)
+        else:
+            await response_cache.aset(user_message, "bn", "chat", "".join(parts).strip(), GEMINI_MODEL)
+        ai_response = "".join(parts).strip()
+    elif ai_response:
+        yield streaming.event({"delta": ai_response})
+
+    if not ai_response:
+        ai_response = chat_fallback(user_message)
+        yield streaming.event({"delta": ai_response})
+
+    user_entry, ai_entry = await append_exchange(conversation_id, user_message, ai_response)
+    yield streaming.event(
+        {"done": True, "response": ai_response, "user_message_id": user_entry.id, "message_id": ai_entry.id}
+    )
 
 
 def health_map(request):
     facilities = HealthFacility.objects.all()
 
-    # Filter by upazila if provided
+    # Filter by upazila or union if provided; known spellings resolve to an indexed id
     upazila = request.GET.get("upazila")
+    union_id = None
     if upazila:
-        facilities = facilities.filter(upazila__icontains=upazila)
+        area = resolve_area(upazila)
+        if area:
+            level, area_id = area
+            facilities = facilities.filter(**{f"{level}_area_id": area_id})
+            if level == "union":
+                union_id = area_id
+        else:
+            facilities = facilities.filter(upazila__icontains=upazila)
 
-    return render(request, "health_map.html", {"facilities": facilities})
+    return render(request, "health_map.html", {"facilities": facilities, "union_id": union_id})
 
 
 def voice_assistant(request):
@@ -128,7 +322,7 @@ def voice_assistant(request):
 
 
 @csrf_protect
-def send_voice_command(request):
+async def send_voice_command(request):
     """Handle voice commands sent from the browser.
 
     Accepts POST with 'command' (recognized Bangla text). Returns JSON {response: str, action: optional}
@@ -155,11 +349,10 @@ def send_voice_command(request):
     # Facility intent (hospital location)
     if "হাসপাতাল" in lower or ("কোথ" in lower and "হাসপাতাল" in lower):
         # return nearest hospital if available
-        hosp = HealthFacility.objects.filter(facility_type__icontains="hospital")[:1]
-        if not hosp:
-            hosp = HealthFacility.objects.all()[:1]
-        if hosp:
-            h = hosp[0]
+        h = await HealthFacility.objects.filter(facility_type__icontains="hospital").afirst()
+        if not h:
+            h = await HealthFacility.objects.afirst()
+        if h:
             resp = f"{h.name}, ঠিকানা: {h.address}. যোগাযোগ: {h.contact or 'নাই'}"
             return JsonResponse({"response": resp})
 
@@ -170,17 +363,15 @@ def send_voice_command(request):
             "বলুন এবং আমি সেটি রেকর্ড করব।"
         )
         # store the command in chat history for review
-        OpenRouterChat.objects.create(messages=f"User: {command}\nAI: {resp}")
+        await record_exchange(request, "voice", command, resp)
         return JsonResponse({"response": resp, "action": "expect_mood"})
 
     # Fallback to external AI if API key present
     api_key = getattr(settings, "OPENAI_API_KEY", None)
-    ai_response = None
+    ai_response = await response_cache.aget(command, "bn", "voice", GEMINI_MODEL)
     try:
-        if api_key:
-            from google import genai  # type: ignore
-
-            client = genai.Client(api_key=api_key)
+        if api_key and not ai_response:
+            client = get_async_genai_client()
             # provide a short system prompt to prefer Bangla and action-friendly replies
             prompt = (
                 "You are MonBondhu voice assistant speaking Bengali (Bangla). "
@@ -188,12 +379,15 @@ def send_voice_command(request):
                 "answer with a short text and, if applicable, include a JSON-like field 'action' such as 'expect_mood' or 'show_facility'.\n"
                 f"User: {command}"
             )
-            response = client.models.generate_content(model="gemini-2.5-flash", contents=prompt)
+            response = await ai_governor.acall(
+                "genai", lambda: client.aio.models.generate_content(model=GEMINI_MODEL, contents=prompt)
+            )
             ai_response = (
                 response.text.strip()
                 if response and hasattr(response, "text") and response.text
                 else None
             )
+            await response_cache.aset(command, "bn", "voice", ai_response, GEMINI_MODEL)
     except Exception as e:
         logger.warning("Voice assistant external AI call failed: %s", e)
 
@@ -203,7 +397,7 @@ def send_voice_command(request):
             "আমি আপনার অনুরোধ বুঝতে পারি না পুরোপুরি, তবে আমি সাহায্য করতে চাই। আপনি 'স্বাস্থ্য তথ্য দেখাও' অথবা 'হাসপাতাল কোথায়' বলতে পারেন।"
         )
 
-    OpenRouterChat.objects.create(messages=f"User: {command}\nAI: {ai_response}")
+    await record_exchange(request, "voice", command, ai_response)
     return JsonResponse({"response": ai_response})
 
 
@@ -217,30 +411,11 @@ def help_request(request):
             help_type=help_type,
             description=description,
             contact_preference=contact_preference,
+            union_area_id=posted_union_id(request),
         )
 
-        # Send an email notification to the support address using EMAIL_HOST_USER
-        subject = "[MonBondhu] নতুন গোপন সাহায্য অনুরোধ"
-        body = (
-            f"Help type: {help_type}\n"
-            f"Description: {description}\n"
-            f"Contact preference: {contact_preference}\n"
-            f"Submitted at: {timezone.now()}\n"
-            f"Request id: {req.id}\n"
-        )
-        from_email = getattr(settings, "EMAIL_HOST_USER", None)
-        recipient = ["tahsin.azad.skt@gmail.com"]
-        try:
-            if from_email:
-                send_mail(subject, body, from_email, recipient, fail_silently=False)
-            else:
-                # If no from_email configured, attempt to send without explicit from (Django will use DEFAULT_FROM_EMAIL)
-                send_mail(subject, body, None, recipient, fail_silently=False)
-        except BadHeaderError:
-            logger.exception("Invalid header found when sending help_request email")
-        except Exception:
-            # Log and continue — the primary function (storing the request) succeeded
-            logger.exception("Failed to send help_request email notification")
+        # Queued, not sent here: an SMTP stall must not hold up someone asking for help (see main/outbox.py)
+        outbox.notify_help_request(req)
 
         return JsonResponse(
             {"status": "success", "message": "আপনার অনুরোধ সফলভাবে জমা হয়েছে"}
@@ -269,10 +444,75 @@ def worker_directory(request):
     return render(request, "worker_directory.html")
 
 
+# The export pages and APIs expose every user's (anonymized) rows, so only staff may use them
+@staff_member_required
 def data_export(request):
     return render(request, "data_export.html")
 
 
+def date_range(request):
+    """(start, end) from ?start=&end= (YYYY-MM-DD, either optional); raises ValueError naming a bad one"""
+    dates = []
+    for key in ("start", "end"):
+        value = request.GET.get(key)
+        try:
+            day = parse_date(value) if value else None
+        except ValueError:
+            day = None
+        if value and day is None:
+            raise ValueError(f"{key} must be a YYYY-MM-DD date.")
+        dates.append(day)
+    return tuple(dates)
+
+
+@staff_member_required
+def analytics(request, section):
+    """JSON API: one data export section from the rollup tables, optionally ?start=&end= (YYYY-MM-DD)"""
+    if section not in rollups.SECTIONS:
+        return JsonResponse({"error": "Unknown section."}, status=404)
+    try:
+        start, end = date_range(request)
+    except ValueError as e:
+        return JsonResponse({"error": str(e)}, status=400)
+    return JsonResponse(rollups.SECTIONS[section](start, end))
+
+
+@staff_member_required
+def export_table(request, name):
+    """Streamed download of one anonymized table: ?format=csv|ndjson, ?start=&end=, ?union=|upazila=|district=, ?gzip=1"""
+    if name not in exports.EXPORTS:
+        return JsonResponse({"error": "Unknown export."}, status=404)
+    fmt = request.GET.get("format", "csv")
+    if fmt not in exports.FORMATS:
+        return JsonResponse({"error": "format must be csv or ndjson."}, status=400)
+    try:
+        start, end = date_range(request)
+    except ValueError as e:
+        return JsonResponse({"error": str(e)}, status=400)
+    try:
+        areas = {key: int(request.GET[key]) for key in exports.AREA_FILTERS if request.GET.get(key)}
+    except ValueError:
+        return JsonResponse({"error": "union, upazila and district must be ids."}, status=400)
+
+    compress = request.GET.get("gzip") == "1"
+    rows = exports.export_rows(name, start, end, areas)
+    filename = f"monbondhu_{name}_{timezone.localdate():%Y-%m-%d}.{fmt}" + (".gz" if compress else "")
+    chunks = exports.stream(name, fmt, rows, gzip=compress)
+    if isinstance(request, ASGIRequest):
+        chunks = exports.aiter_chunks(chunks)
+    response = StreamingHttpResponse(
+        chunks,
+        content_type="application/gzip" if compress else exports.FORMATS[fmt],
+    )
+    response["Content-Disposition"] = f'attachment; filename="{filename}"'
+    return response
+
+
+def ai_metrics(request):
+    """JSON API: this worker process's AI circuit breakers and coalesced calls (see ai_governor, single_flight)"""
+    return JsonResponse({**ai_governor.metrics(), "single_flight": llm_flights.stats()})
+
+
 from django.shortcuts import render
 from django.http import JsonResponse
 from django.views.decorators.csrf import csrf_exempt
@@ -452,13 +692,30 @@ from django.shortcuts import render
 from django.http import JsonResponse
 from django.views.decorators.csrf import csrf_exempt
 import json
-from .models import HealthTip, Hospital
+from .models import HealthTip, Hospital, MoodCheckIn
 from .ai_service import AIService, HealthAPIService
+from .tip_pool import DEFAULT_TIPS, tip_pool
+from .geo_index import facility_index
+from . import search
+from .intents import intent_matcher
+from .offline_pack import get_pack
+from .sentiment import aclassify_or_escalate
+from django.http import HttpResponse, HttpResponseNotModified
+from django.utils.cache import patch_vary_headers
+from django.utils.http import parse_etags
+import gzip
 import random
 
 ai_service = AIService()
 health_api = HealthAPIService()
 
+# Map sentiment labels onto MoodCheckIn.MOOD_CHOICES
+SENTIMENT_MOODS = {
+    'positive': 'happy',
+    'negative': 'sad',
+    'neutral': 'neutral',
+}
+
 def home(request):
     return render(request, 'index.html')
 
@@ -466,15 +723,23 @@ def voice_assistant(request):
     return render(request, 'voice_assistant.html')
 
 @csrf_exempt
-def process_voice_command(request):
+async def process_voice_command(request):
     if request.method == 'POST':
         try:
             data = json.loads(request.body)
             command = data.get('command', '').lower()
             language = detect_language(command)
+            location = parse_location(data.get('lat'), data.get('lon'))
+            
+            if data.get('stream'):
+                # NDJSON: LLM replies arrive sentence by sentence so speech can start early (see main.streaming)
+                return streaming.ndjson_response(stream_voice_reply(command, language, location))
             
             # Use AI service for intelligent responses
-            response = process_with_ai(command, language)
+            response = await process_with_ai(command, language, location)
+            await voice_command_buffer.aadd(
+                command_text=command[:500], language=language, response_type=response.get('type', ''),
+            )
             return JsonResponse(response)
             
         except Exception as e:
@@ -495,47 +760,47 @@ def detect_language(text):
     else:
         return 'en'
 
-def process_with_ai(command, language):
+def confident_intent(command):
+    """The locally matched intent for a command, or None if it should go to the LLM"""
+    match = intent_matcher.match(command)
+    if match and match.confidence >= getattr(settings, 'INTENT_MIN_CONFIDENCE', 0.75):
+        return match
+    return None
+
+async def process_with_ai(command, language, location=None):
     """Process command using AI service for intelligent responses"""
     
-    # Check for specific commands first
-    specific_commands = {
-        'bn': {
-            'স্বাস্থ্য তথ্য দেখাও': get_health_tip,
-            'হাসপাতাল কোথায়': get_nearest_hospital,
-            'আমি আজ কেমন আছি': mood_check,
-            'সাহায্য কর': get_help,
-            'হেল্প': get_help,
-            'জরুরী': handle_emergency,
-        },
-        'en': {
-            'show health info': get_health_tip,
-            'where is hospital': get_nearest_hospital,
-            'how am i today': mood_check,
-            'help me': get_help,
-            'help': get_help,
-            'emergency': handle_emergency,
-        },
-        'mixed': {
-            'health info dekhao': get_health_tip,
-            'hospital kothay': get_nearest_hospital,
-            'ami aj kemon achi': mood_check,
-            'help korba': get_help,
-            'emergency help': handle_emergency,
-        }
-    }
-    
-    # Check if it's a specific command
-    for lang_commands in specific_commands.values():
-        if command in lang_commands:
-            return lang_commands[command](language)
+    # Known commands are matched locally (see intents.py); only the rest go to the LLM
+    match = confident_intent(command)
+    if match:
+        handler = INTENT_HANDLERS[match.intent]
+        if match.intent == 'nearest_hospital':
+            return await handler(language, location)
+        return await handler(language)
     
     # Use AI for general conversation and health queries
-    return handle_general_query(command, language)
+    return await handle_general_query(command, language)
+
+async def stream_voice_reply(command, language, location=None):
+    """process_with_ai as NDJSON events; the command is logged once the reply is complete"""
+    if confident_intent(command):
+        response = await process_with_ai(command, language, location)
+    else:
+        parts = []
+        async for sentence in streaming.sentences(ai_service.astream_ai_response(command, language, 'health')):
+            parts.append(sentence)
+            yield streaming.event({'delta': sentence, 'language': language})
+        message = ''.join(parts).strip()
+        response = {'type': 'ai_response', 'message': message, 'speech': message, 'language': language}
+    
+    await voice_command_buffer.aadd(
+        command_text=command[:500], language=language, response_type=response.get('type', ''),
+    )
+    yield streaming.event({'done': True, **response})
 
-def handle_general_query(command, language):
+async def handle_general_query(command, language):
     """Handle general queries using AI"""
-    ai_response = ai_service.get_ai_response(command, language, 'health')
+    ai_response = await ai_service.aget_ai_response(command, language, 'health')
     
     return {
         'type': 'ai_response',
@@ -544,7 +809,7 @@ def handle_general_query(command, language):
         'language': language
     }
 
-def handle_emergency(language):
+async def handle_emergency(language):
     """Handle emergency situations"""
     messages = {
         'bn': 'জরুরী সাহায্যের জন্য, অনুগ্রহ করে立即 নিকটবর্তী হাসপাতালে যোগাযোগ করুন। জরুরী নম্বর: ৯৯৯',
@@ -559,15 +824,10 @@ def handle_emergency(language):
         'language': language
     }
 
-def get_health_tip(language):
-    """Get AI-powered health tip"""
-    prompts = {
-        'bn': 'আমাকে একটি স্বাস্থ্য টিপস দিন বাংলায়। খুব সংক্ষিপ্ত করুন।',
-        'en': 'Give me a health tip in English. Keep it very brief.',
-        'mixed': 'Amake ekta health tip din. Very short korun.'
-    }
-    
-    ai_tip = ai_service.get_ai_response(prompts.get(language, prompts['bn']), language, 'health')
+async def get_health_tip(language):
+    """Get a pre-generated health tip for the current season (see generate_health_tips)"""
+    tip = await tip_pool.achoice(language)
+    ai_tip = tip['content'] if tip else DEFAULT_TIPS.get(language, DEFAULT_TIPS['bn'])
     
     return {
         'type': 'health_tip',
@@ -576,19 +836,23 @@ def get_health_tip(language):
         'language': language
     }
 
-def get_nearest_hospital(language):
+async def get_nearest_hospital(language, location=None):
     """Get nearest hospital information with AI enhancement"""
-    hospitals = Hospital.objects.all()
-    if hospitals.exists():
-        hospital = hospitals.first()
+    hospital = None
+    if location:
+        nearest = await facility_index.anearest(*location, k=1, types={'hospital'})
+        hospital = nearest[0] if nearest else None
+    if not hospital:
+        hospital = await Hospital.objects.values('name', 'address').afirst()
+    if hospital:
         
         # Use AI to make the response more natural
         prompt = f"""
-        Tell me about the nearest hospital: {hospital.name}, Address: {hospital.address}.
+        Tell me about the nearest hospital: {hospital['name']}, Address: {hospital['address']}.
         Make it sound natural and helpful in {language} language. Keep it very brief.
         """
         
-        ai_response = ai_service.get_ai_response(prompt, language, 'general')
+        ai_response = await ai_service.aget_ai_response(prompt, language, 'general')
         
         return {
             'type': 'hospital_info',
@@ -609,7 +873,7 @@ def get_nearest_hospital(language):
             'language': language
         }
 
-def mood_check(language):
+async def mood_check(language):
     """Enhanced mood check with AI sentiment analysis"""
     messages = {
         'bn': 'আপনার দিনটি ভালো কাটুক! আপনার অনুভূতি শেয়ার করতে চাইলে বলুন। আমি শুনছি...',
@@ -626,7 +890,7 @@ def mood_check(language):
     }
 
 @csrf_exempt
-def process_mood_response(request):
+async def process_mood_response(request):
     """Process mood response with sentiment analysis"""
     if request.method == 'POST':
         try:
@@ -634,7 +898,17 @@ def process_mood_response(request):
             mood_text = data.get('mood_text', '')
             language = data.get('language', 'bn')
             
-            sentiment = ai_service.analyze_sentiment(mood_text, language)
+            # Lexicon first; only unclear answers cost an LLM round trip
+            result = await aclassify_or_escalate(mood_text, language, ai_service)
+            sentiment = result.label
+            
+            # Record the check-in so voice moods show up alongside the mood tracker entries
+            if mood_text:
+                await checkin_buffer.aadd(
+                    mood=SENTIMENT_MOODS.get(sentiment, 'neutral'),
+                    notes=mood_text,
+                    sentiment=sentiment,
+                )
             
             responses = {
                 'positive': {
@@ -667,7 +941,7 @@ def process_mood_response(request):
         except Exception as e:
             return JsonResponse({'error': str(e)}, status=400)
 
-def get_help(language):
+async def get_help(language):
     """Enhanced help with AI"""
     prompts = {
         'bn': 'মন বন্ধু ভয়েস সহায়ক সম্পর্কে একটি সহায়ক বার্তা তৈরি করুন। আমি কী বলতে পারি? খুব সংক্ষিপ্ত করুন।',
@@ -675,11 +949,86 @@ def get_help(language):
         'mixed': 'Mon Bondhu voice assistant somporke helpful message create korun. Ami ki bolte pari? Very short korun.'
     }
     
-    ai_help = ai_service.get_ai_response(prompts.get(language, prompts['bn']), language, 'general')
+    ai_help = await ai_service.aget_ai_response(prompts.get(language, prompts['bn']), language, 'general')
     
     return {
         'type': 'help',
         'message': ai_help,
         'speech': ai_help,
         'language': language
-    }
\ No newline at end of file
+    }
+
+INTENT_HANDLERS = {
+    'health_tip': get_health_tip,
+    'nearest_hospital': get_nearest_hospital,
+    'mood_check': mood_check,
+    'help': get_help,
+    'emergency': handle_emergency,
+}
+
+def parse_location(lat, lon):
+    """Return (lat, lon) as floats, or None if either is missing or out of range"""
+    try:
+        lat, lon = float(lat), float(lon)
+    except (TypeError, ValueError):
+        return None
+    if not (-90 <= lat <= 90 and -180 <= lon <= 180):
+        return None
+    return lat, lon
+
+def nearest_facilities(request):
+    """JSON API: k nearest facilities to ?lat=&lon=, optionally of ?type= within ?radius_km="""
+    location = parse_location(request.GET.get('lat'), request.GET.get('lon'))
+    if not location:
+        return JsonResponse({'error': 'Valid lat and lon are required.'}, status=400)
+    
+    try:
+        k = min(max(int(request.GET.get('k', 5)), 1), 50)
+        radius_km = request.GET.get('radius_km')
+        radius_km = float(radius_km) if radius_km else None
+    except ValueError:
+        return JsonResponse({'error': 'k and radius_km must be numbers.'}, status=400)
+    
+    types = {t for t in request.GET.get('type', '').split(',') if t and t != 'all'} or None
+    results = facility_index.nearest(*location, k=k, types=types, radius_km=radius_km)
+    return JsonResponse({'results': results})
+
+def search_api(request):
+    """JSON API: ranked full-text search, ?q=&kind=facility,worker,event,tip&page=&page_size="""
+    query = request.GET.get('q', '').strip()
+    if not query:
+        return JsonResponse({'error': 'q is required.'}, status=400)
+    
+    kinds = [k for k in request.GET.get('kind', '').split(',') if k in search.KINDS] or None
+    try:
+        page = max(int(request.GET.get('page', 1)), 1)
+        page_size = min(max(int(request.GET.get('page_size', 20)), 1), 50)
+    except ValueError:
+        return JsonResponse({'error': 'page and page_size must be numbers.'}, status=400)
+    
+    results, has_next = search.search(query, kinds, limit=page_size, offset=(page - 1) * page_size)
+    return JsonResponse({'results': results, 'page': page, 'has_next': has_next})
+
+def offline_pack(request, union_id):
+    """Gzipped JSON bundle of a union's reference data, ?lang=bn|en|mixed, with a strong ETag"""
+    language = request.GET.get('lang', 'bn')
+    if language not in dict(HealthTip.LANGUAGE_CHOICES):
+        language = 'bn'
+    
+    pack = get_pack(union_id, language)
+    if pack is None:
+        return JsonResponse({'error': 'Unknown union.'}, status=404)
+    
+    if pack.etag in parse_etags(request.headers.get('If-None-Match', '')):
+        response = HttpResponseNotModified()
+    elif 'gzip' in request.headers.get('Accept-Encoding', ''):
+        response = HttpResponse(pack.body, content_type='application/json')
+        response['Content-Encoding'] = 'gzip'
+    else:
+        response = HttpResponse(gzip.decompress(pack.body), content_type='application/json')
+    
+    response['ETag'] = pack.etag
+    # Phones keep the pack themselves and always revalidate; a match costs one 304
+    response['Cache-Control'] = 'public, no-cache'
+    patch_vary_headers(response, ['Accept-Encoding'])
+    return response
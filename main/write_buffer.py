@@ -0,0 +1,271 @@
+"""Write-behind buffers for high-volume inserts (mood check-ins, voice command logs).
+
+SQLite has a single writer, so one INSERT and commit per request makes a
+morning check-in spike queue up on the database lock. Instead, a request
+hands its row to a :class:`WriteBuffer` and returns. A background thread
+writes pending rows with one ``bulk_create`` per batch, once
+``WRITE_BUFFER_MAX_ROWS`` rows are waiting or the oldest has waited
+``WRITE_BUFFER_MAX_DELAY`` seconds. Commits then scale with batches, not
+rows.
+
+Every buffered row is first appended to a spool file under
+``WRITE_BUFFER_SPOOL_DIR`` and the file is deleted once its rows are
+committed. If the process dies with rows pending, the next process to
+start a buffer for that model (or ``manage.py flush_write_buffers``)
+claims the dead process's spool files and writes them. A crash between a
+commit and the spool deletion can write a batch twice; lost rows are the
+worse failure for these tables.
+
+A failed batch is retried whole. After ``WRITE_BUFFER_MAX_ATTEMPTS``
+failures in a row it is written one row at a time, so one bad row cannot
+hold up the rest. Rows that still fail are logged and appended to
+``<spool dir>/dead/<model>.jsonl`` with their error. A row that fails
+with an ``OperationalError`` (database locked, disk full) is not at
+fault; it and the rows after it are kept for the next flush.
+
+``bulk_create`` sends no signals, so each buffer takes an ``after_flush``
+callback for the work signals would have done. With
+``WRITE_BUFFER_ENABLED = False`` rows are saved immediately, signals and
+all.
+"""
+
+import atexit
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import OperationalError, close_old_connections, transaction
+
+from . import rollups
+from .fragments import MOODS_VERSION
+from .models import MoodCheckIn, VoiceCommand
+from .versions import bump_version
+
+logger = logging.getLogger(__name__)
+
+
+def _pid_alive(pid):
+    if os.name == "nt":
+        # os.kill(pid, 0) would send CTRL_C_EVENT on Windows; leave recovery to flush_write_buffers there
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+class WriteBuffer:
+    def __init__(self, model, after_flush=None):
+        self.model = model
+        self.after_flush = after_flush
+        self.label = model._meta.label_lower
+        self._wake = threading.Condition()
+        self._pending = []  # field dicts, oldest first
+        self._sealed = []  # spool files holding every pending row not in the active spool
+        self._spool = None
+        self._sequence = 0
+        self._oldest_at = None
+        self._thread = None
+        self._stopping = False
+        self._failures = 0  # Failed flushes in a row
+
+    @staticmethod
+    def _setting(name, default):
+        return getattr(settings, f"WRITE_BUFFER_{name}", default)
+
+    def _spool_dir(self):
+        path = Path(self._setting("SPOOL_DIR", Path(settings.BASE_DIR) / "spool"))
+        path.mkdir(parents=True, exist_ok=True)
+        return path
+
+    def add(self, **fields):
+        """Queue one row; ``fields`` must be JSON-serializable column values"""
+        if not self._setting("ENABLED", True):
+            self.model.objects.create(**fields)
+            return
+        line = json.dumps(fields, cls=DjangoJSONEncoder, ensure_ascii=False) + "\n"
+        with self._wake:
+            if self._thread is None:
+                self._start()
+            if self._spool is None:
+                self._spool = open(self._active_path(), "a", encoding="utf-8")
+            self._spool.write(line)
+            self._spool.flush()
+            self._pending.append(fields)
+            self._oldest_at = self._oldest_at or time.monotonic()
+            if len(self._pending) >= self._setting("MAX_ROWS", 200):
+                self._wake.notify()
+
+    async def aadd(self, **fields):
+        if not self._setting("ENABLED", True):
+            await self.model.objects.acreate(**fields)
+            return
+        self.add(**fields)
+
+    def _active_path(self):
+        return self._spool_dir() / f"{self.label}.{os.getpid()}.jsonl"
+
+    def _seal(self):
+        """Close the active spool under a new name; call with the lock held"""
+        if self._spool is None:
+            return
+        self._spool.close()
+        self._spool = None
+        self._sequence += 1
+        sealed = self._spool_dir() / f"{self.label}.{os.getpid()}.{self._sequence}.sealed"
+        os.replace(self._active_path(), sealed)
+        self._sealed.append(sealed)
+
+    def _start(self):
+        self._claim_orphans()
+        self._thread = threading.Thread(target=self._run, name=f"write-buffer-{self.label}", daemon=True)
+        self._thread.start()
+        atexit.register(self.stop)
+
+    def _claim_orphans(self, include_live=False):
+        """Adopt spool files left by processes that died; call with the lock held"""
+        for path in sorted(self._spool_dir().glob(f"{self.label}.*")):
+            try:
+                pid = int(path.name[len(self.label) + 1:].split(".")[0])
+            except ValueError:
+                continue
+            if pid == os.getpid() or (not include_live and _pid_alive(pid)):
+                continue
+            self._sequence += 1
+            claimed = self._spool_dir() / f"{self.label}.{os.getpid()}.{self._sequence}.sealed"
+            try:
+                os.replace(path, claimed)  # Atomic, so only one process adopts each file
+            except FileNotFoundError:
+                continue
+            with open(claimed, encoding="utf-8") as spool:
+                rows = [json.loads(line) for line in spool if line.strip()]
+            self._pending[:0] = rows
+            self._sealed.insert(0, claimed)
+            self._oldest_at = self._oldest_at or time.monotonic()
+            logger.info("Recovered %d buffered %s rows from %s", len(rows), self.label, path.name)
+
+    def _run(self):
+        while True:
+            with self._wake:
+                while not self._pending and not self._stopping:
+                    self._wake.wait()
+                # Hold the batch open until it is full or its oldest row has waited long enough
+                while not self._stopping and len(self._pending) < self._setting("MAX_ROWS", 200):
+                    remaining = self._oldest_at + self._setting("MAX_DELAY", 2.0) - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._wake.wait(remaining)
+                if self._stopping:
+                    return
+            self.flush()
+
+    def flush(self):
+        """Write every pending row now; returns the number written"""
+        with self._wake:
+            batch, self._pending = self._pending, []
+            self._seal()
+            spools, self._sealed = self._sealed, []
+            self._oldest_at = None
+        if not batch:
+            return 0
+
+        close_old_connections()
+        try:
+            self._write(batch)
+        except Exception:
+            self._failures += 1
+            if self._failures < self._setting("MAX_ATTEMPTS", 3):
+                logger.exception("Failed to write %d buffered %s rows; will retry", len(batch), self.label)
+                with self._wake:
+                    self._pending[:0] = batch
+                    self._sealed[:0] = spools
+                    self._oldest_at = time.monotonic()
+                return 0
+            logger.exception(
+                "Failed to write %d buffered %s rows %d times; writing them one by one",
+                len(batch), self.label, self._failures,
+            )
+            written, unwritten = self._write_singly(batch)
+            if unwritten:
+                with self._wake:
+                    self._pending[:0] = unwritten
+                    self._sealed.insert(0, self._respool(unwritten))
+                    self._oldest_at = time.monotonic()
+        else:
+            written = len(batch)
+        self._failures = 0
+
+        for spool in spools:
+            spool.unlink(missing_ok=True)
+        return written
+
+    def _write(self, rows):
+        with transaction.atomic():
+            objects = self.model.objects.bulk_create(
+                [self.model(**fields) for fields in rows], batch_size=self._setting("MAX_ROWS", 200)
+            )
+            if self.after_flush:
+                self.after_flush(objects)
+
+    def _write_singly(self, batch):
+        """Write rows one per transaction, dead-lettering bad ones; returns (written, rows to retry)"""
+        written = 0
+        for index, fields in enumerate(batch):
+            try:
+                self._write([fields])
+            except OperationalError:
+                # The database is failing, not this row
+                logger.exception("Database unavailable; keeping %d %s rows", len(batch) - index, self.label)
+                return written, batch[index:]
+            except Exception as error:
+                self._dead_letter(fields, error)
+            else:
+                written += 1
+        return written, []
+
+    def _dead_letter(self, fields, error):
+        path = self._spool_dir() / "dead"
+        path.mkdir(exist_ok=True)
+        record = {"fields": fields, "error": repr(error), "pid": os.getpid()}
+        with open(path / f"{self.label}.jsonl", "a", encoding="utf-8") as dead:
+            dead.write(json.dumps(record, cls=DjangoJSONEncoder, ensure_ascii=False) + "\n")
+        logger.error("Dead-lettered a buffered %s row after repeated failures: %r %r", self.label, error, fields)
+
+    def _respool(self, rows):
+        """A new sealed spool holding just ``rows``; call with the lock held"""
+        self._sequence += 1
+        path = self._spool_dir() / f"{self.label}.{os.getpid()}.{self._sequence}.sealed"
+        with open(path, "w", encoding="utf-8") as spool:
+            spool.writelines(json.dumps(fields, cls=DjangoJSONEncoder, ensure_ascii=False) + "\n" for fields in rows)
+        return path
+
+    def recover(self, include_live=False):
+        """Adopt spool files left by dead processes (or by any other process) and write them now"""
+        with self._wake:
+            self._claim_orphans(include_live=include_live)
+        return self.flush()
+
+    def stop(self):
+        with self._wake:
+            self._stopping = True
+            self._wake.notify()
+        self.flush()
+
+
+def _checkins_written(checkins):
+    rollups.record_checkins(checkins)
+    bump_version(MOODS_VERSION)
+
+
+checkin_buffer = WriteBuffer(MoodCheckIn, after_flush=_checkins_written)
+voice_command_buffer = WriteBuffer(VoiceCommand)
+
+BUFFERS = [checkin_buffer, voice_command_buffer]
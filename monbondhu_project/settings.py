@@ -45,6 +45,7 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
+    "main.db_router.PrimaryPinMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
@@ -80,9 +81,54 @@ DATABASES = {
     "default": {
         "ENGINE": "django.db.backends.sqlite3",
         "NAME": BASE_DIR / "db.sqlite3",
+        "OPTIONS": {
+            # WAL lets readers run alongside the one writer; NORMAL syncs at checkpoints, not every commit
+            "init_command": "PRAGMA journal_mode=WAL; PRAGMA synchronous=NORMAL;",
+            # Take the write lock at BEGIN so writers queue on the busy timeout instead of failing mid-transaction
+            "transaction_mode": "IMMEDIATE",
+            "timeout": 20,
+        },
     }
 }
 
+# Read replicas (see main/db_router.py). DB_REPLICA_PATHS lists SQLite files, comma-separated;
+# `manage.py sync_replicas` copies the primary into them for local testing.
+DATABASE_REPLICAS = []
+for _number, _path in enumerate(filter(None, os.environ.get("DB_REPLICA_PATHS", "").split(",")), start=1):
+    DATABASE_REPLICAS.append(f"replica{_number}")
+    DATABASES[f"replica{_number}"] = {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": _path.strip(),
+        "OPTIONS": {"init_command": "PRAGMA query_only=ON;"},
+        "TEST": {"MIRROR": "default"},
+    }
+
+DATABASE_ROUTERS = ["main.db_router.ReplicaRouter"]
+
+# Reads stay on the primary for this long after a browser writes, so it sees its own changes
+REPLICA_STICKY_SECONDS = 5
+
+
+# Caches
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+# "shared" is visible to every worker process; point it at Redis or Memcached in production.
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    },
+    "shared": {
+        "BACKEND": os.environ.get(
+            "SHARED_CACHE_BACKEND", "django.core.cache.backends.filebased.FileBasedCache"
+        ),
+        "LOCATION": os.environ.get("SHARED_CACHE_LOCATION", str(BASE_DIR / "cache")),
+        "OPTIONS": {"MAX_ENTRIES": 5000},
+    },
+}
+
+# Sessions are read through the cache so cached pages (e.g. the mood tracker fragments) need no queries
+SESSION_ENGINE = "django.contrib.sessions.backends.cached_db"
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
@@ -122,6 +168,15 @@ STATIC_URL = "/static/"
 STATICFILES_DIRS = [BASE_DIR / "static"]
 STATIC_ROOT = BASE_DIR / "staticfiles"
 
+# collectstatic minifies, content-hashes and precompresses (gzip/brotli) static files (see main/storage.py)
+STORAGES = {
+    "default": {"BACKEND": "django.core.files.storage.FileSystemStorage"},
+    "staticfiles": {"BACKEND": "main.storage.PrecompressedManifestStorage"},
+}
+# Serve STATIC_ROOT from Django (see main/static_serve.py) when no web server fronts the app
+STATIC_SERVE = os.environ.get("STATIC_SERVE", "0") == "1"
+STATIC_UNHASHED_MAX_AGE = 60 * 60
+
 MEDIA_URL = "/media/"
 MEDIA_ROOT = BASE_DIR / "media"
 
@@ -131,11 +186,84 @@ MEDIA_ROOT = BASE_DIR / "media"
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
 OPENAI_API_KEY = os.environ.get('OPENRouter_API_KEY')
+# EMAIL_HOST=localhost EMAIL_PORT=1025 EMAIL_USE_TLS=0 with `python -m aiosmtpd -n` is a local SMTP stand-in
+EMAIL_BACKEND = os.environ.get('EMAIL_BACKEND', 'django.core.mail.backends.smtp.EmailBackend')
 EMAIL_HOST = os.environ.get('EMAIL_HOST')
 EMAIL_PORT = os.environ.get('EMAIL_PORT')
-EMAIL_USE_TLS = True
+EMAIL_USE_TLS = os.environ.get('EMAIL_USE_TLS', '1') == '1'
+EMAIL_TIMEOUT = 30
 EMAIL_HOST_USER = os.environ.get('EMAIL_HOST_USER')
 EMAIL_HOST_PASSWORD = os.environ.get('EMAIL_HOST_PASSWORD')
 DEFAULT_FROM_EMAIL = "Mon_Bondhu <your_email@gmail.com>"
 
 OPENAI_API__KEY = os.getenv('OPENAI_API_KEY')
+
+# Shared AI HTTP clients (see main/ai_clients.py)
+AI_HTTP_POOL_SIZE = int(os.environ.get('AI_HTTP_POOL_SIZE', 20))
+AI_HTTP_KEEPALIVE = int(os.environ.get('AI_HTTP_KEEPALIVE', AI_HTTP_POOL_SIZE))
+AI_HTTP_TIMEOUT = float(os.environ.get('AI_HTTP_TIMEOUT', 20))
+AI_HTTP_CONNECT_TIMEOUT = float(os.environ.get('AI_HTTP_CONNECT_TIMEOUT', 5))
+AI_HTTP_MAX_RETRIES = int(os.environ.get('AI_HTTP_MAX_RETRIES', 1))
+
+# AI response cache (see main/ai_cache.py); TTLs are in seconds per prompt context
+AI_CACHE_ENABLED = os.environ.get('AI_CACHE_ENABLED', '1') == '1'
+AI_CACHE_ALIAS = 'shared'
+AI_CACHE_LOCAL_MAX_ENTRIES = 512
+AI_CACHE_TTLS = {
+    'health': 6 * 60 * 60,
+    'general': 24 * 60 * 60,
+    'chat': 60 * 60,
+    'voice': 60 * 60,
+}
+AI_CACHE_STATS_FLUSH_SECONDS = 30
+
+# Version counters for per-process in-memory snapshots (see main/versions.py)
+VERSION_CACHE_ALIAS = 'shared'
+
+# Pre-generated health tip pool (see main/tip_pool.py)
+TIP_POOL_RECHECK_SECONDS = 30
+
+# Facility k-nearest index (see main/geo_index.py)
+GEO_INDEX_CELL_DEGREES = 0.05
+GEO_INDEX_RECHECK_SECONDS = 30
+
+# Voice commands matched below this confidence go to the LLM (see main/intents.py)
+INTENT_MIN_CONFIDENCE = 0.75
+
+# Per-union offline packs (see main/offline_pack.py)
+OFFLINE_PACK_CACHE_ALIAS = 'shared'
+OFFLINE_PACK_CACHE_SECONDS = 24 * 60 * 60
+
+# Mood answers classified below this confidence go to the LLM (see main/sentiment.py)
+SENTIMENT_MIN_CONFIDENCE = 0.6
+SENTIMENT_STATS_CACHE_ALIAS = 'shared'
+SENTIMENT_STATS_FLUSH_SECONDS = 30
+
+# Write-behind buffers for check-ins and voice command logs (see main/write_buffer.py)
+WRITE_BUFFER_ENABLED = os.environ.get('WRITE_BUFFER_ENABLED', '1') == '1'
+WRITE_BUFFER_MAX_ROWS = 200
+WRITE_BUFFER_MAX_DELAY = 2.0
+WRITE_BUFFER_MAX_ATTEMPTS = 3
+WRITE_BUFFER_SPOOL_DIR = BASE_DIR / 'spool'
+
+# Help request notification outbox (see main/outbox.py)
+OUTBOX_HELP_RECIPIENTS = os.environ.get('HELP_REQUEST_RECIPIENTS', 'tahsin.azad.skt@gmail.com').split(',')
+OUTBOX_IMMEDIATE_HELP_TYPES = ['emergency']
+OUTBOX_DIGEST_SECONDS = 60 * 60
+OUTBOX_RETRY_SECONDS = 60
+OUTBOX_MAX_BACKOFF = 6 * 60 * 60
+OUTBOX_MAX_ATTEMPTS = 8
+
+# Concurrency cap, deadlines and circuit breakers for outbound AI calls (see main/ai_governor.py)
+AI_MAX_IN_FLIGHT = int(os.environ.get('AI_MAX_IN_FLIGHT', 8))
+AI_QUEUE_TIMEOUT = 2.0
+AI_CALL_DEADLINE = float(os.environ.get('AI_CALL_DEADLINE', 15))
+AI_BREAKER_FAILURES = 5
+AI_BREAKER_COOLDOWN = 30.0
+
+# Deferred-answer chat jobs (see main/chat_jobs.py)
+CHAT_JOB_RUN_IN_BACKGROUND = True
+CHAT_JOB_MAX_WAIT = 25
+CHAT_JOB_POLL_SECONDS = 0.5
+CHAT_JOB_CLAIM_TIMEOUT = 5 * 60
+CHAT_JOB_MAX_ATTEMPTS = 3
@@ -0,0 +1,235 @@
+// Theme handling
+const themeToggle = document.getElementById('themeToggle');
+const themeIcon = document.getElementById('themeIcon');
+const body = document.body;
+
+// Set default dark mode
+body.classList.add('dark-mode');
+
+// Load saved theme preference
+const savedTheme = localStorage.getItem('theme') || 'dark';
+if (savedTheme === 'light') {
+    body.classList.remove('dark-mode');
+}
+updateThemeIcon(savedTheme === 'light');
+
+// Theme toggle functionality
+themeToggle.addEventListener('click', () => {
+    const isDark = body.classList.toggle('dark-mode');
+    localStorage.setItem('theme', isDark ? 'dark' : 'light');
+    updateThemeIcon(!isDark);
+});
+
+function updateThemeIcon(isLight) {
+    themeIcon.classList.remove(isLight ? 'fa-moon' : 'fa-sun');
+    themeIcon.classList.add(isLight ? 'fa-sun' : 'fa-moon');
+    themeIcon.title = isLight ? 'Switch to Dark Mode' : 'Switch to Light Mode';
+}
+
+// Global variables
+let currentSection = 'home';
+
+// Initialize app
+document.addEventListener('DOMContentLoaded', function() {
+    // Check online/offline status
+    updateOnlineStatus();
+    window.addEventListener('online', updateOnlineStatus);
+    window.addEventListener('offline', updateOnlineStatus);
+
+    // Initialize navigation
+    initializeNavigation();
+
+    // Initialize scroll indicator
+    initializeScrollIndicator();
+
+    // Initialize particle effects
+    initializeParticleEffects();
+
+    // Initialize magnetic buttons
+    initializeMagneticButtons();
+
+    // Add typing effect to title
+    addTypingEffect();
+});
+
+// Navigation functions
+function initializeNavigation() {
+    // Mobile menu toggle
+    const menuToggle = document.getElementById('menuToggle');
+    if (menuToggle) {
+        menuToggle.addEventListener('click', function() {
+            const mobileMenu = document.getElementById('mobileMenu');
+            mobileMenu.classList.toggle('hidden');
+        });
+    }
+
+    // Navigation links
+    const navLinks = document.querySelectorAll('.nav-link, .mobile-nav-link');
+    navLinks.forEach(link => {
+        link.addEventListener('click', function(e) {
+            const targetHref = this.getAttribute('href');
+            const targetHash = targetHref.split('#')[1];
+
+            // Close mobile menu
+            const mobileMenu = document.getElementById('mobileMenu');
+            if (mobileMenu) mobileMenu.classList.add('hidden');
+
+            // If we're already on the home page and there's a hash
+            if (window.location.pathname === '/' && targetHash) {
+                e.preventDefault();
+                showSection(targetHash);
+                history.pushState(null, '', `#${targetHash}`);
+            }
+        });
+    });
+
+    // Handle initial page load with hash
+    if (window.location.hash) {
+        const initialHash = window.location.hash.substring(1);
+        showSection(initialHash);
+    }
+}
+
+function showSection(sectionId) {
+    // Hide all sections with animation
+    const sections = document.querySelectorAll('main > section, section');
+    sections.forEach(section => {
+        if (!section.classList.contains('hidden')) {
+            section.style.opacity = '0';
+            section.style.transform = 'translateY(20px)';
+            setTimeout(() => {
+                section.classList.add('hidden');
+            }, 300);
+        }
+    });
+
+    // Show selected section with animation
+    setTimeout(() => {
+        const targetSection = document.getElementById(sectionId);
+        if (targetSection) {
+            targetSection.classList.remove('hidden');
+            targetSection.style.opacity = '0';
+            targetSection.style.transform = 'translateY(20px)';
+
+            setTimeout(() => {
+                targetSection.style.opacity = '1';
+                targetSection.style.transform = 'translateY(0)';
+                targetSection.style.transition = 'all 0.5s ease-out';
+            }, 50);
+
+            currentSection = sectionId;
+
+            // Update active nav link
+            const navLinks = document.querySelectorAll('.nav-link, .mobile-nav-link');
+            navLinks.forEach(link => {
+                const href = link.getAttribute('href');
+                link.classList.remove('tab-active');
+
+                // Check for both full path (#section) and fragment-only links
+                if (href.includes(`#${sectionId}`)) {
+                    link.classList.add('tab-active');
+                }
+            });
+
+            // Scroll to top
+            window.scrollTo({ top: 0, behavior: 'smooth' });
+        }
+    }, 300);
+}
+
+// Scroll indicator
+function initializeScrollIndicator() {
+    window.addEventListener('scroll', function() {
+        const scrollIndicator = document.getElementById('scrollIndicator');
+        const scrollHeight = document.documentElement.scrollHeight - window.innerHeight;
+        const scrollPosition = window.scrollY;
+        const scrollPercentage = scrollHeight > 0 ? (scrollPosition / scrollHeight) * 100 : 0;
+        if (scrollIndicator) scrollIndicator.style.width = scrollPercentage + '%';
+    });
+}
+
+// Particle effects
+function initializeParticleEffects() {
+    document.addEventListener('click', function(e) {
+        if (e.target.closest('button') || e.target.closest('.flip-card')) {
+            createParticle(e.clientX, e.clientY);
+        }
+    });
+}
+function createParticle(x, y) {
+    const particle = document.createElement('div');
+    particle.className = 'particle';
+    particle.style.left = x + 'px';
+    particle.style.top = y + 'px';
+    particle.style.width = '10px';
+    particle.style.height = '10px';
+    particle.style.background = `hsl(${Math.random() * 360}, 70%, 60%)`;
+    document.body.appendChild(particle);
+    setTimeout(() => particle.remove(), 2000);
+}
+
+// Online/Offline status
+function updateOnlineStatus() {
+    const offlineEl = document.getElementById('offlineIndicator');
+    const onlineEl = document.getElementById('onlineIndicator');
+    if (navigator.onLine) {
+        if (offlineEl) offlineEl.style.display = 'none';
+        if (onlineEl) { onlineEl.style.display = 'block'; setTimeout(()=> onlineEl.style.display='none', 2000); }
+    } else {
+        if (onlineEl) onlineEl.style.display = 'none';
+        if (offlineEl) offlineEl.style.display = 'block';
+    }
+}
+
+// Magnetic buttons (simple hover)
+function initializeMagneticButtons() {
+    document.querySelectorAll('.magnetic-button').forEach(btn => {
+        btn.addEventListener('mousemove', (e)=>{
+            const rect = btn.getBoundingClientRect();
+            const x = e.clientX - rect.left - rect.width/2;
+            const y = e.clientY - rect.top - rect.height/2;
+            btn.style.transform = `translate(${x*0.05}px, ${y*0.05}px) scale(1.02)`;
+        });
+        btn.addEventListener('mouseleave', ()=> btn.style.transform = 'translate(0,0)');
+    });
+}
+
+// Typing effect for glitch title (simple)
+function addTypingEffect() {
+    // keep for future enhancements
+}
+
+// Offline pack: the union's reference data, kept in localStorage and revalidated by ETag
+const MonBondhuOffline = {
+    unionId() {
+        return localStorage.getItem('offlinePackUnion');
+    },
+    setUnion(unionId) {
+        localStorage.setItem('offlinePackUnion', String(unionId));
+    },
+    cached(lang = 'bn') {
+        try {
+            return JSON.parse(localStorage.getItem(`offlinePack:${this.unionId()}:${lang}`));
+        } catch (e) {
+            return null;
+        }
+    },
+    async load(lang = 'bn') {
+        const unionId = this.unionId();
+        if (!unionId) return null;
+        const stored = this.cached(lang);
+        if (!navigator.onLine) return stored ? stored.data : null;
+        try {
+            const headers = stored ? { 'If-None-Match': stored.etag } : {};
+            const res = await fetch(`/api/offline-pack/${unionId}/?lang=${lang}`, { headers });
+            if (res.status === 304 && stored) return stored.data;
+            if (!res.ok) return stored ? stored.data : null;
+            const data = await res.json();
+            localStorage.setItem(`offlinePack:${unionId}:${lang}`,
+                JSON.stringify({ etag: res.headers.get('ETag'), data }));
+            return data;
+        } catch (e) {
+            return stored ? stored.data : null;
+        }
+    }
+};
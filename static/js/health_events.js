@@ -0,0 +1,214 @@
+// Sample events data
+let eventsData = [
+    {
+        id: 1,
+        title: "বিনামূল্যে ডায়াবেটিস স্ক্রীনিং ক্যাম্প",
+        event_type: "screening",
+        description: "বিনামূল্যে রক্তের শর্করা পরীক্ষা ও ডায়াবেটিস সম্পর্কিত পরামর্শ",
+        date: "2024-12-15",
+        start_time: "09:00",
+        end_time: "14:00",
+        location: "চর কলাপাড়া কমিউনিটি সেন্টার",
+        upazila: "চরফ্যাশন",
+        union: "চর কলাপাড়া",
+        organizer: "স্বাস্থ্য বিভাগ, চরফ্যাশন",
+        contact: "০১৮১২-৩৪৫৬৭৮"
+    },
+    {
+        id: 2,
+        title: "শিশু টিকাকরণ কর্মসূচী",
+        event_type: "vaccination",
+        description: "সমস্ত EPI টিকা বিনামূল্যে প্রদান",
+        date: "2024-12-18",
+        start_time: "08:00",
+        end_time: "12:00",
+        location: "চর কলাপাড়া কমিউনিটি ক্লিনিক",
+        upazila: "চরফ্যাশন",
+        union: "চর কলাপাড়া",
+        organizer: "কমিউনিটি ক্লিনিক",
+        contact: "০১৭১১-২২৩৩৪৪"
+    },
+    {
+        id: 3,
+        title: "মানসিক স্বাস্থ্য সচেতনতা সেশন",
+        event_type: "awareness",
+        description: "মানসিক স্বাস্থ্য সম্পর্কিত আলোচনা ও প্রশ্নোত্তর পর্ব",
+        date: "2024-12-20",
+        start_time: "15:00",
+        end_time: "17:00",
+        location: "স্থানীয় উচ্চ বিদ্যালয়",
+        upazila: "চরফ্যাশন",
+        union: "চর কলাপাড়া",
+        organizer: "মনবন্ধু টিম",
+        contact: ""
+    }
+];
+
+function displayEvents(events = eventsData) {
+    const container = document.getElementById('eventsList');
+    const noEvents = document.getElementById('noEvents');
+
+    if (events.length === 0) {
+        container.style.display = 'none';
+        noEvents.style.display = 'block';
+        return;
+    }
+
+    container.style.display = 'block';
+    noEvents.style.display = 'none';
+
+    const today = new Date();
+    today.setHours(0, 0, 0, 0);
+
+    container.innerHTML = events.map(event => {
+        const eventDate = new Date(event.date);
+        const isToday = eventDate.toDateString() === today.toDateString();
+        const isUpcoming = eventDate >= today;
+        const isUrgent = isToday || (eventDate - today) / (24 * 60 * 60 * 1000) <= 2;
+
+        let cardClass = 'event-card';
+        if (isUrgent) cardClass += ' urgent';
+        else if (isUpcoming) cardClass += ' upcoming';
+
+        const eventTypeText = {
+            'health_camp': 'স্বাস্থ্য ক্যাম্প',
+            'vaccination': 'টিকাদান',
+            'screening': 'স্ক্রীনিং',
+            'awareness': 'সচেতনতা',
+            'blood_donation': 'রক্তদান'
+        };
+
+        return `
+            <div class="${cardClass}">
+                <div style="display: flex; justify-content: between; align-items: start; margin-bottom: 1rem;">
+                    <div style="flex: 1;">
+                        <h3 style="color: #2d3748; margin-bottom: 0.5rem;">${event.title}</h3>
+                        <div style="display: flex; align-items: center; flex-wrap: wrap; gap: 0.5rem; margin-bottom: 0.5rem;">
+                            <span class="event-type-badge badge-${event.event_type}">
+                                ${eventTypeText[event.event_type]}
+                            </span>
+                            <span style="color: #718096; font-size: 0.9rem;">
+                                ${eventDate.toLocaleDateString('bn-BD')} • ${event.start_time} - ${event.end_time}
+                            </span>
+                        </div>
+                        <p style="color: #718096; margin: 0;">${event.description}</p>
+                    </div>
+                    ${isUrgent ? `
+                        <div style="background: #e53e3e; color: white; padding: 0.5rem 1rem; border-radius: 20px; font-size: 0.9rem;">
+                            ${isToday ? 'আজ' : 'শীঘ্রই'}
+                        </div>
+                    ` : ''}
+                </div>
+
+                <div style="display: grid; grid-template-columns: 1fr auto; gap: 1rem; align-items: end;">
+                    <div>
+                        <div style="color: #4a5568; margin-bottom: 0.5rem;">
+                            <strong>স্থান:</strong> ${event.location}
+                        </div>
+                        <div style="color: #4a5568;">
+                            <strong>আয়োজক:</strong> ${event.organizer}
+                            ${event.contact ? ` • <strong>যোগাযোগ:</strong> ${event.contact}` : ''}
+                        </div>
+                    </div>
+                    <button class="btn" style="background: #667eea; color: white; white-space: nowrap;" 
+                            onclick="remindEvent(${event.id})">
+                        📅 রিমাইন্ডার সেট করুন
+                    </button>
+                </div>
+            </div>
+        `;
+    }).join('');
+}
+
+function filterEvents(filterType) {
+    // Update active button
+    document.querySelectorAll('.filter-btn').forEach(btn => {
+        btn.classList.remove('active');
+    });
+    event.target.classList.add('active');
+
+    const today = new Date();
+    today.setHours(0, 0, 0, 0);
+
+    const nextWeek = new Date(today);
+    nextWeek.setDate(nextWeek.getDate() + 7);
+
+    let filteredEvents = eventsData;
+
+    switch (filterType) {
+        case 'upcoming':
+            filteredEvents = eventsData.filter(event => new Date(event.date) >= today);
+            break;
+        case 'today':
+            filteredEvents = eventsData.filter(event => new Date(event.date).toDateString() === today.toDateString());
+            break;
+        case 'this_week':
+            filteredEvents = eventsData.filter(event => {
+                const eventDate = new Date(event.date);
+                return eventDate >= today && eventDate <= nextWeek;
+            });
+            break;
+    }
+
+    // Apply search filter
+    const searchTerm = document.getElementById('searchEvents').value.toLowerCase();
+    if (searchTerm) {
+        filteredEvents = filteredEvents.filter(event => 
+            event.title.toLowerCase().includes(searchTerm) ||
+            event.location.toLowerCase().includes(searchTerm) ||
+            event.organizer.toLowerCase().includes(searchTerm)
+        );
+    }
+
+    // Apply type filter
+    const typeFilter = document.getElementById('eventTypeFilter').value;
+    if (typeFilter !== 'all') {
+        filteredEvents = filteredEvents.filter(event => event.event_type === typeFilter);
+    }
+
+    displayEvents(filteredEvents);
+}
+
+function remindEvent(eventId) {
+    const event = eventsData.find(e => e.id === eventId);
+    if (event) {
+        alert(`রিমাইন্ডার সেট করা হয়েছে: ${event.title}\nতারিখ: ${new Date(event.date).toLocaleDateString('bn-BD')}`);
+        // In a real app, this would integrate with device calendar
+    }
+}
+
+// Add event form handler
+document.getElementById('addEventForm').addEventListener('submit', function(e) {
+    e.preventDefault();
+
+    const formData = new FormData(this);
+    const newEvent = {
+        id: eventsData.length + 1,
+        title: formData.get('title'),
+        event_type: formData.get('event_type'),
+        description: formData.get('description'),
+        date: formData.get('date'),
+        start_time: formData.get('start_time'),
+        end_time: formData.get('end_time'),
+        location: formData.get('location'),
+        upazila: 'চরফ্যাশн', // Default for demo
+        union: 'চর কলাপাড়া', // Default for demo
+        organizer: formData.get('organizer'),
+        contact: ''
+    };
+
+    eventsData.push(newEvent);
+    displayEvents(eventsData);
+    this.reset();
+
+    alert('ইভেন্ট সফলভাবে যোগ করা হয়েছে!');
+});
+
+// Search and filter event listeners
+document.getElementById('searchEvents').addEventListener('input', filterEvents);
+document.getElementById('eventTypeFilter').addEventListener('change', filterEvents);
+
+// Initialize
+document.addEventListener('DOMContentLoaded', function() {
+    displayEvents();
+});
@@ -0,0 +1,112 @@
+// Season data
+const seasonData = {
+    current: {
+        name: "বর্তমান মৌসুম",
+        description: "",
+        warning: "",
+        prevention: [],
+        whenToSeeDoctor: []
+    },
+    monsoon: {
+        name: "বর্ষা মৌসুম",
+        description: "জুন থেকে সেপ্টেম্বর মাস পর্যন্ত বর্ষাকাল চলছে। এই সময় ডেঙ্গু, ম্যালেরিয়া এবং পানিবাহিত রোগের প্রাদুর্ভাব বেশি দেখা যায়।"
+    },
+    winter: {
+        name: "শীত মৌসুম", 
+        description: "ডিসেম্বর থেকে ফেব্রুয়ারি মাস পর্যন্ত শীতকাল চলছে। এই সময় সর্দি-কাশি, ফ্লু এবং শ্বাসকষ্টের সমস্যা বাড়ে।"
+    },
+    summer: {
+        name: "গ্রীষ্ম মৌসুম",
+        description: "মার্চ থেকে মে মাস পর্যন্ত গ্রীষ্মকাল চলছে। এই সময় হিট স্ট্রোক, ডিহাইড্রেশন এবং খাদ্য বিষক্রিয়ার ঝুঁকি বেশি।"
+    }
+};
+
+function showSeason(season) {
+    // Update active button
+    document.querySelectorAll('.season-btn').forEach(btn => {
+        btn.classList.remove('active');
+    });
+    document.querySelector(`[data-season="${season}"]`).classList.add('active');
+
+    // Show selected season content
+    document.querySelectorAll('.season-content').forEach(content => {
+        content.classList.remove('active');
+    });
+    document.getElementById(`${season}-season`).classList.add('active');
+
+    // Update current season based on actual month
+    if (season === 'current') {
+        updateCurrentSeason();
+    }
+}
+
+function updateCurrentSeason() {
+    const now = new Date();
+    const month = now.getMonth() + 1; // JavaScript months are 0-indexed
+    let currentSeason, seasonText, warning, prevention, whenToSeeDoctor;
+
+    if (month >= 6 && month <= 9) {
+        currentSeason = "monsoon";
+        seasonText = "বর্তমানে বর্ষা মৌসুম চলছে। ডেঙ্গু ও পানিবাহিত রোগের প্রতি সতর্ক থাকুন।";
+        warning = "ডেঙ্গু জ্বর: উচ্চ জ্বর, মাথাব্যথা, চোখে ব্যথা, শরীরে র্যাশ";
+        prevention = [
+            "বাড়ির চারপাশে জমে থাকা পানি সরিয়ে ফেলুন",
+            "মশারি ব্যবহার করুন",
+            "ফুল হাতা জামা পরুন",
+            "পানি ফুটিয়ে বা ফিল্টার করে পান করুন"
+        ];
+        whenToSeeDoctor = [
+            "জ্বর ৩ দিনের বেশি থাকলে",
+            "পেটে ব্যথা বা বমি হলে", 
+            "রক্তবমি বা মলের সাথে রক্ত গেলে",
+            "শরীরে লাল দাগ দেখা দিলে"
+        ];
+    } else if (month >= 12 || month <= 2) {
+        currentSeason = "winter";
+        seasonText = "বর্তমানে শীত মৌসুম চলছে। সর্দি-কাশি ও ফ্লুর প্রতি সতর্ক থাকুন।";
+        warning = "নিউমোনিয়া: জ্বর, কাশি, শ্বাসকষ্ট, বুকে ব্যথা";
+        prevention = [
+            "গরম কাপড় পরুন",
+            "গরম পানি ও ভাপ নিন",
+            "ভিটামিন সি যুক্ত খাবার খান",
+            "হাত ভালোভাবে ধুয়ে নিন"
+        ];
+        whenToSeeDoctor = [
+            "শ্বাসকষ্ট বা বুকে ব্যথা হলে",
+            "জ্বর ১০১°F এর থাকলে",
+            "কাশি ১ সপ্তাহের বেশি থাকলে",
+            "শিশুর শ্বাস cepat হলে"
+        ];
+    } else {
+        currentSeason = "summer";
+        seasonText = "বর্তমানে গ্রীষ্ম মৌসুম চলছে। হিট স্ট্রোক ও ডিহাইড্রেশনের প্রতি সতর্ক থাকুন।";
+        warning = "হিট স্ট্রোক: শরীর খুব গরম, মাথাব্যথা, বমি, প্রস্রাব কমে যাওয়া";
+        prevention = [
+            "দুপুরে রোদে বের হবেন না",
+            "পর্যাপ্ত পানি ও স্যালাইন খান",
+            "হালকা রঙের সুতি কাপড় পরুন",
+            "ছাতা বা ক্যাপ ব্যবহার করুন"
+        ];
+        whenToSeeDoctor = [
+            "জ্ঞান হারানো বা confusion হলে",
+            "প্রস্রাব কমে গেলে",
+            "ত্বক শুষ্ক ও লাল হয়ে গেলে",
+            "বমি বা ডায়রিয়া বেশি হলে"
+        ];
+    }
+
+    // Update DOM
+    document.getElementById('current-season-text').textContent = seasonText;
+    document.getElementById('current-warning').textContent = warning;
+
+    const preventionList = document.getElementById('current-prevention');
+    preventionList.innerHTML = prevention.map(item => `<li>${item}</li>`).join('');
+
+    const doctorList = document.getElementById('current-when-to-see-doctor');
+    doctorList.innerHTML = whenToSeeDoctor.map(item => `<li>${item}</li>`).join('');
+}
+
+// Initialize
+document.addEventListener('DOMContentLoaded', function() {
+    updateCurrentSeason();
+});
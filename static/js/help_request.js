@@ -0,0 +1,52 @@
+document.addEventListener('DOMContentLoaded', function() {
+    const helpForm = document.getElementById('helpForm');
+    const responseMessage = document.getElementById('responseMessage');
+
+    helpForm.addEventListener('submit', function(e) {
+        e.preventDefault();
+
+        if (!this.checkValidity()) {
+            this.reportValidity();
+            return;
+        }
+
+        const formData = new FormData(this);
+
+        // Show loading state
+        const submitBtn = this.querySelector('button[type="submit"]');
+        const originalText = submitBtn.textContent;
+        submitBtn.textContent = 'পাঠানো হচ্ছে...';
+        submitBtn.disabled = true;
+
+        fetch('', {
+            method: 'POST',
+            body: formData,
+            headers: {
+                'X-Requested-With': 'XMLHttpRequest'
+            }
+        })
+        .then(response => response.json())
+        .then(data => {
+            if (data.status === 'success') {
+                responseMessage.textContent = '✅ আপনার সাহায্য অনুরোধ সফলভাবে পাঠানো হয়েছে! একজন প্রশিক্ষিত স্বাস্থ্যকর্মী শীঘ্রই আপনার সাথে যোগাযোগ করবেন।';
+                responseMessage.style.background = '#c6f6d5';
+                responseMessage.style.color = '#276749';
+                responseMessage.style.display = 'block';
+                helpForm.reset();
+
+                // Scroll to message
+                responseMessage.scrollIntoView({ behavior: 'smooth' });
+            }
+        })
+        .catch(error => {
+            responseMessage.textContent = '❌ একটি সমস্যা হয়েছে। অনুগ্রহ করে আবার চেষ্টা করুন।';
+            responseMessage.style.background = '#fed7d7';
+            responseMessage.style.color = '#c53030';
+            responseMessage.style.display = 'block';
+        })
+        .finally(() => {
+            submitBtn.textContent = originalText;
+            submitBtn.disabled = false;
+        });
+    });
+});
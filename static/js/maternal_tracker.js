@@ -0,0 +1,204 @@
+// Pregnancy Calculator
+document.getElementById('pregnancyForm').addEventListener('submit', function(e) {
+    e.preventDefault();
+
+    const lastPeriodDate = new Date(this.last_period_date.value);
+    const expectedDelivery = new Date(lastPeriodDate);
+    expectedDelivery.setDate(expectedDelivery.getDate() + 280);
+
+    const today = new Date();
+    const weeksPregnant = Math.floor((today - lastPeriodDate) / (7 * 24 * 60 * 60 * 1000));
+    const daysLeft = Math.floor((expectedDelivery - today) / (24 * 60 * 60 * 1000));
+    const trimester = weeksPregnant < 13 ? 1 : weeksPregnant < 27 ? 2 : 3;
+
+    // Update display
+    document.getElementById('currentWeek').textContent = weeksPregnant;
+    document.getElementById('daysLeft').textContent = daysLeft;
+    document.getElementById('trimester').textContent = trimester;
+
+    // Generate upcoming checkups
+    const checkups = generateCheckups(lastPeriodDate);
+    displayCheckups(checkups);
+
+    document.getElementById('pregnancyProgress').style.display = 'block';
+
+    // Save to localStorage
+    const pregnancyData = {
+        lastPeriodDate: lastPeriodDate.toISOString(),
+        expectedDelivery: expectedDelivery.toISOString()
+    };
+    localStorage.setItem('pregnancyData', JSON.stringify(pregnancyData));
+});
+
+function generateCheckups(lastPeriodDate) {
+    const checkups = [
+        { name: '১ম ANC ভিজিট', weeks: 12 },
+        { name: '২য় ANC ভিজিট', weeks: 26 },
+        { name: '৩য় ANC ভিজিট', weeks: 32 },
+        { name: '৪র্থ ANC ভিজিট', weeks: 36 },
+        { name: '৫ম ANC ভিজিট', weeks: 38 },
+        { name: '৬ষ্ঠ ANC ভিজিট', weeks: 40 }
+    ];
+
+    return checkups.map(checkup => {
+        const date = new Date(lastPeriodDate);
+        date.setDate(date.getDate() + (checkup.weeks * 7));
+        return {
+            name: checkup.name,
+            date: date,
+            weeks: checkup.weeks
+        };
+    });
+}
+
+function displayCheckups(checkups) {
+    const container = document.getElementById('upcomingCheckups');
+    const today = new Date();
+
+    container.innerHTML = checkups.map(checkup => {
+        const isUpcoming = checkup.date > today;
+        const daysUntil = Math.ceil((checkup.date - today) / (24 * 60 * 60 * 1000));
+
+        if (isUpcoming) {
+            return `
+                <div class="checkup-card">
+                    <div style="display: flex; justify-content: between; align-items: center;">
+                        <div>
+                            <strong>${checkup.name}</strong>
+                            <div style="color: #718096; font-size: 0.9rem;">
+                                ${checkup.date.toLocaleDateString('bn-BD')} • ${checkup.weeks} সপ্তাহ
+                            </div>
+                        </div>
+                        <div style="background: #ed8936; color: white; padding: 0.5rem 1rem; border-radius: 20px; font-size: 0.9rem;">
+                            ${daysUntil} দিন বাকি
+                        </div>
+                    </div>
+                </div>
+            `;
+        }
+        return '';
+    }).join('');
+}
+
+// Vaccination Tracker
+document.getElementById('childForm').addEventListener('submit', function(e) {
+    e.preventDefault();
+
+    const childData = {
+        name: this.child_name.value,
+        birthDate: this.birth_date.value,
+        vaccines: generateVaccineSchedule(new Date(this.birth_date.value))
+    };
+
+    saveChildData(childData);
+    displayChildren();
+    this.reset();
+});
+
+function generateVaccineSchedule(birthDate) {
+    const vaccines = [
+        { name: 'BCG (যক্ষ্মা)', type: 'bcg', days: 0 },
+        { name: 'OPV-0 (পোলিও)', type: 'opv0', days: 0 },
+        { name: 'Penta-1 (পেন্টা)', type: 'penta1', days: 42 },
+        { name: 'OPV-1 (পোলিও)', type: 'opv1', days: 42 },
+        { name: 'Penta-2 (পেন্টা)', type: 'penta2', days: 70 },
+        { name: 'OPV-2 (পোলিও)', type: 'opv2', days: 70 },
+        { name: 'Penta-3 (পেন্টা)', type: 'penta3', days: 98 },
+        { name: 'OPV-3 (পোলিও)', type: 'opv3', days: 98 },
+        { name: 'MR-1 (হাম ও রুবেলা)', type: 'mr1', days: 270 },
+        { name: 'MR-2 (হাম ও রুবেলা)', type: 'mr2', days: 450 }
+    ];
+
+    return vaccines.map(vaccine => {
+        const date = new Date(birthDate);
+        date.setDate(date.getDate() + vaccine.days);
+        return {
+            ...vaccine,
+            scheduledDate: date,
+            completed: false
+        };
+    });
+}
+
+function saveChildData(childData) {
+    let children = JSON.parse(localStorage.getItem('children') || '[]');
+    children.push(childData);
+    localStorage.setItem('children', JSON.stringify(children));
+}
+
+function displayChildren() {
+    const container = document.getElementById('childrenList');
+    const children = JSON.parse(localStorage.getItem('children') || '[]');
+    const today = new Date();
+
+    container.innerHTML = children.map((child, index) => {
+        const pendingVaccines = child.vaccines.filter(v => !v.completed && new Date(v.scheduledDate) <= today);
+        const upcomingVaccines = child.vaccines.filter(v => !v.completed && new Date(v.scheduledDate) > today);
+
+        return `
+            <div style="background: #f7fafc; padding: 1.5rem; border-radius: 10px; margin-bottom: 1.5rem;">
+                <div style="display: flex; justify-content: between; align-items: center; margin-bottom: 1rem;">
+                    <h4 style="color: #2d3748; margin: 0;">${child.name}</h4>
+                    <div style="color: #718096;">
+                        জন্ম: ${new Date(child.birthDate).toLocaleDateString('bn-BD')}
+                    </div>
+                </div>
+
+                ${pendingVaccines.length > 0 ? `
+                    <div style="color: #e53e3e; margin-bottom: 1rem;">
+                        <strong>বকেয়া টিকা:</strong> ${pendingVaccines.length}টি
+                    </div>
+                ` : ''}
+
+                <div style="display: grid; gap: 0.5rem;">
+                    ${child.vaccines.map(vaccine => {
+                        const vaccineDate = new Date(vaccine.scheduledDate);
+                        const isOverdue = !vaccine.completed && vaccineDate < today;
+                        const isPending = !vaccine.completed && vaccineDate >= today;
+
+                        let statusClass = 'completed';
+                        let statusText = 'সম্পন্ন';
+
+                        if (isOverdue) {
+                            statusClass = 'overdue';
+                            statusText = 'বকেয়া';
+                        } else if (isPending) {
+                            statusClass = 'pending';
+                            statusText = 'অপেক্ষমান';
+                        }
+
+                        return `
+                            <div class="vaccine-card ${statusClass}">
+                                <div style="display: flex; justify-content: between; align-items: center;">
+                                    <div>
+                                        <strong>${vaccine.name}</strong>
+                                        <div style="color: #718096; font-size: 0.9rem;">
+                                            ${vaccineDate.toLocaleDateString('bn-BD')}
+                                        </div>
+                                    </div>
+                                    <div style="background: ${isOverdue ? '#e53e3e' : isPending ? '#ed8936' : '#38a169'}; 
+                                         color: white; padding: 0.25rem 0.75rem; border-radius: 15px; font-size: 0.8rem;">
+                                        ${statusText}
+                                    </div>
+                                </div>
+                            </div>
+                        `;
+                    }).join('')}
+                </div>
+            </div>
+        `;
+    }).join('');
+}
+
+// Load saved data on page load
+document.addEventListener('DOMContentLoaded', function() {
+    displayChildren();
+
+    // Load pregnancy data if exists
+    const pregnancyData = localStorage.getItem('pregnancyData');
+    if (pregnancyData) {
+        const data = JSON.parse(pregnancyData);
+        document.querySelector('input[name="last_period_date"]').value = data.lastPeriodDate.split('T')[0];
+        document.getElementById('pregnancyForm').dispatchEvent(new Event('submit'));
+    }
+});
@@ -0,0 +1,195 @@
+// Symptom data (replaced by the union's offline pack when one is available)
+let symptomsData = [
+    {
+        id: 1,
+        category: 'fever',
+        name: 'উচ্চ জ্বর',
+        description: '১০২°F (৩৯°C) এর বেশি জ্বর',
+        warningLevel: 'high',
+        homeCare: [
+            'প্যারাসিটামল ট্যাবলেট নিন',
+            'পানিশূন্যতা রোধে বেশি করে পানি পান করুন',
+            'গা মুছে দিন',
+            'হালকা সুতি কাপড় পরুন'
+        ],
+        whenToSeeDoctor: [
+            'জ্বর ৩ দিনের বেশি থাকলে',
+            'শিশুর জ্বর ১০১°F এর বেশি থাকলে',
+            'খিঁচুনি বা অজ্ঞান হলে',
+            'গলা ব্যথা বা র্যাশ সহ জ্বর হলে'
+        ],
+        emergency: 'খিঁচুনি, অজ্ঞান হওয়া, বা শ্বাসকষ্ট হলে হাসপাতালে যান'
+    },
+    {
+        id: 2,
+        category: 'respiratory',
+        name: 'শ্বাসকষ্ট',
+        description: 'শ্বাস নিতে কষ্ট হওয়া বা দম আটকে আসা feeling',
+        warningLevel: 'high',
+        homeCare: [
+            'সোজা হয়ে বসুন',
+            'গভীর শ্বাস নেওয়ার চেষ্টা করুন',
+            'বাতাস চলাচল করে এমন জায়গায় যান',
+            'আরামদায়ক পোশাক পরুন'
+        ],
+        whenToSeeDoctor: [
+            'হাঁটতে বা কথা বলতে কষ্ট হলে',
+            'নীলচে lips বা nails হলে',
+            'বুকে ব্যথা সহ শ্বাসকষ্ট',
+            'আবেশিক অবস্থা হলে'
+        ],
+        emergency: 'নীলচে ত্বক, কথা বলতে inability, বা severe বুকে ব্যথা হলে হাসপাতালে যান'
+    },
+    {
+        id: 3,
+        category: 'digestive',
+        name: 'ডায়রিয়া',
+        description: 'বারবার পাতলা পায়খানা হওয়া',
+        warningLevel: 'medium',
+        homeCare: [
+            'ওআরএস খান',
+            'হালকা খাবার (ভাত, ডাল) খান',
+            'পর্যাপ্ত বিশ্রাম নিন',
+            'পরিষ্কার-পরিচ্ছন্ন থাকুন'
+        ],
+        whenToSeeDoctor: [
+            '৩ দিনের বেশি ডায়রিয়া থাকলে',
+            'রক্ত বা পুঁজ mixed থাকলে',
+            'severe পেটে ব্যথা হলে',
+            'প্রস্রাব কমে গেলে'
+        ],
+        emergency: 'অজ্ঞান হওয়া, severe dehydration, বা রক্তবমি হলে হাসপাতালে যান'
+    },
+    {
+        id: 4,
+        category: 'mental',
+        name: 'দুশ্চিন্তা ও panic attack',
+        description: 'অকারণ ভয়, nervousness, বা panic feeling',
+        warningLevel: 'medium',
+        homeCare: [
+            'গভীর শ্বাস নিন (৪ সেকেন্ড শ্বাস, ৪ সেকেন্ড রাখুন, ৪ সেকেন্ড ছাড়ুন)',
+            'বিশ্রাম নিন',
+            'কাছে trusted মানুষের সাথে কথা বলুন',
+            'হালকা ব্যায়াম করুন'
+        ],
+        whenToSeeDoctor: [
+            'দৈনন্দিন কাজে বাধা পড়লে',
+            '২ সপ্তাহের বেশি চললে',
+            'নিজের বা others ক্ষতি করার thoughts থাকলে',
+            'sleep বা appetite হলে'
+        ],
+        emergency: 'নিজের ক্ষতি করার thoughts বা প্রচন্ড panic attack হলে সাহায্য নিন'
+    },
+    {
+        id: 5,
+        category: 'fever',
+        name: 'ডেঙ্গু জ্বর',
+        description: 'মশাবাহিত viral fever',
+        warningLevel: 'high',
+        homeCare: [
+            'পর্যাপ্ত পানি পান করুন',
+            'প্যারাসিটামল নিন (এসপিরিন এড়িয়ে চলুন)',
+            'পূর্ণ বিশ্রাম নিন',
+            'মশারি ব্যবহার করুন'
+        ],
+        whenToSeeDoctor: [
+            'জ্বরের সাথে severe মাথাব্যথা',
+            'চোখের পিছনে ব্যথা',
+            'body rash দেখা দিলে',
+            'বমি বা পেটে ব্যথা হলে'
+        ],
+        emergency: 'রক্তবমি, মলের সাথে রক্ত, বা severe abdominal pain হলে হাসপাতালে যান'
+    },
+    {
+        id: 6,
+        category: 'mental',
+        name: 'দীর্ঘস্থায়ী দুঃখবোধ',
+        description: '২ সপ্তাহের বেশি সময় ধরে depressed feeling',
+        warningLevel: 'medium',
+        homeCare: [
+            'নিয়মিত routine maintain করুন',
+            'ছোট ছোট achievable goals set করুন',
+            'বাইরে হাঁটতে যান',
+            'নিজের প্রতি gentle থাকুন'
+        ],
+        whenToSeeDoctor: [
+            '২ সপ্তাহের বেশি depressed feeling',
+            'sleep বা appetite পরিবর্তন',
+            'আনন্দদায়ক activities interest হারালে',
+            'কাজে concentration সমস্যা'
+        ],
+        emergency: 'আত্মহত্যার thoughts বা plans থাকলে মানসিক স্বাস্থ্য professional এর সাহায্য নিন'
+    }
+];
+
+function displaySymptoms(category = 'all') {
+    const container = document.getElementById('symptomsList');
+    const filteredSymptoms = category === 'all' 
+        ? symptomsData 
+        : symptomsData.filter(symptom => symptom.category === category);
+
+    container.innerHTML = filteredSymptoms.map(symptom => {
+        const warningClass = `warning-level-${symptom.warningLevel}`;
+        const badgeClass = `badge-${symptom.warningLevel}`;
+        const badgeText = symptom.warningLevel === 'high' ? 'উচ্চ সতর্কতা' : 
+                         symptom.warningLevel === 'medium' ? 'মধ্যম সতর্কতা' : 'নিম্ন সতর্কতা';
+
+        return `
+            <div class="symptom-card ${warningClass}" data-category="${symptom.category}">
+                <div style="display: flex; justify-content: between; align-items: start; margin-bottom: 1rem;">
+                    <div style="flex: 1;">
+                        <h3 style="color: #2d3748; margin-bottom: 0.5rem;">${symptom.name}</h3>
+                        <p style="color: #718096; margin: 0;">${symptom.description}</p>
+                    </div>
+                    <span class="warning-badge ${badgeClass}">${badgeText}</span>
+                </div>
+
+                <div style="display: grid; grid-template-columns: 1fr 1fr; gap: 1.5rem;">
+                    <div>
+                        <h4 style="color: #4a5568; margin-bottom: 0.5rem;">🏠 ঘরোয়া যত্ন</h4>
+                        <ul style="color: #718096; padding-left: 1rem; margin: 0;">
+                            ${symptom.homeCare.map(item => `<li>${item}</li>`).join('')}
+                        </ul>
+                    </div>
+
+                    <div>
+                        <h4 style="color: #4a5568; margin-bottom: 0.5rem;">🏥 কখন ডাক্তার দেখাবেন</h4>
+                        <ul style="color: #718096; padding-left: 1rem; margin: 0;">
+                            ${symptom.whenToSeeDoctor.map(item => `<li>${item}</li>`).join('')}
+                        </ul>
+                    </div>
+                </div>
+
+                ${symptom.emergency ? `
+                    <div style="background: #fed7d7; padding: 1rem; border-radius: 8px; margin-top: 1rem;">
+                        <strong style="color: #c53030;">🚨 জরুরী:</strong> 
+                        <span style="color: #c53030;">${symptom.emergency}</span>
+                    </div>
+                ` : ''}
+            </div>
+        `;
+    }).join('');
+}
+
+function filterSymptoms(category) {
+    // Update active button
+    document.querySelectorAll('.symptom-cat-btn').forEach(btn => {
+        btn.classList.remove('active');
+    });
+    document.querySelector(`[data-category="${category}"]`).classList.add('active');
+
+    // Display filtered symptoms
+    displaySymptoms(category);
+}
+
+// Initialize
+document.addEventListener('DOMContentLoaded', function() {
+    displaySymptoms('all');
+    MonBondhuOffline.load().then(pack => {
+        if (pack && pack.symptoms.length) {
+            symptomsData = pack.symptoms;
+            const active = document.querySelector('.symptom-cat-btn.active');
+            displaySymptoms(active ? active.dataset.category : 'all');
+        }
+    });
+});
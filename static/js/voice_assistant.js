@@ -0,0 +1,495 @@
+class VoiceAssistant {
+    constructor() {
+        this.isListening = false;
+        this.recognition = null;
+        this.synthesis = window.speechSynthesis;
+        this.ttsEnabled = true;
+        this.awaitingMoodResponse = false;
+        this.supported = false;
+        this.location = null;
+        this.requestLocation();
+        this.initializeVoiceRecognition();
+        this.setupEventListeners();
+        this.checkBrowserSupport();
+    }
+
+    checkBrowserSupport() {
+        const SpeechRecognition = window.SpeechRecognition || window.webkitSpeechRecognition;
+        this.supported = !!SpeechRecognition;
+
+        if (!this.supported) {
+            this.showError('দুঃখিত, আপনার ব্রাউজার ভয়েস রিকগনিশন সাপোর্ট করে না। Chrome ব্রাউজার ব্যবহার করুন।');
+            document.getElementById('micButton').disabled = true;
+        }
+    }
+
+    requestLocation() {
+        // Used to rank hospitals by distance; commands still work without it
+        if (!navigator.geolocation) return;
+        navigator.geolocation.getCurrentPosition(
+            (position) => {
+                this.location = { lat: position.coords.latitude, lon: position.coords.longitude };
+            },
+            () => { this.location = null; },
+            { maximumAge: 10 * 60 * 1000, timeout: 10000 }
+        );
+    }
+
+    initializeVoiceRecognition() {
+        if (!this.supported) return;
+
+        const SpeechRecognition = window.SpeechRecognition || window.webkitSpeechRecognition;
+        this.recognition = new SpeechRecognition();
+
+        // Configure recognition
+        this.recognition.continuous = false;
+        this.recognition.interimResults = false;
+        this.recognition.lang = 'bn-BD';
+        this.recognition.maxAlternatives = 1;
+
+        // Event handlers
+        this.recognition.onstart = () => {
+            console.log('Voice recognition started');
+            this.isListening = true;
+            this.updateUI();
+            this.startVisualization();
+            this.hideError();
+        };
+
+        this.recognition.onend = () => {
+            console.log('Voice recognition ended');
+            this.isListening = false;
+            this.updateUI();
+            this.stopVisualization();
+        };
+
+        this.recognition.onresult = (event) => {
+            console.log('Voice recognition result received');
+            const command = event.results[0][0].transcript;
+            console.log('Recognized command:', command);
+
+            if (this.awaitingMoodResponse) {
+                this.processMoodResponse(command);
+            } else {
+                this.processCommand(command);
+            }
+        };
+
+        this.recognition.onerror = (event) => {
+            console.error('Speech recognition error:', event.error);
+
+            let errorMessage = 'দুঃখিত, আপনার কথা শুনতে পাইনি। আবার চেষ্টা করুন।';
+
+            switch(event.error) {
+                case 'not-allowed':
+                case 'permission-denied':
+                    errorMessage = 'মাইক্রোফোন এক্সেস দেওয়া হয়নি। ব্রাউজার সেটিংস চেক করুন।';
+                    this.showPermissionHelp();
+                    break;
+                case 'network':
+                    errorMessage = 'নেটওয়ার্ক সমস্যা। ইন্টারনেট কানেকশন চেক করুন।';
+                    break;
+                case 'audio-capture':
+                    errorMessage = 'মাইক্রোফোন পাওয়া যায়নি। মাইক্রোফোন চেক করুন।';
+                    break;
+                case 'no-speech':
+                    errorMessage = 'কোনো কথা শোনা যায়নি। আবার চেষ্টা করুন।';
+                    break;
+            }
+
+            this.displayResponse(errorMessage, 'error');
+            this.isListening = false;
+            this.awaitingMoodResponse = false;
+            this.updateUI();
+            this.stopVisualization();
+        };
+
+        this.recognition.onnomatch = () => {
+            console.log('No speech recognized');
+            this.displayResponse('কোনো কথা শোনা যায়নি। দয়া করে আবার চেষ্টা করুন।', 'error');
+        };
+    }
+
+    setupEventListeners() {
+        const micButton = document.getElementById('micButton');
+        const suggestionChips = document.querySelectorAll('.chip');
+        const ttsToggle = document.getElementById('ttsToggle');
+        const clearBtn = document.getElementById('clearBtn');
+
+        micButton.addEventListener('click', () => {
+            this.toggleListening();
+        });
+
+        suggestionChips.forEach(chip => {
+            chip.addEventListener('click', (e) => {
+                const command = e.target.getAttribute('data-command');
+                this.processCommand(command);
+            });
+        });
+
+        if (ttsToggle) {
+            ttsToggle.addEventListener('click', () => {
+                this.ttsEnabled = !this.ttsEnabled;
+                ttsToggle.setAttribute('aria-pressed', this.ttsEnabled ? 'true' : 'false');
+                const icon = this.ttsEnabled ? '🔈' : '🔇';
+                const label = this.ttsEnabled ? 'ভয়েস চালু' : 'ভয়েস বন্ধ';
+                ttsToggle.innerHTML = `<span>${icon}</span> <span>${label}</span>`;
+            });
+        }
+
+        if (clearBtn) {
+            clearBtn.addEventListener('click', () => {
+                const convo = document.getElementById('conversation');
+                if (convo) convo.innerHTML = '';
+            });
+        }
+
+        // Add keyboard shortcut (Spacebar)
+        document.addEventListener('keydown', (e) => {
+            if (e.code === 'Space' && !e.target.matches('input, textarea')) {
+                e.preventDefault();
+                this.toggleListening();
+            }
+        });
+
+        // Handle page visibility changes
+        document.addEventListener('visibilitychange', () => {
+            if (document.hidden && this.isListening) {
+                this.recognition.stop();
+            }
+        });
+    }
+
+    async toggleListening() {
+        if (!this.supported) {
+            this.showError('ভয়েস রিকগনিশন সাপোর্ট করে না। Chrome ব্রাউজার ব্যবহার করুন।');
+            return;
+        }
+
+        if (this.isListening) {
+            this.recognition.stop();
+        } else {
+            try {
+                // Request microphone permission first
+                await this.requestMicrophonePermission();
+                this.recognition.start();
+            } catch (error) {
+                console.error('Failed to start recognition:', error);
+                this.showError('মাইক্রোফোন এক্সেস দেওয়া হয়নি। ব্রাউজার পারমিশন চেক করুন।');
+            }
+        }
+    }
+
+    async requestMicrophonePermission() {
+        try {
+            const stream = await navigator.mediaDevices.getUserMedia({ audio: true });
+            // Stop the stream immediately since we just needed permission
+            stream.getTracks().forEach(track => track.stop());
+            this.hidePermissionHelp();
+            return true;
+        } catch (error) {
+            console.error('Microphone permission denied:', error);
+            this.showPermissionHelp();
+            throw error;
+        }
+    }
+
+    async processCommand(command) {
+        this.displayCommand(command);
+
+        try {
+            const response = await fetch('/process-command/', {
+                method: 'POST',
+                headers: {
+                    'Content-Type': 'application/json',
+                    'X-CSRFToken': this.getCSRFToken()
+                },
+                body: JSON.stringify({ command: command, stream: true, ...(this.location || {}) })
+            });
+
+            if (!response.ok) {
+                throw new Error(`HTTP error! status: ${response.status}`);
+            }
+
+            // AI replies stream in sentence by sentence: show and speak each one as it arrives
+            let bubble = null;
+            const data = await this.readStream(response, event => {
+                if (!event.delta) return;
+                if (!bubble) {
+                    this.displayResponse('', 'ai_response');
+                    bubble = document.getElementById('conversation')?.lastElementChild;
+                }
+                if (bubble) bubble.textContent += event.delta;
+                this.speakResponse(event.delta, event.language, true);
+            });
+
+            if (data.error) {
+                throw new Error(data.error);
+            }
+
+            if (bubble) {
+                bubble.textContent = data.message;
+            } else {
+                this.displayResponse(data.message, data.type);
+                this.speakResponse(data.speech, data.language);
+            }
+
+            if (data.awaiting_mood) {
+                this.awaitingMoodResponse = true;
+                this.displayResponse('আমি শুনছি... আপনার অনুভূতি বলুন।', 'mood_prompt');
+            }
+
+        } catch (error) {
+            console.error('Error processing command:', error);
+            this.displayResponse('দুঃখিত, সার্ভারে সমস্যা হয়েছে। আবার চেষ্টা করুন।', 'error');
+        }
+    }
+
+    async processMoodResponse(moodText) {
+        try {
+            const response = await fetch('/process-mood/', {
+                method: 'POST',
+                headers: {
+                    'Content-Type': 'application/json',
+                    'X-CSRFToken': this.getCSRFToken()
+                },
+                body: JSON.stringify({ 
+                    mood_text: moodText,
+                    language: 'bn'
+                })
+            });
+
+            if (!response.ok) {
+                throw new Error(`HTTP error! status: ${response.status}`);
+            }
+
+            const data = await response.json();
+
+            if (data.error) {
+                throw new Error(data.error);
+            }
+
+            this.displayResponse(data.message, 'mood_response');
+            this.speakResponse(data.speech, data.language);
+
+        } catch (error) {
+            console.error('Error processing mood response:', error);
+            this.displayResponse('দুঃখিত, আপনার অনুভূতি বুঝতে পারিনি।', 'error');
+        } finally {
+            this.awaitingMoodResponse = false;
+        }
+    }
+
+    displayCommand(command) {
+        const convo = document.getElementById('conversation');
+        if (!convo) return;
+        const bubble = document.createElement('div');
+        bubble.className = 'bubble user';
+        bubble.textContent = command;
+        convo.appendChild(bubble);
+        convo.scrollTop = convo.scrollHeight;
+    }
+
+    displayResponse(message, type) {
+        const convo = document.getElementById('conversation');
+        if (!convo) return;
+        const bubble = document.createElement('div');
+        bubble.className = 'bubble assistant';
+        if (type === 'error') bubble.classList.add('error');
+        if (type === 'mood_prompt' || type === 'mood_response') bubble.classList.add('system');
+        if (type === 'emergency') bubble.classList.add('error');
+        bubble.textContent = message;
+        convo.appendChild(bubble);
+        convo.scrollTop = convo.scrollHeight;
+    }
+
+    // Reads an NDJSON reply line by line, calling onEvent for each; resolves with the final {done: true} event
+    async readStream(response, onEvent) {
+        if (!(response.headers.get('Content-Type') || '').startsWith('application/x-ndjson')) {
+            return response.json();
+        }
+        const reader = response.body.getReader();
+        const decoder = new TextDecoder();
+        let buffered = '';
+        let last = {};
+        while (true) {
+            const { value, done } = await reader.read();
+            buffered += decoder.decode(value || new Uint8Array(), { stream: !done });
+            const lines = buffered.split('\n');
+            buffered = lines.pop();
+            for (const line of lines) {
+                if (!line.trim()) continue;
+                last = JSON.parse(line);
+                onEvent(last);
+            }
+            if (done) return last;
+        }
+    }
+
+    speakResponse(text, language, queue = false) {
+        if (!this.ttsEnabled) return;
+        if (!this.synthesis) {
+            console.warn('Speech synthesis not supported');
+            return;
+        }
+
+        // Cancel any ongoing speech, unless this continues a streamed reply
+        if (!queue) this.synthesis.cancel();
+
+        const utterance = new SpeechSynthesisUtterance(text);
+
+        // Configure utterance
+        if (language === 'bn' || language === 'mixed') {
+            utterance.lang = 'bn-BD';
+            utterance.rate = 0.8; // Slower for Bengali
+        } else {
+            utterance.lang = 'en-US';
+            utterance.rate = 0.9;
+        }
+
+        utterance.pitch = 1;
+        utterance.volume = 1;
+
+        // Try to find appropriate voice
+        const voices = this.synthesis.getVoices();
+        const preferredVoice = voices.find(voice => 
+            voice.lang.includes('bn') || voice.lang.includes('BD') || voice.lang.includes('IN')
+        );
+
+        if (preferredVoice) {
+            utterance.voice = preferredVoice;
+        }
+
+        utterance.onend = () => {
+            console.log('Speech synthesis completed');
+        };
+
+        utterance.onerror = (event) => {
+            console.error('Speech synthesis error:', event);
+        };
+
+        this.synthesis.speak(utterance);
+    }
+
+    updateUI() {
+        const micButton = document.getElementById('micButton');
+        const micText = micButton.querySelector('.mic-text');
+        const statusElement = document.getElementById('statusText');
+
+        if (this.isListening) {
+            micButton.classList.add('listening');
+            micText.textContent = 'শুনছি...';
+            statusElement.textContent = 'কথা বলুন... আমি শুনছি';
+            statusElement.style.color = '#e53e3e';
+            statusElement.style.fontWeight = 'bold';
+
+            // Add listening animation
+            if (!micButton.querySelector('.listening-animation')) {
+                const animation = document.createElement('div');
+                animation.className = 'listening-animation';
+                micButton.appendChild(animation);
+            }
+        } else {
+            micButton.classList.remove('listening');
+            micText.textContent = 'কথা বলুন';
+
+            // Remove listening animation
+            const animation = micButton.querySelector('.listening-animation');
+            if (animation) {
+                animation.remove();
+            }
+
+            if (this.awaitingMoodResponse) {
+                statusElement.textContent = 'আপনার অনুভূতি শুনছি... বলুন আপনি কেমন আছেন';
+                statusElement.style.color = '#805ad5';
+            } else {
+                statusElement.textContent = 'মাইক্রোফোন বাটন চাপুন বা স্পেসবার প্রেস করুন';
+                statusElement.style.color = '#4a5568';
+            }
+            statusElement.style.fontWeight = 'normal';
+        }
+    }
+
+    startVisualization() {
+        const bars = document.querySelectorAll('.visualizer .bar');
+        bars.forEach((bar, index) => {
+            bar.style.animation = `equalize ${0.5 + index * 0.1}s infinite ease-in-out`;
+            bar.style.animationDelay = `${index * 0.1}s`;
+        });
+    }
+
+    stopVisualization() {
+        const bars = document.querySelectorAll('.visualizer .bar');
+        bars.forEach(bar => {
+            bar.style.animation = 'none';
+            bar.style.height = '20px';
+        });
+    }
+
+    showError(message) {
+        const errorElement = document.getElementById('errorMessage');
+        errorElement.textContent = message;
+        errorElement.style.display = 'block';
+        errorElement.classList.add('fade-in');
+    }
+
+    hideError() {
+        const errorElement = document.getElementById('errorMessage');
+        errorElement.style.display = 'none';
+    }
+
+    showPermissionHelp() {
+        const helpElement = document.getElementById('permissionHelp');
+        helpElement.style.display = 'block';
+    }
+
+    hidePermissionHelp() {
+        const helpElement = document.getElementById('permissionHelp');
+        helpElement.style.display = 'none';
+    }
+
+    getCSRFToken() {
+        const name = 'csrftoken';
+        let cookieValue = null;
+        if (document.cookie && document.cookie !== '') {
+            const cookies = document.cookie.split(';');
+            for (let i = 0; i < cookies.length; i++) {
+                const cookie = cookies[i].trim();
+                if (cookie.substring(0, name.length + 1) === (name + '=')) {
+                    cookieValue = decodeURIComponent(cookie.substring(name.length + 1));
+                    break;
+                }
+            }
+        }
+        return cookieValue;
+    }
+}
+
+// Initialize when page loads
+document.addEventListener('DOMContentLoaded', () => {
+    // Load voices for speech synthesis
+    if (window.speechSynthesis) {
+        // Chrome loads voices asynchronously
+        speechSynthesis.onvoiceschanged = () => {
+            console.log('Voices loaded:', speechSynthesis.getVoices().length);
+        };
+
+        // Try to get voices immediately
+        setTimeout(() => {
+            const voices = speechSynthesis.getVoices();
+            console.log('Available voices:', voices);
+        }, 1000);
+    }
+
+    // Initialize voice assistant
+    window.voiceAssistant = new VoiceAssistant();
+
+    console.log('Voice Assistant initialized. Supported:', window.voiceAssistant.supported);
+});
+
+// Handle page unload
+window.addEventListener('beforeunload', () => {
+    if (window.voiceAssistant && window.voiceAssistant.isListening) {
+        window.voiceAssistant.recognition.stop();
+    }
+});
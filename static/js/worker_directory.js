@@ -0,0 +1,236 @@
+// Sample workers data
+let workersData = [
+    {
+        id: 1,
+        name: "মোঃ করিম উদ্দিন",
+        phone: "০১৭১১-২২৩৩৪৪",
+        whatsapp_available: true,
+        village: "চর কলাপাড়া",
+        union: "চর কলাপাড়া",
+        upazila: "চরফ্যাশন",
+        skills: ["mental_health", "first_aid", "chronic_disease"],
+        training_organization: "ব্র্যাক স্বাস্থ্য কর্মসূচী",
+        available_hours: "সকাল ৮টা - সন্ধ্যা ৬টা",
+        is_verified: true,
+        languages: "বাংলা"
+    },
+    {
+        id: 2,
+        name: "আয়েশা বেগম",
+        phone: "০১৮১২-৩৪৫৬৭৮",
+        whatsapp_available: false,
+        village: "নছরতপুর",
+        union: "নছরতপুর",
+        upazila: "চরফ্যাশন",
+        skills: ["maternal_health", "child_health", "vaccination"],
+        training_organization: "স্বাস্থ্য বিভাগ",
+        available_hours: "সকাল ৯টা - বিকেল ৪টা",
+        is_verified: true,
+        languages: "বাংলা"
+    },
+    {
+        id: 3,
+        name: "রফিকুল ইসলাম",
+        phone: "০১৯১৫-৫৫৬৬৭৭",
+        whatsapp_available: true,
+        village: "চরফ্যাশন সদর",
+        union: "চরফ্যাশন সদর",
+        upazila: "চরফ্যাশন",
+        skills: ["first_aid", "health_education"],
+        training_organization: "স্থানীয় যুব সংঘ",
+        available_hours: "বিকেল ৪টা - রাত ৮টা",
+        is_verified: false,
+        languages: "বাংলা"
+    }
+];
+
+function displayWorkers(workers = workersData) {
+    const container = document.getElementById('workersList');
+    const noWorkers = document.getElementById('noWorkers');
+
+    if (workers.length === 0) {
+        container.style.display = 'none';
+        noWorkers.style.display = 'block';
+        return;
+    }
+
+    container.style.display = 'block';
+    noWorkers.style.display = 'none';
+
+    const now = new Date();
+    const currentHour = now.getHours();
+
+    container.innerHTML = workers.map(worker => {
+        const isVerified = worker.is_verified;
+        const isAvailable = checkAvailability(worker.available_hours, currentHour);
+        const cardClass = isVerified ? 'worker-card verified' : 'worker-card';
+
+        const skillNames = {
+            'mental_health': 'মানসিক স্বাস্থ্য',
+            'first_aid': 'প্রাথমিক চিকিৎসা',
+            'maternal_health': 'মাতৃস্বাস্থ্য',
+            'child_health': 'শিশু স্বাস্থ্য',
+            'chronic_disease': 'দীর্ঘমেয়াদী রোগ',
+            'vaccination': 'টিকাদান',
+            'health_education': 'স্বাস্থ্য শিক্ষা'
+        };
+
+        return `
+            <div class="${cardClass}">
+                <div style="display: flex; justify-content: between; align-items: start; margin-bottom: 1rem;">
+                    <div style="flex: 1;">
+                        <div style="display: flex; align-items: center; margin-bottom: 0.5rem;">
+                            <h3 style="color: #2d3748; margin: 0;">${worker.name}</h3>
+                            ${isVerified ? '<span class="verified-badge">✅ যাচাইকৃত</span>' : ''}
+                            ${isAvailable ? '<span class="available-badge">এখনই উপলব্ধ</span>' : ''}
+                        </div>
+                        <div style="color: #718096; margin-bottom: 1rem;">
+                            <div>📞 ${worker.phone} ${worker.whatsapp_available ? '• 📱 হোয়াটসঅ্যাপ' : ''}</div>
+                            <div>📍 ${worker.village}, ${worker.union}, ${worker.upazila}</div>
+                            <div>🕒 ${worker.available_hours}</div>
+                            <div>🏫 ${worker.training_organization} দ্বারা প্রশিক্ষিত</div>
+                        </div>
+                    </div>
+                </div>
+
+                <div style="margin-bottom: 1rem;">
+                    <strong style="color: #4a5568; display: block; margin-bottom: 0.5rem;">দক্ষতা:</strong>
+                    <div>
+                        ${worker.skills.map(skill => `
+                            <span class="skill-badge skill-${skill}">${skillNames[skill]}</span>
+                        `).join('')}
+                    </div>
+                </div>
+
+                <div style="display: flex; gap: 1rem;">
+                    <a href="tel:${worker.phone}" class="btn" style="background: #38a169; color: white; text-decoration: none;">
+                        📞 কল করুন
+                    </a>
+                    ${worker.whatsapp_available ? `
+                        <a href="https://wa.me/${worker.phone.replace(/\D/g, '')}" 
+                           target="_blank" class="btn" style="background: #25D366; color: white; text-decoration: none;">
+                            💬 হোয়াটসঅ্যাপ
+                        </a>
+                    ` : ''}
+                    <button class="btn" style="background: #667eea; color: white;" 
+                            onclick="saveContact('${worker.name}', '${worker.phone}')">
+                        📱 সেভ করুন
+                    </button>
+                </div>
+            </div>
+        `;
+    }).join('');
+}
+
+function checkAvailability(hoursString, currentHour) {
+    // Simple availability check based on common time patterns
+    if (hoursString.includes('সকাল') && hoursString.includes('সন্ধ্যা')) {
+        return currentHour >= 8 && currentHour <= 18;
+    }
+    if (hoursString.includes('বিকেল') && hoursString.includes('রাত')) {
+        return currentHour >= 16 && currentHour <= 20;
+    }
+    return true; // Default to available if we can't parse
+}
+
+function filterWorkers(filterType) {
+    // Update active button
+    document.querySelectorAll('.filter-btn').forEach(btn => {
+        btn.classList.remove('active');
+    });
+    event.target.classList.add('active');
+
+    let filteredWorkers = workersData;
+
+    switch (filterType) {
+        case 'verified':
+            filteredWorkers = workersData.filter(worker => worker.is_verified);
+            break;
+        case 'available':
+            const now = new Date();
+            const currentHour = now.getHours();
+            filteredWorkers = workersData.filter(worker => 
+                checkAvailability(worker.available_hours, currentHour)
+            );
+            break;
+        case 'whatsapp':
+            filteredWorkers = workersData.filter(worker => worker.whatsapp_available);
+            break;
+    }
+
+    // Apply search filter
+    const searchTerm = document.getElementById('searchWorkers').value.toLowerCase();
+    if (searchTerm) {
+        filteredWorkers = filteredWorkers.filter(worker => 
+            worker.name.toLowerCase().includes(searchTerm) ||
+            worker.village.toLowerCase().includes(searchTerm) ||
+            worker.union.toLowerCase().includes(searchTerm) ||
+            worker.skills.some(skill => skill.toLowerCase().includes(searchTerm))
+        );
+    }
+
+    // Apply skill filter
+    const skillFilter = document.getElementById('skillFilter').value;
+    if (skillFilter !== 'all') {
+        filteredWorkers = filteredWorkers.filter(worker => 
+            worker.skills.includes(skillFilter)
+        );
+    }
+
+    // Apply area filter
+    const areaFilter = document.getElementById('areaFilter').value;
+    if (areaFilter !== 'all') {
+        filteredWorkers = filteredWorkers.filter(worker => 
+            worker.village === areaFilter || worker.union === areaFilter
+        );
+    }
+
+    displayWorkers(filteredWorkers);
+}
+
+function saveContact(name, phone) {
+    // In a real app, this would save to device contacts
+    alert(`কন্টাক্ট সেভ করা হয়েছে:\n${name}\n${phone}`);
+}
+
+// Add worker form handler
+document.getElementById('addWorkerForm').addEventListener('submit', function(e) {
+    e.preventDefault();
+
+    const formData = new FormData(this);
+    const skills = [];
+    this.querySelectorAll('input[name="skills"]:checked').forEach(checkbox => {
+        skills.push(checkbox.value);
+    });
+
+    const newWorker = {
+        id: workersData.length + 1,
+        name: formData.get('name'),
+        phone: formData.get('phone'),
+        whatsapp_available: formData.get('whatsapp_available') === 'on',
+        village: formData.get('village'),
+        union: formData.get('union'),
+        upazila: formData.get('upazila'),
+        skills: skills,
+        training_organization: formData.get('training_organization'),
+        available_hours: formData.get('available_hours'),
+        is_verified: formData.get('is_verified') === 'on',
+        languages: 'বাংলা'
+    };
+
+    workersData.push(newWorker);
+    displayWorkers(workersData);
+    this.reset();
+
+    alert('স্বাস্থ্যকর্মী সফলভাবে যোগ করা হয়েছে!');
+});
+
+// Search and filter event listeners
+document.getElementById('searchWorkers').addEventListener('input', filterWorkers);
+document.getElementById('skillFilter').addEventListener('change', filterWorkers);
+document.getElementById('areaFilter').addEventListener('change', filterWorkers);
+
+// Initialize
+document.addEventListener('DOMContentLoaded', function() {
+    displayWorkers();
+});